@@ -0,0 +1 @@
+"""Benchmarks for the simple_phys package. Run from the manim/ folder: python -m benchmarks.<name>"""
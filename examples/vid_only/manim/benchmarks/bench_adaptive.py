@@ -0,0 +1,62 @@
+"""Adaptive steps against PhysWorld's fixed dt = 1/240 semi-implicit Euler.
+
+Two problems: a 1 Hz spring over 10 s, where the right dt never changes, and
+three periods of an eccentric (e = 0.9) orbit, which whips through periapsis
+a hundred times faster than it crawls round apoapsis. The error is the final
+position's distance from the exact answer.
+
+"vs 1/240" is the share of acceleration evaluations saved against the fixed
+1/240 step, whatever its error. "same error" is the share saved against the
+coarsest fixed semi-implicit Euler step (dt = 1/240, 1/480, ...) that is at
+least as accurate, or "-" when none of them is.
+
+    python -m benchmarks.bench_adaptive
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from simple_phys.adaptive import METHODS, integrate_adaptive
+from simple_phys.integrators import central_gravity, integrate, spring
+
+FIXED_DT = 1 / 240
+HALVINGS = 8
+
+
+def problems() -> dict[str, tuple]:
+    omega = 2 * np.pi
+    gm, e = 4 * np.pi**2, 0.9  # a 1 AU, 1 year orbit
+    periapsis = 1 - e
+    x0 = np.array([[periapsis, 0.0]])
+    v0 = np.array([[0.0, np.sqrt(gm * (1 + e) / periapsis)]])
+    return {
+        "spring": (spring(omega), np.array([[1.0]]), np.array([[0.0]]), 10.0, np.array([np.cos(omega * 10.0)])),
+        "orbit e=0.9": (central_gravity(gm), x0, v0, 3.0, x0[0]),
+    }
+
+
+def main() -> None:
+    print(f"{'problem':>12}  {'method':>20}  {'rtol':>6}  {'steps':>6}  {'rejected':>8}  {'evals':>7}  {'error':>8}  {'vs 1/240':>8}  {'same error':>10}")
+    for name, (accel, x0, v0, total_time, exact) in problems().items():
+        # The fixed-step baseline at 1/240 and every halving of it, in one batch
+        dts = FIXED_DT / 2.0 ** np.arange(HALVINGS + 1)
+        fixed = integrate("semi_implicit_euler", accel, np.repeat(x0, len(dts), 0), np.repeat(v0, len(dts), 0), dts, total_time=total_time)
+        fixed_error = np.linalg.norm(fixed.x[-1] - exact, axis=-1)
+        fixed_evals = np.ceil(total_time / dts - 1e-9)
+        print(f"{name:>12}  {'fixed 1/240':>20}  {'':>6}  {fixed_evals[0]:6.0f}  {0:8}  {fixed_evals[0]:7.0f}  {fixed_error[0]:8.1e}")
+
+        for method in METHODS:
+            for rtol in [1e-3, 1e-6]:
+                result = integrate_adaptive(method, accel, x0, v0, total_time, rtol=rtol, atol=rtol * 1e-3)
+                error = float(np.linalg.norm(result.x[-1, 0] - exact))
+                good_enough = np.flatnonzero(fixed_error <= error)
+                same = f"{1 - result.evaluations[0] / fixed_evals[good_enough[0]]:10.0%}" if len(good_enough) else f"{'-':>10}"
+                print(
+                    f"{name:>12}  {method:>20}  {rtol:6.0e}  {result.accepted[0]:6}  {result.rejected[0]:8}"
+                    f"  {result.evaluations[0]:7}  {error:8.1e}  {result.saved_against(FIXED_DT)[0]:8.0%}  {same}"
+                )
+
+
+if __name__ == "__main__":
+    main()
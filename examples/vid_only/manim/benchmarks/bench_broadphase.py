@@ -0,0 +1,84 @@
+"""Broadphase scaling from 100 to 20k bodies.
+
+Boxes and circles scattered at constant density over static ground, timed on a
+first call and on a call after every body moved a little (like one substep).
+All-pairs is CollisionHelper.handleCollisions' loop, only run up to 5k bodies.
+
+Sweep-and-prune is superlinear in a dense 2D scene like this: sweeping one
+axis leaves every body overlapping the whole band of bodies at the same x, so
+the candidates it has to reject grow faster than the body count. The uniform
+grid is the near-linear option at scale.
+
+    python -m benchmarks.bench_broadphase
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from simple_phys.bodies import body_aabbs
+from simple_phys.broadphase import SweepAndPrune, UniformGrid
+from simple_phys.collision import all_pairs, should_collide
+from simple_phys.world import PhysWorld
+
+
+def scattered_world(count: int, rng: np.random.Generator) -> PhysWorld:
+    half = np.sqrt(count) * 1.5  # about 9 area units per body
+    world = PhysWorld()
+    world.add_box(0, -half - 0.5, 2 * half + 2, 1, is_static=True)
+    for i in range(count):
+        x, y = rng.uniform(-half, half, 2)
+        if i % 3:
+            world.add_box(x, y, *rng.uniform(0.3, 1.5, 2))
+        else:
+            world.add_circle(x, y, rng.uniform(0.2, 0.8))
+    world.bodies.angle = rng.uniform(0, 2 * np.pi, count + 1)
+    world.bodies.angle[0] = 0.0  # the ground stays level
+    return world
+
+
+def brute_force(bodies, aabb_min, aabb_max):
+    a, b = all_pairs(aabb_min, aabb_max)
+    keep = should_collide(bodies, a, b)
+    return a[keep], b[keep]
+
+
+def timed(fn, *args) -> tuple[float, tuple[np.ndarray, np.ndarray]]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'bodies':>8}  {'pairs':>8}  {'all-pairs ms':>12}  {'SAP first':>9}  {'SAP step':>9}  {'grid ms':>8}  {'same':>5}")
+    for count in [100, 500, 1_000, 2_000, 5_000, 10_000, 20_000]:
+        world = scattered_world(count, rng)
+        bodies = world.bodies
+        sap, grid = SweepAndPrune(), UniformGrid()
+
+        aabb_min, aabb_max = body_aabbs(bodies, world.shapes, world.vertices)
+        sap_first_ms, sap_pairs = timed(sap.pairs, bodies, aabb_min, aabb_max)
+
+        bodies.position[1:] += rng.normal(0, 0.01, (count, 2))
+        aabb_min, aabb_max = body_aabbs(bodies, world.shapes, world.vertices)
+        sap_ms, sap_pairs = timed(sap.pairs, bodies, aabb_min, aabb_max)
+        grid_ms, grid_pairs = timed(grid.pairs, bodies, aabb_min, aabb_max)
+        same = all(np.array_equal(x, y) for x, y in zip(sap_pairs, grid_pairs))
+
+        brute_text = f"{'-':>12}"
+        if count <= 5_000:
+            brute_ms, brute_pairs = timed(brute_force, bodies, aabb_min, aabb_max)
+            same = same and all(np.array_equal(x, y) for x, y in zip(sap_pairs, brute_pairs))
+            brute_text = f"{brute_ms:12.1f}"
+
+        print(
+            f"{count:>8,}  {len(sap_pairs[0]):>8,}  {brute_text}  {sap_first_ms:9.1f}  "
+            f"{sap_ms:9.1f}  {grid_ms:8.1f}  {str(same):>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
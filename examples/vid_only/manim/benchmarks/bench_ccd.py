@@ -0,0 +1,72 @@
+"""Bullets against thin walls: coarse steps with CCD against the 1/240 baseline.
+
+A volley of small balls and boxes is fired at 20-80 m/s (random spin and
+aim) at a 5 cm wall, over a 5 cm floor, for one simulated second. Projectiles
+don't collide with each other, so every one of them is its own test.
+"tunnelled" counts those that end up behind the wall or under the floor, and
+"deepest" is the largest contact penetration seen on any step.
+
+    python -m benchmarks.bench_ccd
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from simple_phys.world import PhysWorld
+
+COUNT = 60
+SECONDS = 1.0
+WALL_X, FLOOR_Y, THICKNESS = 6.0, -2.0, 0.05
+PROJECTILE = 0b10  # collision bit shared by the projectiles, which ignore each other
+
+
+def volley(bullets: bool, seed: int = 0) -> tuple[PhysWorld, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    world = PhysWorld()
+    world.add_box(WALL_X, 1.0, THICKNESS, 6.0, is_static=True)
+    world.add_box(WALL_X - 12.0, FLOOR_Y, 24.0, THICKNESS, is_static=True)
+    rows = []
+    for k in range(COUNT):
+        y = FLOOR_Y + 0.5 + 3.0 * rng.random()
+        size = rng.uniform(0.05, 0.15)
+        body = world.add_circle(0.0, y, size) if k % 2 else world.add_box(0.0, y, 2 * size, size)
+        speed, aim = rng.uniform(20.0, 80.0), rng.uniform(-0.3, 0.1)
+        world.bodies.velocity[body] = speed * np.cos(aim), speed * np.sin(aim)
+        world.bodies.angular_velocity[body] = rng.uniform(-10.0, 10.0)
+        rows.append(body)
+    rows = np.array(rows)
+    world.bodies.collision_mask[rows] = PROJECTILE
+    world.bodies.collision_mask_ignore[rows] = PROJECTILE
+    world.bodies.is_bullet[rows] = bullets
+    return world, rows
+
+
+def run(dt: float, bullets: bool) -> tuple[float, int, float]:
+    world, rows = volley(bullets)
+    steps = round(SECONDS / dt)
+    deepest = 0.0
+    elapsed = 0.0
+    for _ in range(steps):
+        start = time.perf_counter()
+        world.step(dt, dt)
+        elapsed += time.perf_counter() - start
+        if len(world.contacts):
+            deepest = max(deepest, float(world.contacts.penetration.max()))
+    position = world.bodies.position[rows]
+    tunnelled = int(((position[:, 0] > WALL_X) | (position[:, 1] < FLOOR_Y)).sum())
+    return steps / elapsed, tunnelled, deepest
+
+
+def main() -> None:
+    print(f"{COUNT} projectiles at 20-80 m/s, {SECONDS:.0f} s\n")
+    print(f"{'dt':>7}  {'CCD':>5}  {'steps/s':>8}  {'sim s/s':>7}  {'tunnelled':>9}  {'deepest mm':>10}")
+    for hz, bullets in [(240, False), (60, False), (60, True), (120, False), (120, True), (240, True)]:
+        rate, tunnelled, deepest = run(1 / hz, bullets)
+        print(f"{'1/' + str(hz):>7}  {str(bullets):>5}  {rate:8.0f}  {rate / hz:7.2f}  {tunnelled:>9}  {deepest * 1000:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
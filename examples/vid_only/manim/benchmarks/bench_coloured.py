@@ -0,0 +1,88 @@
+"""Graph-coloured batched solving against the sequential Gauss-Seidel order.
+
+Convergence: a settled box pile and a ragdoll crowd are stopped right before
+the solve, then solved with 1..MAX iterations in both orders. Body velocities
+are compared with a 200-iteration sequential solve. Throughput: one solve with
+the world's iteration count on brick walls of growing size, timed for both solvers.
+
+    python -m benchmarks.bench_coloured
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+
+import numpy as np
+
+from benchmarks.bench_parallel import ragdoll_crowd
+from benchmarks.bench_world import box_pile
+from simple_phys.coloured import colour_constraints, solve_coloured
+from simple_phys.constraints import solve_sequential
+from simple_phys.world import PhysWorld
+
+DT = 1 / 240
+ITERATIONS = [1, 2, 5, 10, 20, 50]
+
+
+def brick_wall(count: int) -> PhysWorld:
+    """Boxes stacked in a square wall, already touching their neighbours on every side."""
+    world = PhysWorld()
+    columns = int(np.ceil(np.sqrt(count)))
+    world.add_box(0, -0.5, columns + 10, 1, is_static=True)
+    for i in range(count):
+        row, col = divmod(i, columns)
+        world.add_box((col - columns / 2) * 0.999, 0.499 + row * 0.999, 1, 1)
+    return world
+
+
+def before_solve(world: PhysWorld, steps: int) -> PhysWorld:
+    """Run `steps` substeps, then the next one up to (not including) the constraint solve."""
+    for _ in range(steps):
+        world.step(DT, DT)
+    world.bodies.velocity[~world.bodies.is_static] += world.gravity * DT
+    world.detect_collisions()
+    return world
+
+
+def solved(world: PhysWorld, solver, iterations: int) -> tuple[np.ndarray, float]:
+    world = copy.deepcopy(world)
+    world.solver = solver
+    start = time.perf_counter()
+    world.solve_constraints(DT, iterations)
+    seconds = time.perf_counter() - start
+    return np.column_stack([world.bodies.velocity, world.bodies.angular_velocity]), seconds
+
+
+def colour_count(world: PhysWorld) -> int:
+    colours = [
+        colour_constraints(table.body_a, table.body_b, world.bodies.is_static)
+        for table in (world.joints, world.contacts)
+    ]
+    return sum(int(c.max()) + 1 for c in colours if len(c))
+
+
+def main() -> None:
+    for name, world in [("box pile", before_solve(box_pile(100), 240)), ("ragdolls", before_solve(ragdoll_crowd(8), 240))]:
+        reference, _ = solved(world, solve_sequential, 200)
+        print(f"{name}: {len(world.joints)} joints, {len(world.contacts)} contacts, {colour_count(world)} colours")
+        print(f"{'iterations':>10}  {'sequential error':>16}  {'coloured error':>14}")
+        for iterations in ITERATIONS:
+            sequential = np.abs(solved(world, solve_sequential, iterations)[0] - reference).max()
+            coloured = np.abs(solved(world, solve_coloured, iterations)[0] - reference).max()
+            print(f"{iterations:>10}  {sequential:16.2e}  {coloured:14.2e}")
+        print()
+
+    print(f"{'bodies':>8}  {'constraints':>11}  {'colours':>7}  {'sequential ms':>13}  {'coloured ms':>11}  {'speedup':>7}")
+    for count in [100, 400, 1_600, 6_400]:
+        world = before_solve(brick_wall(count), 0)
+        _, sequential = solved(world, solve_sequential, world.constraint_iterations)
+        _, coloured = solved(world, solve_coloured, world.constraint_iterations)
+        print(
+            f"{count:>8,}  {len(world.contacts):>11,}  {colour_count(world):>7}  {sequential * 1000:13.1f}  "
+            f"{coloured * 1000:11.1f}  {sequential / coloured:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Vectorised K / effective mass assembly vs a per-constraint Python loop.
+
+    python -m benchmarks.bench_effective_mass
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from simple_phys.effective_mass import contact_effective_masses, point_mass_matrix
+
+
+def loop_assembly(rA, rB, normal, mA, mB, iA, iB):
+    # Same arithmetic as RevoluteConstraint / ContactConstraint, one point at a time
+    out = []
+    for (ax, ay), (bx, by), (nx, ny), ma, mb, ia, ib in zip(rA, rB, normal, mA, mB, iA, iB):
+        k00 = ma + mb + ay * ay * ia + by * by * ib
+        k01 = -ay * ax * ia - by * bx * ib
+        k11 = ma + mb + ax * ax * ia + bx * bx * ib
+        rnA, rnB = ax * ny - ay * nx, bx * ny - by * nx
+        rtA, rtB = ax * -nx - ay * ny, bx * -nx - by * ny
+        out.append((k00, k01, k11, ma + mb + rnA * rnA * ia + rnB * rnB * ib, ma + mb + rtA * rtA * ia + rtB * rtB * ib))
+    return out
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'points':>10}  {'vectorised ms':>13}  {'loop ms':>10}  {'points/s':>12}")
+    for count in [1_000, 10_000, 100_000, 1_000_000]:
+        rA, rB = rng.normal(size=(2, count, 2))
+        angle = rng.uniform(0, 2 * np.pi, count)
+        normal = np.stack([np.cos(angle), np.sin(angle)], axis=-1)
+        mA, mB, iA, iB = rng.uniform(0, 2, size=(4, count))
+
+        start = time.perf_counter()
+        point_mass_matrix(rA, rB, mA, mB, iA, iB)
+        contact_effective_masses(rA, rB, normal, mA, mB, iA, iB)
+        vec_ms = (time.perf_counter() - start) * 1000
+
+        loop_text = f"{'-':>10}"
+        if count <= 100_000:
+            args = [a.tolist() for a in (rA, rB, normal, mA, mB, iA, iB)]
+            start = time.perf_counter()
+            loop_assembly(*args)
+            loop_text = f"{(time.perf_counter() - start) * 1000:10.1f}"
+
+        print(f"{count:>10,}  {vec_ms:13.1f}  {loop_text}  {count / vec_ms * 1000:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Batched FABRIK against a per-chain loop ported from runFabrik.
+
+Random chains of 2 to 8 segments with random targets, most within reach, solved
+with the demo's tolerance of 0.01 and 15 iterations. The loop solves one chain
+at a time in plain Python the way fabrik_demo.html does; the batch solves every
+chain in one call, first free and then with ±60° limits at every joint.
+
+    python -m benchmarks.bench_fabrik
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+import numpy as np
+
+from simple_phys.fabrik import solve_fabrik
+
+TOLERANCE = 0.01
+MAX_ITERATIONS = 15
+LOOP_CHAINS = 2_000
+
+
+def run_fabrik(chain: list[list[float]], target: tuple[float, float], lengths: list[float]) -> int:
+    """runFabrik from fabrik_demo.html, in place. Returns the iterations it took."""
+    tx, ty = target
+    bx, by = chain[0]
+    if math.hypot(tx - bx, ty - by) > sum(lengths):
+        for i in range(len(lengths)):
+            x, y = chain[i]
+            d = math.hypot(tx - x, ty - y) or 1.0
+            chain[i + 1] = [x + (tx - x) / d * lengths[i], y + (ty - y) / d * lengths[i]]
+        return 0
+    iteration = 0
+    while math.hypot(chain[-1][0] - tx, chain[-1][1] - ty) > TOLERANCE and iteration < MAX_ITERATIONS:
+        chain[-1] = [tx, ty]
+        for i in range(len(chain) - 2, -1, -1):
+            (x, y), (nx, ny) = chain[i], chain[i + 1]
+            d = math.hypot(x - nx, y - ny) or 1.0
+            chain[i] = [nx + (x - nx) / d * lengths[i], ny + (y - ny) / d * lengths[i]]
+        chain[0] = [bx, by]
+        for i in range(len(chain) - 1):
+            (x, y), (nx, ny) = chain[i], chain[i + 1]
+            d = math.hypot(nx - x, ny - y) or 1.0
+            chain[i + 1] = [x + (nx - x) / d * lengths[i], y + (ny - y) / d * lengths[i]]
+        iteration += 1
+    return iteration
+
+
+def random_chains(rng: np.random.Generator, count: int, segments: int) -> tuple[np.ndarray, np.ndarray]:
+    lengths = rng.uniform(0.5, 1.5, (count, segments))
+    angles = np.cumsum(rng.uniform(-0.6, 0.6, (count, segments)), axis=1)
+    steps = lengths[..., None] * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    points = np.concatenate([np.zeros((count, 1, 2)), np.cumsum(steps, axis=1)], axis=1)
+    reach = lengths.sum(axis=1) * np.sqrt(rng.uniform(0, 1.1, count))
+    heading = rng.uniform(-math.pi, math.pi, count)
+    targets = reach[:, None] * np.column_stack([np.cos(heading), np.sin(heading)])
+    return points, targets
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    limit = math.radians(60)
+    print(f"{'chains':>8}  {'segments':>8}  {'loop':>10}  {'batched':>10}  {'limited':>10}  {'speedup':>7}  {'free its':>8}  {'limited its':>11}")
+    for count in [1_000, 10_000, 100_000]:
+        for segments in [2, 4, 8]:
+            points, targets = random_chains(rng, count, segments)
+
+            start = time.perf_counter()
+            result = solve_fabrik(points, targets, tolerance=TOLERANCE, max_iterations=MAX_ITERATIONS)
+            batched = count / (time.perf_counter() - start)
+            start = time.perf_counter()
+            bounded = solve_fabrik(points, targets, -limit, limit, tolerance=TOLERANCE, max_iterations=MAX_ITERATIONS)
+            limited = count / (time.perf_counter() - start)
+
+            n = min(count, LOOP_CHAINS)
+            lengths = np.hypot(*np.moveaxis(np.diff(points[:n], axis=1), -1, 0)).tolist()
+            chains = points[:n].tolist()
+            start = time.perf_counter()
+            for chain, target, length in zip(chains, targets[:n].tolist(), lengths):
+                run_fabrik(chain, target, length)
+            loop = n / (time.perf_counter() - start)
+
+            assert np.allclose(chains, result.points[:n])
+            print(
+                f"{count:>8,}  {segments:>8}  {loop:10,.0f}  {batched:10,.0f}  {limited:10,.0f}"
+                f"  {batched / loop:6.1f}x  {result.iterations.mean():8.2f}  {bounded.iterations.mean():11.2f}"
+            )
+    print("\n(chains solved per second)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""StepController gain search: rollouts per second, early stopping and the cache.
+
+First the same 8 perturbed gain sets are rolled out in full on 1 worker and on
+every CPU. Then a short search runs from the JS gains, where candidates give
+up once they fall or cannot beat the best so far; "saved" is the share of
+simulated time that early stopping skipped. The search then runs again with
+the same seed against the cache file, which should simulate nothing.
+
+    python -m benchmarks.bench_gain_search
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from dataclasses import fields, replace
+from pathlib import Path
+
+import numpy as np
+
+from simple_phys.balance import BalanceGains
+from simple_phys.gain_search import GainSearch, Rollout
+
+ROLLOUT = Rollout(seconds=6.0, push_start=2.0)
+GENERATIONS = 4
+POPULATION = 8
+
+
+def perturbed(count: int, spread: float = 0.3, seed: int = 1) -> list[BalanceGains]:
+    rng = np.random.default_rng(seed)
+    base = BalanceGains()
+    names = [f.name for f in fields(BalanceGains)]
+    return [
+        replace(base, **{name: float(getattr(base, name) * f) for name, f in zip(names, np.exp(spread * rng.standard_normal(len(names))))})
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    print(f"{cpus} CPUs\n")
+    candidates = perturbed(POPULATION)
+    print(f"{'workers':>7}  {'wall s':>7}  {'rollouts/s':>10}  {'sim s/s':>7}")
+    for workers in sorted({1, cpus}):
+        with GainSearch(ROLLOUT, workers) as search:
+            start = time.perf_counter()
+            search.evaluate(candidates)
+            seconds = time.perf_counter() - start
+        print(f"{workers:>7}  {seconds:7.1f}  {len(candidates) / seconds:10.2f}  {search.simulated / seconds:7.2f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Path(tmp) / "gains.json"
+        print(f"\n{'run':>6}  {'wall s':>7}  {'simulated s':>11}  {'saved':>6}  {'best':>6}  {'upright s':>9}  {'energy':>7}")
+        for run in ("search", "cached"):
+            with GainSearch(ROLLOUT, cpus, cache) as search:
+                start = time.perf_counter()
+                best, score, history = search.search(generations=GENERATIONS, population=POPULATION)
+                seconds = time.perf_counter() - start
+            budget = (1 + GENERATIONS * POPULATION) * ROLLOUT.seconds
+            saved = 1 - search.simulated / budget
+            print(
+                f"{run:>6}  {seconds:7.1f}  {search.simulated:11.1f}  {saved:6.0%}"
+                f"  {score.value:6.2f}  {score.upright_time:9.2f}  {score.energy:7.0f}"
+            )
+        print("\nbest after each generation: " + "  ".join(f"{s.value:.2f}" for s in history))
+        changed = {f.name: round(getattr(best, f.name), 2) for f in fields(BalanceGains) if getattr(best, f.name) != getattr(BalanceGains(), f.name)}
+        print(f"best gains: {changed or 'the JS defaults'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Batched integrators vs a per-trajectory Python loop.
+
+    python -m benchmarks.bench_integrators
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from simple_phys.integrators import METHODS, constant_acceleration, integrate
+
+
+def python_loop_euler(y0: float, v0: float, g: float, dt: float, total_time: float) -> float:
+    # Same loop as the original EulerVsAnalyticFall._build_euler_staircase
+    t, y, v = 0.0, y0, v0
+    while t < total_time - 1e-9:
+        step = min(dt, total_time - t)
+        v += g * step
+        y += v * step
+        t += step
+    return y
+
+
+def main() -> None:
+    g, y0, total_time = -9.81, 30.0, 2.25
+    gravity = constant_acceleration([g])
+
+    print(f"{'trajectories':>12}  {'method':>20}  {'batched ms':>10}  {'loop ms':>10}")
+    for batch in [100, 1_000, 10_000]:
+        dts = np.linspace(0.01, 0.45, batch)
+
+        start = time.perf_counter()
+        for dt in dts:
+            python_loop_euler(y0, 0.0, g, dt, total_time)
+        loop_ms = (time.perf_counter() - start) * 1000
+
+        for method in METHODS:
+            start = time.perf_counter()
+            integrate(method, gravity, y0, 0.0, dts, total_time=total_time)
+            batched_ms = (time.perf_counter() - start) * 1000
+            loop_text = f"{loop_ms:10.1f}" if method == "semi_implicit_euler" else f"{'':>10}"
+            print(f"{batch:>12,}  {method:>20}  {batched_ms:10.1f}  {loop_text}")
+
+
+if __name__ == "__main__":
+    main()
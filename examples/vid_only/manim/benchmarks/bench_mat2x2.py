@@ -0,0 +1,47 @@
+"""Batched Cramer's rule vs numpy.linalg.solve vs a per-element Python loop.
+
+    python -m benchmarks.bench_mat2x2
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from simple_phys.mat2x2 import mat2x2_solve, mat2x2_solve_scalar
+
+
+def random_systems(count: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    # Symmetric positive definite like a joint's effective mass matrix
+    rng = np.random.default_rng(seed)
+    a = rng.normal(size=(count, 2, 2))
+    K = a @ a.transpose(0, 2, 1) + 0.1 * np.eye(2)
+    return K, rng.normal(size=(count, 2))
+
+
+def timed(fn, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main() -> None:
+    print(f"{'systems':>10}  {'cramer ms':>10}  {'linalg ms':>10}  {'loop ms':>10}  {'max diff':>9}")
+    for count in [1_000, 100_000, 1_000_000, 4_000_000]:
+        K, b = random_systems(count)
+        cramer_ms, ours = timed(mat2x2_solve, K, b)
+        linalg_ms, reference = timed(lambda: np.linalg.solve(K, b[..., None])[..., 0])
+
+        loop_text = f"{'-':>10}"
+        if count <= 100_000:
+            K_list, b_list = K.tolist(), b.tolist()
+            loop_ms, _ = timed(lambda: [mat2x2_solve_scalar(k, v) for k, v in zip(K_list, b_list)])
+            loop_text = f"{loop_ms:10.1f}"
+
+        diff = np.max(np.abs(ours - reference))
+        print(f"{count:>10,}  {cramer_ms:10.1f}  {linalg_ms:10.1f}  {loop_text}  {diff:9.1e}")
+
+
+if __name__ == "__main__":
+    main()
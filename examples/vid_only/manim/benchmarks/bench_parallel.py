@@ -0,0 +1,67 @@
+"""Ragdoll crowd bake with the constraint solve spread over worker processes.
+
+Ragdolls never collide with each other, so every ragdoll (with the ground
+contacts under it) is its own island. The same crowd is baked with the plain
+solver and with IslandSolver at several worker counts; every bake must end in
+exactly the same state. Only the constraint solve runs in the workers, collision
+detection stays in the main process, and speedup needs a free core per worker.
+
+    python -m benchmarks.bench_parallel
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import numpy as np
+
+from simple_phys.parallel import IslandSolver
+from simple_phys.ragdoll import spawn_ragdoll
+from simple_phys.world import PhysWorld
+
+DT = 1 / 240
+STEPS = 240
+
+
+def ragdoll_crowd(count: int) -> PhysWorld:
+    world = PhysWorld()
+    world.add_box(0, -0.5, count * 2.5 + 10, 1, is_static=True)
+    for i in range(count):
+        spawn_ragdoll(world, (i - count / 2) * 2.5, 1.8 + 0.5 * (i % 3))
+    return world
+
+
+def bake(count: int, workers: int) -> tuple[float, np.ndarray, int]:
+    world = ragdoll_crowd(count)
+    solver = IslandSolver(workers, min_constraints=0) if workers else None
+    if solver:
+        world.solver = solver
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        world.step(DT, DT)
+    seconds = time.perf_counter() - start
+    if solver:
+        solver.close()
+    state = np.column_stack([world.bodies.position, world.bodies.angle, world.bodies.velocity])
+    return STEPS / seconds, state, len(world.joints) + len(world.contacts)
+
+
+def main() -> None:
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"{os.cpu_count()} CPUs\n")
+    header = "".join(f"  {f'{n} workers':>10}" for n in worker_counts)
+    print(f"{'ragdolls':>8}  {'constraints':>11}  {'serial':>8}{header}  {'identical':>9}   (steps/s)")
+    for count in [8, 32, 128]:
+        serial_rate, reference, constraints = bake(count, 0)
+        rates, same = [], True
+        for workers in worker_counts:
+            rate, state, _ = bake(count, workers)
+            rates.append(rate)
+            same &= np.array_equal(state, reference)
+        columns = "".join(f"  {rate:10.1f}" for rate in rates)
+        print(f"{count:>8,}  {constraints:>11,}  {serial_rate:8.1f}{columns}  {str(same):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Throughput of mostly resting scenes with and without sleeping.
+
+Box piles are dropped and baked for a few seconds. Once they settle, sleeping
+islands skip the narrowphase, the solver and integration. A lone ball is
+dropped onto one pile late in the bake to check that waking works.
+
+    python -m benchmarks.bench_sleeping
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from benchmarks.bench_world import box_pile
+
+DT = 1 / 240
+SETTLE_STEPS = 720  # 3 s
+MEASURED_STEPS = 240
+
+
+def bake(count: int, sleeping: bool) -> tuple[float, float, bool]:
+    world = box_pile(count)
+    world.sleep.enabled = sleeping
+    for _ in range(SETTLE_STEPS):
+        world.step(DT, DT)
+
+    start = time.perf_counter()
+    for _ in range(MEASURED_STEPS):
+        world.step(DT, DT)
+    steps_per_second = MEASURED_STEPS / (time.perf_counter() - start)
+    asleep = float((~world.bodies.awake[~world.bodies.is_static]).mean())
+
+    # Drop a ball on the pile's top and let the hit propagate
+    top = int(np.argmax(world.bodies.position[:, 1]))
+    ball = world.add_circle(world.bodies.position[top, 0], world.bodies.position[top, 1] + 3, 0.4, density=5)
+    woke = False
+    for _ in range(240):
+        world.step(DT, DT)
+        woke |= bool(world.bodies.awake[top])
+    # ...and the ball ends up resting on the pile instead of sinking into it
+    woke &= bool(world.bodies.position[ball, 1] > world.bodies.position[top, 1])
+    return steps_per_second, asleep, woke
+
+
+def main() -> None:
+    print(f"{'bodies':>8}  {'awake steps/s':>13}  {'sleeping steps/s':>16}  {'speedup':>7}  {'asleep':>7}  {'woke':>5}")
+    for count in [50, 100, 200, 400]:
+        awake_rate, _, _ = bake(count, sleeping=False)
+        sleep_rate, asleep, woke = bake(count, sleeping=True)
+        print(
+            f"{count:>8,}  {awake_rate:13.1f}  {sleep_rate:16.1f}  {sleep_rate / awake_rate:6.1f}x  "
+            f"{asleep:7.0%}  {str(woke):>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Checkpoint size and time: world snapshots against deepcopy and pickle.
+
+Each world is settled for a second first, so its contact table and cache are
+full. "restore" builds a new PhysWorld from the blob; "into" overwrites an
+existing world in place, which is what SimulationStream does when seeking.
+Every restored world is stepped on and checked against the original.
+
+    python -m benchmarks.bench_snapshot
+"""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import time
+
+import numpy as np
+
+from benchmarks.bench_parallel import ragdoll_crowd
+from benchmarks.bench_world import box_pile
+from simple_phys.snapshot import restore, snapshot
+
+DT = 1 / 240
+REPEATS = 200
+
+
+def timed_us(fn, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn(*args)
+    return (time.perf_counter() - start) / REPEATS * 1e6
+
+
+def replays(world, blob) -> bool:
+    branch = restore(blob)
+    for _ in range(120):
+        world.step(DT, DT)
+        branch.step(DT, DT)
+    return np.array_equal(world.bodies.position, branch.bodies.position)
+
+
+def main() -> None:
+    scenes = {
+        "100 boxes": lambda: box_pile(100),
+        "400 boxes": lambda: box_pile(400),
+        "4 ragdolls": lambda: ragdoll_crowd(4),
+        "16 ragdolls": lambda: ragdoll_crowd(16),
+    }
+    print(
+        f"{'world':>12}  {'KB':>6}  {'snapshot us':>11}  {'restore us':>10}  {'into us':>8}"
+        f"  {'deepcopy us':>11}  {'pickle us':>10}  {'replays':>7}"
+    )
+    for name, make in scenes.items():
+        world = make()
+        for _ in range(240):
+            world.step(DT, DT)
+        blob = snapshot(world)
+        target = restore(blob)
+        snap = timed_us(snapshot, world)
+        new = timed_us(restore, blob)
+        into = timed_us(restore, blob, target)
+        deep = timed_us(copy.deepcopy, world)
+        pickled = timed_us(lambda: pickle.loads(pickle.dumps(world)))
+        print(
+            f"{name:>12}  {len(blob) / 1e3:6.1f}  {snap:11.0f}  {new:10.0f}  {into:8.0f}"
+            f"  {deep:11.0f}  {pickled:10.0f}  {str(replays(world, blob)):>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
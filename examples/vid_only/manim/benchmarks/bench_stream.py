@@ -0,0 +1,60 @@
+"""Memory held by streaming a long settling pile against baking it first.
+
+The bake keeps every step's positions and angles, like loading a whole
+TrajectoryFile column. The stream samples the same run at 30 fps through
+SimulationStream and only holds its look-ahead window and checkpoints
+(snapshot blobs). The last column seeks back to random times in the streamed
+run, which replays from the nearest checkpoint.
+
+    python -m benchmarks.bench_stream
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from benchmarks.bench_world import box_pile
+from simple_phys.stream import SimulationStream
+
+DT = 1 / 240
+FPS = 30
+BODIES = 40
+
+
+def bake(seconds: float) -> float:
+    world = box_pile(BODIES)
+    world.sleep.enabled = True
+    frames = []
+    for _ in range(int(round(seconds / DT))):
+        world.step(DT, DT)
+        frames.append((world.bodies.position.copy(), world.bodies.angle.copy()))
+    return sum(p.nbytes + a.nbytes for p, a in frames) / 1e6
+
+
+def stream(seconds: float, seeks: int = 5) -> tuple[float, int, float]:
+    world = box_pile(BODIES)
+    world.sleep.enabled = True
+    source = SimulationStream(world, DT)
+    for t in np.arange(0, seconds, 1 / FPS):
+        source.sample(t)
+    held = sum(f.position.nbytes + f.angle.nbytes for f in source.window())
+    held += sum(len(blob) for blob in source._checkpoints.values())
+
+    start = time.perf_counter()
+    for t in np.random.default_rng(0).uniform(0, seconds, seeks):
+        source.sample(t)
+    return held / 1e6, len(source.checkpoints), (time.perf_counter() - start) / seeks * 1000
+
+
+def main() -> None:
+    print(f"{'seconds':>8}  {'baked MB':>9}  {'streamed MB':>11}  {'checkpoints':>11}  {'seek ms':>8}")
+    for seconds in [10, 30, 90]:
+        baked = bake(seconds)
+        streamed, checkpoints, seek_ms = stream(seconds)
+        print(f"{seconds:>8}  {baked:9.2f}  {streamed:11.2f}  {checkpoints:>11}  {seek_ms:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
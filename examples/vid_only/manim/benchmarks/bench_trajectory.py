@@ -0,0 +1,62 @@
+"""Trajectory file size, write speed and random-access sampling.
+
+Worlds of free circles get random states written for every step, so there is
+no solver time involved (the write rate includes making the states). Opening
+only maps the file, so it costs the same for any length; sampling reads just
+the two steps around the requested time.
+
+    python -m benchmarks.bench_trajectory
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from simple_phys.trajectory import TrajectoryFile, TrajectoryWriter
+from simple_phys.world import PhysWorld
+
+DT = 1 / 240
+STEPS = 2_400  # 10 s
+SAMPLES = 1_000
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'bodies':>8}  {'dtype':>7}  {'file MB':>8}  {'write MB/s':>10}  {'open ms':>8}  {'sample us':>9}")
+    with tempfile.TemporaryDirectory() as folder:
+        for count in [100, 1_000, 10_000]:
+            world = PhysWorld()
+            for _ in range(count):
+                world.add_circle(*rng.uniform(-10, 10, 2), 0.1)
+            for dtype in (np.float64, np.float32):
+                path = Path(folder) / f"{count}_{np.dtype(dtype).name}.traj"
+                start = time.perf_counter()
+                with TrajectoryWriter(path, world, DT, dtype) as writer:
+                    for _ in range(STEPS - 1):
+                        world.bodies.position += rng.normal(0, 0.01, (count, 2))
+                        writer.append(world)
+                write_seconds = time.perf_counter() - start
+                megabytes = path.stat().st_size / 1e6
+
+                start = time.perf_counter()
+                trajectory = TrajectoryFile(path)
+                open_ms = (time.perf_counter() - start) * 1000
+
+                times = rng.uniform(0, trajectory.duration, SAMPLES)
+                start = time.perf_counter()
+                for t in times:
+                    trajectory.sample(t)
+                sample_us = (time.perf_counter() - start) / SAMPLES * 1e6
+                print(
+                    f"{count:>8,}  {np.dtype(dtype).name:>7}  {megabytes:8.1f}  {megabytes / write_seconds:10.1f}  "
+                    f"{open_ms:8.2f}  {sample_us:9.1f}"
+                )
+                del trajectory
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Tuned step settings against PhysWorld's one-size dt = 1/240 with 10 iterations.
+
+Two scenes: a ten-box stack dropped into place, where penetration and energy
+jitter decide, and a ten-link chain released sideways from a pin, where joint
+drift does. For each, the tuner searches dt x iterations x soft/Baumgarte x
+warm starting on every CPU for the cheapest settings within the default
+AccuracyBudget over 3 simulated seconds. The default settings are measured
+the same way for comparison. "speedup" is CPU time per simulated second
+against the default. The search then runs again against its cache file, which
+should simulate nothing.
+
+    python -m benchmarks.bench_tuning
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from simple_phys.tuning import AccuracyBudget, SettingsTuner, StepSettings
+from simple_phys.world import PhysWorld
+
+SECONDS = 3.0
+BUDGET = AccuracyBudget()
+
+
+def stack() -> PhysWorld:
+    world = PhysWorld()
+    world.add_box(0, -0.5, 10, 1, is_static=True)
+    for k in range(10):
+        world.add_box(0, 0.25 + 0.5 * k, 0.5, 0.5)
+    return world
+
+
+def chain() -> PhysWorld:
+    world = PhysWorld()
+    previous = world.add_box(0, 5, 0.2, 0.2, is_static=True)
+    for k in range(10):
+        link = world.add_box(0.25 + 0.5 * k, 5, 0.5, 0.1)
+        world.add_revolute_constraint(previous, link, (0.5 * k, 5))
+        previous = link
+    # Links overlap at the pins, so they don't collide with each other (or the pin)
+    world.bodies.collision_mask[:] = 0b10
+    world.bodies.collision_mask_ignore[:] = 0b10
+    return world
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    print(f"{cpus} CPUs, {SECONDS:g} s per rollout, budget {BUDGET}\n")
+    print(f"{'scene':>6}  {'settings':>40}  {'pen mm':>7}  {'drift mm':>8}  {'energy':>7}  {'CPU s/s':>7}  {'speedup':>7}")
+    searches = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, build in [("stack", stack), ("chain", chain)]:
+            cache = Path(tmp) / f"{name}.json"
+            with SettingsTuner(workers=cpus, cache_path=cache) as tuner:
+                (default,) = tuner.evaluate(build(), SECONDS, [StepSettings()], BUDGET)
+                before, start = tuner.simulated, time.perf_counter()
+                tuning = tuner.search(build(), SECONDS, BUDGET)
+                searches.append((name, "search", time.perf_counter() - start, tuning.rollouts, tuner.simulated - before))
+            with SettingsTuner(workers=cpus, cache_path=cache) as tuner:
+                start = time.perf_counter()
+                cached = tuner.search(build(), SECONDS, BUDGET)
+                searches.append((name, "cached", time.perf_counter() - start, cached.rollouts, tuner.simulated))
+
+            for settings, accuracy in [(StepSettings(), default), (tuning.best, tuning.accuracy)]:
+                if settings is None:
+                    print(f"{name:>6}  {'nothing within budget':>40}")
+                    continue
+                print(
+                    f"{name:>6}  {str(settings):>40}  {accuracy.penetration * 1000:7.1f}  {accuracy.joint_drift * 1000:8.1f}"
+                    f"  {accuracy.energy_drift:7.2f}  {accuracy.cost:7.3f}  {default.cost / accuracy.cost:6.1f}x"
+                )
+
+    print(f"\n{'scene':>6}  {'run':>6}  {'wall s':>7}  {'rollouts':>8}  {'simulated s':>11}")
+    for name, run, seconds, rollouts, simulated in searches:
+        print(f"{name:>6}  {run:>6}  {seconds:7.1f}  {rollouts:>8}  {simulated:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
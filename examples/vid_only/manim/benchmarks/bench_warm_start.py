@@ -0,0 +1,94 @@
+"""Solver convergence per iteration with and without warm starting, and cache cost.
+
+A box pile is settled with the contact cache on. For one substep the contacts
+are then solved with 1..MAX iterations, once warm started from the cached
+impulses and once starting cold, and body velocities are compared with a
+200-iteration solve. The second table times the cache lookup against the JS's
+linear search with splice.
+
+    python -m benchmarks.bench_warm_start
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+
+import numpy as np
+
+from benchmarks.bench_world import box_pile
+from simple_phys.constraints import Contacts
+from simple_phys.contact_cache import ContactCache
+from simple_phys.world import PhysWorld
+
+DT = 1 / 240
+MAX_ITERATIONS = 20
+
+
+def solved_velocities(world: PhysWorld, iterations: int, cold: bool) -> np.ndarray:
+    world = copy.deepcopy(world)
+    if cold:
+        world.contacts.acc_normal = 0.0
+        world.contacts.acc_friction = 0.0
+    world.solve_constraints(DT, iterations)
+    return np.column_stack([world.bodies.velocity, world.bodies.angular_velocity])
+
+
+def linear_reuse(old_keys: list[tuple[int, int, int]], new_keys: list[tuple[int, int, int]]) -> list[int]:
+    # checkCollision's search over contactConstraintsForReuse
+    remaining = list(enumerate(old_keys))
+    matched = []
+    for key in new_keys:
+        for k, (row, old) in enumerate(remaining):
+            if old == key:
+                matched.append(row)
+                remaining.pop(k)
+                break
+        else:
+            matched.append(-1)
+    return matched
+
+
+def main() -> None:
+    world = box_pile(100)
+    for _ in range(480):
+        world.step(DT, DT)
+    stats = world.contact_cache.stats
+    print(f"settled pile: {len(world.contacts)} contacts, hit rate {stats.hit_rate:.1%} "
+          f"(last step {stats.step_hit_rate:.1%}, {stats.evictions} evicted in total)\n")
+
+    # Stop the next substep right before solving
+    dynamic = ~world.bodies.is_static
+    world.bodies.velocity[dynamic] += world.gravity * DT
+    world.detect_collisions()
+    reference = solved_velocities(world, 200, cold=False)
+
+    print(f"{'iterations':>10}  {'warm error':>11}  {'cold error':>11}")
+    for iterations in range(1, MAX_ITERATIONS + 1):
+        warm = np.abs(solved_velocities(world, iterations, cold=False) - reference).max()
+        cold = np.abs(solved_velocities(world, iterations, cold=True) - reference).max()
+        print(f"{iterations:>10}  {warm:11.2e}  {cold:11.2e}")
+
+    print(f"\n{'contacts':>8}  {'dict ms':>8}  {'linear ms':>10}")
+    rng = np.random.default_rng(0)
+    for count in [100, 1_000, 5_000]:
+        keys = [(int(a), int(a) + 1, int(f)) for a, f in zip(rng.integers(0, count, count), rng.integers(0, 1 << 30, count))]
+        new_keys = keys[count // 10:] + [(-1, -1, i) for i in range(count // 10)]  # 10% new contacts
+        old = Contacts(count)
+        old.extend(count, body_a=[k[0] for k in keys], body_b=[k[1] for k in keys], feature_id=[k[2] for k in keys])
+        cache = ContactCache()
+        cache.store(old)
+        a, b, f = (np.array(column) for column in zip(*new_keys))
+
+        start = time.perf_counter()
+        cache.match(a, b, f)
+        dict_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        linear_reuse(keys, new_keys)
+        linear_ms = (time.perf_counter() - start) * 1000
+        print(f"{count:>8,}  {dict_ms:8.2f}  {linear_ms:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Steps per second of the headless PhysWorld against body count.
+
+A grid of unit boxes dropped onto static ground, timed once the pile is in
+contact. Also checks that two runs of the same scene give identical states.
+
+    python -m benchmarks.bench_world
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from simple_phys.world import PhysWorld
+
+DT = 1 / 240
+
+
+def box_pile(count: int) -> PhysWorld:
+    world = PhysWorld()
+    columns = int(np.ceil(np.sqrt(count)))
+    world.add_box(0, -0.5, columns * 1.5 + 10, 1, is_static=True)
+    for i in range(count):
+        row, col = divmod(i, columns)
+        world.add_box((col - columns / 2) * 1.1, 0.55 + row * 1.05, 1, 1)
+    return world
+
+
+def main() -> None:
+    print(f"{'bodies':>8}  {'contacts':>8}  {'steps/s':>10}  {'ms/step':>8}  {'deterministic':>13}")
+    for count in [25, 50, 100, 200, 400, 800]:
+        world, twin = box_pile(count), box_pile(count)
+        warmup, measured = 60, 60 if count <= 200 else 20
+        for _ in range(warmup):
+            world.step(DT, DT)
+            twin.step(DT, DT)
+
+        start = time.perf_counter()
+        for _ in range(measured):
+            world.step(DT, DT)
+        seconds = time.perf_counter() - start
+
+        for _ in range(measured):
+            twin.step(DT, DT)
+        same = np.array_equal(world.bodies.position, twin.bodies.position) and np.array_equal(
+            world.bodies.velocity, twin.bodies.velocity
+        )
+        print(
+            f"{count:>8,}  {len(world.contacts):>8,}  {measured / seconds:10.1f}  "
+            f"{seconds / measured * 1000:8.2f}  {str(same):>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
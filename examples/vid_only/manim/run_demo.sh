@@ -44,6 +44,19 @@ cleanup() {
 }
 trap cleanup EXIT
 
+# Shared helper packages that live next to the scene folders but contain no scenes
+HELPER_DIRS=("scene_utils" "simple_phys" "benchmarks")
+
+is_helper_module() {
+    local file="$1"
+    for helper in "${HELPER_DIRS[@]}"; do
+        if [[ "$file" == *"/$helper/"* || "$file" == "$helper/"* ]]; then
+            return 0
+        fi
+    done
+    return 1
+}
+
 # Function to run a single file
 run_file() {
     local file="$1"
@@ -60,6 +73,12 @@ run_file() {
         return
     fi
 
+    # Skip helper modules, they are imported by scenes rather than rendered
+    if is_helper_module "$file"; then
+        echo "Skipping helper module: $file"
+        return
+    fi
+
     # Get absolute path to handle subdirectories
     local abs_file=$(realpath "$file")
 
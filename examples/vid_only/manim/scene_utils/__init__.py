@@ -0,0 +1 @@
+"""Shared manim helpers for the tutorial scenes (not scenes themselves)."""
@@ -0,0 +1,233 @@
+"""Scene complexity report: how heavy is each animation of a scene?
+
+Usage (from the manim/ folder):
+
+    python -m scene_utils.complexity vid_5_constraints/cdot_normal_derivation.py
+    python -m scene_utils.complexity vid_1_integration/euler_vs_analytic_graph.py EulerVsAnalyticFall --top 5
+
+Each scene is run as a dry run (construct() executes, nothing is rasterised or
+encoded). Scene.play is hooked so that every animation (waits included) records
+the live mobjects, total points, stroke/fill path count and an estimated raster
+cost. One JSON and one HTML report per scene is written to media/complexity/.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import html
+import json
+from dataclasses import asdict, astuple, dataclass, field
+from pathlib import Path
+
+from manim import *
+
+from scene_utils.loading import load_scene_classes
+
+# Relative weights for the raster cost estimate. Cairo cost is roughly linear in
+# the number of bezier segments it strokes/fills plus the pixels a fill covers.
+CURVE_COST = 1.0
+FILL_PIXEL_COST = 1.0 / 1000.0
+IMAGE_PIXEL_COST = 1.0 / 4000.0
+
+
+@dataclass
+class FrameStats:
+    mobjects: int = 0
+    points: int = 0
+    stroke_paths: int = 0
+    fill_paths: int = 0
+    curves: int = 0
+    raster_cost: float = 0.0
+
+    def max_with(self, other: FrameStats) -> FrameStats:
+        return FrameStats(*(max(a, b) for a, b in zip(astuple(self), astuple(other))))
+
+
+@dataclass
+class AnimationRecord:
+    index: int
+    label: str
+    run_time: float
+    frames: int
+    stats: FrameStats = field(default_factory=FrameStats)
+
+    @property
+    def total_cost(self) -> float:
+        # Cost of the whole animation, so long holds on a heavy frame rank high too
+        return self.stats.raster_cost * max(self.frames, 1)
+
+
+def measure_mobjects(mobjects: list[Mobject]) -> FrameStats:
+    """Count the family of every mobject on screen once, even if shared between groups."""
+    stats = FrameStats()
+    px_per_unit = config.pixel_width / config.frame_width
+    seen: set[int] = set()
+
+    for top in mobjects:
+        for mob in top.get_family():
+            if id(mob) in seen:
+                continue
+            seen.add(id(mob))
+            stats.mobjects += 1
+            stats.points += len(mob.points)
+
+            if isinstance(mob, ImageMobject):
+                stats.raster_cost += mob.width * mob.height * px_per_unit**2 * IMAGE_PIXEL_COST
+                continue
+            if not isinstance(mob, VMobject) or len(mob.points) == 0:
+                continue
+
+            subpaths = len(mob.get_subpaths())
+            curves = mob.get_num_curves()
+            has_stroke = mob.get_stroke_width() > 0 and mob.get_stroke_opacity() > 0
+            has_fill = mob.get_fill_opacity() > 0
+
+            if has_stroke:
+                stats.stroke_paths += subpaths
+            if has_fill:
+                stats.fill_paths += subpaths
+            passes = int(has_stroke) + int(has_fill)
+            stats.curves += curves * passes
+            stats.raster_cost += curves * passes * CURVE_COST
+            if has_fill:
+                stats.raster_cost += mob.width * mob.height * px_per_unit**2 * FILL_PIXEL_COST
+
+    return stats
+
+
+def _records(scene: Scene) -> list[AnimationRecord]:
+    if not hasattr(scene, "_complexity_records"):
+        scene._complexity_records = []
+    return scene._complexity_records
+
+
+def install_hooks() -> None:
+    """Wrap Scene.play and Scene.begin_animations to sample every animation."""
+    if getattr(Scene, "_complexity_hooks_installed", False):
+        return
+
+    original_play = Scene.play
+    original_begin = Scene.begin_animations
+
+    def begin_animations(self: Scene) -> None:
+        original_begin(self)
+        # Mobjects introduced by the animation are in self.mobjects from here on
+        animations = list(getattr(self, "animations", None) or [])
+        run_time = max((anim.get_run_time() for anim in animations), default=0.0)
+        record = AnimationRecord(
+            index=len(_records(self)),
+            label=", ".join(type(anim).__name__ for anim in animations) or "(empty)",
+            run_time=run_time,
+            frames=int(round(run_time * config.frame_rate)),
+            stats=measure_mobjects(self.mobjects),
+        )
+        _records(self).append(record)
+        self._complexity_pending = record
+
+    def play(self: Scene, *args, **kwargs) -> None:
+        self._complexity_pending = None
+        original_play(self, *args, **kwargs)
+        # Also sample the end state, e.g. the target of a Transform or mobjects left behind
+        end_stats = measure_mobjects(self.mobjects)
+        record = self._complexity_pending
+        if record is None:
+            records = _records(self)
+            record = AnimationRecord(len(records), "(frozen frame)", 0.0, 0)
+            records.append(record)
+        record.stats = record.stats.max_with(end_stats)
+
+    Scene.begin_animations = begin_animations
+    Scene.play = play
+    Scene._complexity_hooks_installed = True
+
+
+def build_report(scene_name: str, records: list[AnimationRecord], top: int) -> dict:
+    ranked = sorted(records, key=lambda r: r.total_cost, reverse=True)
+    return {
+        "scene": scene_name,
+        "resolution": [config.pixel_width, config.pixel_height],
+        "frame_rate": config.frame_rate,
+        "animations": [{**asdict(r), "total_cost": r.total_cost} for r in records],
+        "top_offenders": [r.index for r in ranked[:top]],
+        "peak": asdict(functools.reduce(FrameStats.max_with, (r.stats for r in records), FrameStats())),
+    }
+
+
+def write_html(report: dict, path: Path) -> None:
+    top = set(report["top_offenders"])
+    columns = ["index", "label", "run_time", "frames", "mobjects", "points", "stroke_paths", "fill_paths", "raster_cost", "total_cost"]
+
+    rows = []
+    for anim in report["animations"]:
+        values = {**anim, **anim["stats"]}
+        cells = []
+        for col in columns:
+            value = values[col]
+            text = f"{value:,.1f}" if isinstance(value, float) else f"{value:,}" if isinstance(value, int) else str(value)
+            cells.append(f"<td>{html.escape(text)}</td>")
+        css = ' class="top"' if anim["index"] in top else ""
+        rows.append(f"<tr{css}>{''.join(cells)}</tr>")
+
+    header = "".join(f"<th>{col.replace('_', ' ')}</th>" for col in columns)
+    peak = ", ".join(f"{k.replace('_', ' ')}: {v:,.0f}" for k, v in report["peak"].items())
+    width, height = report["resolution"]
+    path.write_text(f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(report["scene"])} complexity</title>
+<style>
+	body {{ font-family: sans-serif; background: #111; color: #ddd; }}
+	table {{ border-collapse: collapse; }}
+	th, td {{ padding: 4px 10px; border-bottom: 1px solid #333; text-align: right; }}
+	td:nth-child(2) {{ text-align: left; }}
+	tr.top {{ background: #5a1e1e; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(report["scene"])}</h1>
+<p>{width}x{height} @ {report["frame_rate"]:g} fps. Peak per frame: {html.escape(peak)}.</p>
+<p>Highlighted rows are the top {len(top)} animations by total cost (raster cost per frame x frames).</p>
+<table>
+<tr>{header}</tr>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+""", encoding="utf-8")
+
+
+def analyze_scene(scene_cls: type[Scene], output_dir: Path, top: int) -> dict:
+    scene = scene_cls()
+    scene.render()
+    report = build_report(scene_cls.__name__, _records(scene), top)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / f"{scene_cls.__name__}.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+    write_html(report, output_dir / f"{scene_cls.__name__}.html")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-animation mobject/point/raster cost report for manim scenes.")
+    parser.add_argument("file", type=Path, help="Scene file to analyse")
+    parser.add_argument("scenes", nargs="*", help="Scene class names (default: all scenes in the file)")
+    parser.add_argument("--top", type=int, default=5, help="Number of offending animations to highlight")
+    parser.add_argument("--quality", default="high_quality", help="manim quality preset used for the pixel estimate")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Defaults to <media_dir>/complexity")
+    args = parser.parse_args()
+
+    install_hooks()
+    with tempconfig({"quality": args.quality, "dry_run": True, "disable_caching": True}):
+        output_dir = args.output_dir or Path(config.media_dir) / "complexity"
+        for scene_cls in load_scene_classes(args.file.resolve(), args.scenes):
+            report = analyze_scene(scene_cls, output_dir, args.top)
+            print(f"{scene_cls.__name__}: {len(report['animations'])} animations, report in {output_dir}")
+            for index in report["top_offenders"]:
+                anim = report["animations"][index]
+                print(f"  #{index:<3} {anim['label']:<40} cost {anim['total_cost']:,.0f} ({anim['stats']['points']:,} points)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Plot long NumPy trajectories on Axes without one VMobject point per sample.
+
+A 10^6 step trajectory only has a couple of thousand pixel columns to land in at
+1080p, so we reduce it to what the output resolution can show before building
+the VMobject. Two reducers:
+
+- lttb: Largest-Triangle-Three-Buckets, keeps the visually dominant shape of the curve.
+- minmax: min and max sample per pixel column, keeps every spike and envelope exactly.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from manim import *
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling of a series sorted by x."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Interior split into n_out - 2 buckets, first and last point always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    counts = ends - starts
+    avg_x = np.add.reduceat(x[1:n - 1], starts - 1) / counts
+    avg_y = np.add.reduceat(y[1:n - 1], starts - 1) / counts
+    # The "next bucket" of the final bucket is the last point
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    ax, ay = x[0], y[0]
+    for bucket, (start, end) in enumerate(zip(starts, ends)):
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((ax - next_x[bucket]) * (by - ay) - (ax - bx) * (next_y[bucket] - ay))
+        chosen = start + int(np.argmax(area))
+        selected[bucket + 1] = chosen
+        ax, ay = x[chosen], y[chosen]
+
+    return x[selected], y[selected]
+
+
+def minmax_per_column(x: np.ndarray, y: np.ndarray, n_columns: int) -> tuple[np.ndarray, np.ndarray]:
+    """Keep the min and max sample of every column, in their original order."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n <= 2 * n_columns:
+        return x, y
+
+    span = x[-1] - x[0]
+    columns = np.minimum(((x - x[0]) / span * n_columns).astype(np.int64), n_columns - 1) if span > 0 else np.zeros(n, np.int64)
+    starts = np.flatnonzero(np.r_[True, columns[1:] != columns[:-1]])
+    counts = np.diff(np.r_[starts, n])
+
+    index = np.arange(n)
+    mins = np.repeat(np.minimum.reduceat(y, starts), counts)
+    maxs = np.repeat(np.maximum.reduceat(y, starts), counts)
+    first_min = np.minimum.reduceat(np.where(y == mins, index, n), starts)
+    first_max = np.minimum.reduceat(np.where(y == maxs, index, n), starts)
+
+    selected = np.unique(np.concatenate([first_min, first_max, [0, n - 1]]))
+    return x[selected], y[selected]
+
+
+def output_columns(axes: Axes) -> int:
+    """Pixel columns the axes' x extent covers at the current render resolution."""
+    return max(int(np.ceil(axes.x_axis.get_length() * config.pixel_width / config.frame_width)), 2)
+
+
+def plot_downsampled(
+    axes: Axes,
+    x: np.ndarray,
+    y: np.ndarray,
+    method: str = "lttb",
+    points_per_column: float = 2.0,
+    **kwargs,
+) -> VMobject:
+    """Like axes.plot_line_graph for huge arrays: constant cost in the trajectory length.
+
+    method is "lttb" or "minmax". kwargs go to VMobject (color, stroke_width, ...).
+    """
+    columns = output_columns(axes)
+    if method == "lttb":
+        xs, ys = lttb(x, y, int(columns * points_per_column))
+    elif method == "minmax":
+        xs, ys = minmax_per_column(x, y, columns)
+    else:
+        raise ValueError(f"Unknown downsampling method: {method}")
+
+    graph = VMobject(**kwargs)
+    graph.set_points_as_corners([axes.coords_to_point(x_val, y_val) for x_val, y_val in zip(xs, ys)])
+    return graph
@@ -0,0 +1,40 @@
+"""Load Scene classes from a scene file, the way `manim render file.py` does."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from manim import Scene
+
+
+def load_scene_classes(file_path: Path, names: list[str] | None = None) -> list[type[Scene]]:
+    """Scene subclasses defined in file_path (optionally only those in names), in file order."""
+    file_path = Path(file_path).resolve()
+    module_name = "_".join(file_path.with_suffix("").parts[-2:])
+    if module_name in sys.modules:
+        module = sys.modules[module_name]
+    else:
+        # Same as manim: the scene's folder is importable so local helpers resolve
+        sys.path.insert(0, str(file_path.parent))
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered before exec so dataclasses with postponed annotations resolve
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+    classes = [
+        obj for obj in vars(module).values()
+        if isinstance(obj, type) and issubclass(obj, Scene) and obj.__module__ == module.__name__
+    ]
+    if names:
+        missing = set(names) - {cls.__name__ for cls in classes}
+        if missing:
+            raise ValueError(f"No scene named {', '.join(sorted(missing))} in {file_path}")
+        classes = [cls for cls in classes if cls.__name__ in names]
+    return classes
+
+
+def load_scene_class(file_path: Path, name: str) -> type[Scene]:
+    return load_scene_classes(file_path, [name])[0]
@@ -0,0 +1,114 @@
+"""Play a simple_phys trajectory back in a scene.
+
+TrajectoryPlayback draws every body of a TrajectoryFile (or a
+SimulationStream, which simulates while the scene renders) as one VMobject (a
+capsule's box and end circles are subpaths of the same body) and poses them all
+from the trajectory on each frame. The playback clock advances by the frame's
+dt, so a 15 or 60 fps render samples the 240 Hz recording wherever its frames
+fall, interpolating between the two neighbouring simulation steps.
+
+A TrajectoryFile stays memory-mapped, so render processes that each take a chunk
+of a long scene open the same file and start their playback at the chunk's
+time instead of re-simulating up to it.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from manim import *
+
+from simple_phys.bodies import CIRCLE
+from simple_phys.stream import SimulationStream
+from simple_phys.trajectory import TrajectoryFile
+
+
+def body_outline(trajectory: TrajectoryFile | SimulationStream, body: int) -> np.ndarray:
+    """Bezier points of a body's shapes in its own frame, world units, shape (points, 3)."""
+    bodies, shapes, vertices = trajectory.bodies, trajectory.shapes, trajectory.vertices
+    start, count = int(bodies.shape_start[body]), int(bodies.shape_count[body])
+    outlines = []
+    for shape in range(start, start + count):
+        if shapes.kind[shape] == CIRCLE:
+            outline = Circle(radius=float(shapes.radius[shape])).shift([*shapes.offset[shape], 0.0])
+        else:
+            first = int(shapes.vertex_start[shape])
+            local = vertices.local[first:first + int(shapes.vertex_count[shape])]
+            outline = Polygon(*[[x, y, 0.0] for x, y in local])
+        outlines.append(outline.points)
+    return np.concatenate(outlines) if outlines else np.zeros((0, 3))
+
+
+class TrajectoryPlayback(VGroup):
+    """Every body of a trajectory, posed at `time` seconds of simulation.
+
+    World point (x, y) is drawn at origin + scale * (x, y). speed is simulation
+    seconds per scene second. Playback starts paused at `start`; call play() to
+    attach the updater that advances it.
+    """
+
+    def __init__(
+        self,
+        trajectory: TrajectoryFile | SimulationStream,
+        origin: np.ndarray = ORIGIN,
+        scale: float = 1.0,
+        start: float = 0.0,
+        speed: float = 1.0,
+        colors: Sequence[ParsableManimColor] = (BLUE_C, TEAL_C, GREEN_C, YELLOW_C),
+        static_color: ParsableManimColor = GRAY_D,
+        **style,
+    ) -> None:
+        self.trajectory = trajectory
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.scale_factor = scale
+        self.speed = speed
+        self.time = start
+
+        style = {"stroke_width": 2, "fill_opacity": 0.7, **style}
+        is_static = trajectory.bodies.is_static
+        outlines = [body_outline(trajectory, body) for body in range(trajectory.body_count)]
+        body_mobjects = []
+        for body, outline in enumerate(outlines):
+            color = static_color if is_static[body] else colors[body % len(colors)]
+            mob = VMobject(color=color, fill_color=color, **style)
+            mob.points = outline.copy()
+            body_mobjects.append(mob)
+        super().__init__(*body_mobjects)
+
+        # All outlines in one array, so posing every body is a handful of NumPy calls
+        self._local = np.concatenate(outlines)[:, :2] if outlines else np.zeros((0, 2))
+        self._owner = np.repeat(np.arange(len(outlines)), [len(o) for o in outlines])
+        self._splits = np.cumsum([len(o) for o in outlines])[:-1]
+        self.seek(start)
+
+    def seek(self, time: float) -> TrajectoryPlayback:
+        """Pose every body at `time` seconds of simulation."""
+        self.time = time
+        position, angle = self.trajectory.sample(time)
+        c, s = np.cos(angle)[self._owner], np.sin(angle)[self._owner]
+        x, y = self._local[:, 0], self._local[:, 1]
+        points = np.zeros((len(self._local), 3))
+        points[:, 0] = self.origin[0] + self.scale_factor * (position[self._owner, 0] + c * x - s * y)
+        points[:, 1] = self.origin[1] + self.scale_factor * (position[self._owner, 1] + s * x + c * y)
+        for mob, body_points in zip(self.submobjects, np.split(points, self._splits)):
+            mob.points = body_points
+        return self
+
+    def play(self) -> TrajectoryPlayback:
+        """Advance with the scene clock from the current time."""
+        self.add_updater(_advance)
+        return self
+
+    def pause(self) -> TrajectoryPlayback:
+        self.remove_updater(_advance)
+        return self
+
+    @property
+    def duration(self) -> float:
+        """Scene seconds until the end of the recording from the current time (inf for an open stream)."""
+        return max(self.trajectory.duration - self.time, 0.0) / self.speed
+
+
+def _advance(playback: TrajectoryPlayback, dt: float) -> None:
+    playback.seek(playback.time + dt * playback.speed)
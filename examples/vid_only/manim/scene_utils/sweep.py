@@ -0,0 +1,201 @@
+"""Render one scene over a grid of parameter values, in parallel.
+
+A scene opts in by exposing its parameter dataclass as a class attribute named
+`params` (see EulerVsAnalyticFall). A sweep spec (JSON or TOML) names the scene
+and the grid:
+
+    scene = "vid_1_integration/euler_vs_analytic_graph.py"
+    class = "EulerVsAnalyticFall"
+
+    [base]          # optional overrides applied to every variant
+    total_time = 2.25
+
+    [grid]          # cartesian product of these values
+    dt = [0.05, 0.1, 0.15, 0.225, 0.45]
+
+Usage (from the manim/ folder):
+
+    python -m scene_utils.sweep vid_1_integration/euler_dt_sweep.toml --workers 4
+
+The first variant renders on its own and fills manim's caches: TeX is
+compiled once, and animations that do not depend on the swept values (axes,
+legend, analytic curve) are rendered once as hash-named partial movie files.
+Every other variant then renders in parallel into a partial movie folder of its
+own, seeded with hard links to the first variant's files, so those animations
+are cache hits. Each variant combining its own folder matters: manim writes a
+fixed-name file list into the folder before concatenating from it, and hashed
+files are written in place, so workers sharing one folder could mix up each
+other's segments. Videos are collected into outputs/sweeps/<spec name>/ with
+an index.json and index.html; the partial movie folders live in
+media/sweeps/<spec name>/.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import html
+import itertools
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from manim import *
+
+from scene_utils.loading import load_scene_class
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1]
+
+
+@dataclasses.dataclass
+class Variant:
+    name: str
+    overrides: dict[str, Any]
+
+
+def load_spec(path: Path) -> dict:
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise RuntimeError("TOML sweep specs need Python 3.11+, use a .json spec instead")
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def expand_grid(class_name: str, base: dict[str, Any], grid: dict[str, list]) -> list[Variant]:
+    variants = []
+    keys = list(grid)
+    for values in itertools.product(*(grid[k] for k in keys)):
+        overrides = {**base, **dict(zip(keys, values))}
+        suffix = "_".join(f"{k}-{v}" for k, v in zip(keys, values))
+        variants.append(Variant(f"{class_name}_{suffix}" if suffix else class_name, overrides))
+    return variants
+
+
+def make_variant_class(scene_cls: type[Scene], overrides: dict[str, Any]) -> type[Scene]:
+    if not dataclasses.is_dataclass(getattr(scene_cls, "params", None)):
+        raise TypeError(f"{scene_cls.__name__} has no `params` dataclass attribute to sweep over")
+    fields = {f.name for f in dataclasses.fields(scene_cls.params)}
+    unknown = set(overrides) - fields
+    if unknown:
+        raise ValueError(f"Unknown {type(scene_cls.params).__name__} fields: {', '.join(sorted(unknown))}")
+    # Same __name__ as the base scene: only params tell a variant apart
+    return type(scene_cls.__name__, (scene_cls,), {"params": dataclasses.replace(scene_cls.params, **overrides)})
+
+
+def render_variant(scene_file: str, class_name: str, variant: Variant, quality: str, partial_movie_dir: str) -> str:
+    """Runs in a worker process: rebuild the variant class there and render it."""
+    variant_cls = make_variant_class(load_scene_class(Path(scene_file), class_name), variant.overrides)
+    with tempconfig({
+        "quality": quality,
+        "output_file": variant.name,
+        "partial_movie_dir": partial_movie_dir,
+        "disable_caching": False,
+        "max_files_cached": 10_000,
+    }):
+        scene = variant_cls()
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def seed_partial_movies(source: Path, target: Path) -> None:
+    """Hard link (or copy) the cached partial movies of source into target, a variant's own folder."""
+    target.mkdir(parents=True, exist_ok=True)
+    for path in source.iterdir():
+        # The file list is per render; everything else is a hash-named cached animation
+        if not path.is_file() or path.suffix == ".txt" or (target / path.name).exists():
+            continue
+        try:
+            os.link(path, target / path.name)
+        except OSError:  # another filesystem, or no hard links
+            shutil.copy2(path, target / path.name)
+
+
+def write_index(output_dir: Path, spec_name: str, results: list[tuple[Variant, Path]]) -> None:
+    entries = [{"name": v.name, "params": v.overrides, "video": path.name} for v, path in results]
+    (output_dir / "index.json").write_text(json.dumps({"sweep": spec_name, "variants": entries}, indent=2), encoding="utf-8")
+
+    cards = "\n".join(
+        f'<figure><video src="{html.escape(e["video"])}" controls muted loop preload="metadata"></video>'
+        f'<figcaption>{html.escape(", ".join(f"{k} = {v}" for k, v in e["params"].items()))}</figcaption></figure>'
+        for e in entries
+    )
+    (output_dir / "index.html").write_text(f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(spec_name)}</title>
+<style>
+	body {{ font-family: sans-serif; background: #111; color: #ddd; }}
+	main {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(420px, 1fr)); gap: 16px; }}
+	video {{ width: 100%; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(spec_name)}</h1>
+<main>
+{cards}
+</main>
+</body>
+</html>
+""", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render a scene over a parameter grid in parallel.")
+    parser.add_argument("spec", type=Path, help="Sweep spec (.json or .toml)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--quality", default="high_quality", help="manim quality preset")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Defaults to outputs/sweeps/<spec name>")
+    args = parser.parse_args()
+
+    spec = load_spec(args.spec)
+    scene_file = str((SCRIPT_DIR / spec["scene"]).resolve())
+    class_name = spec["class"]
+    variants = expand_grid(class_name, spec.get("base", {}), spec.get("grid", {}))
+    # Fail fast on bad field names before starting any worker
+    for variant in variants:
+        make_variant_class(load_scene_class(Path(scene_file), class_name), variant.overrides)
+
+    output_dir = args.output_dir or SCRIPT_DIR / "outputs" / "sweeps" / args.spec.stem
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # First variant alone: fills the TeX and shared-animation caches the others hit
+    partial_root = SCRIPT_DIR / "media" / "sweeps" / args.spec.stem
+    partial_dirs = [partial_root / variant.name for variant in variants]
+    first, rest = variants[0], variants[1:]
+    movies = [render_variant(scene_file, class_name, first, args.quality, str(partial_dirs[0]))]
+    for partial_dir in partial_dirs[1:]:
+        seed_partial_movies(partial_dirs[0], partial_dir)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        movies += list(pool.map(
+            render_variant,
+            itertools.repeat(scene_file),
+            itertools.repeat(class_name),
+            rest,
+            itertools.repeat(args.quality),
+            map(str, partial_dirs[1:]),
+        ))
+
+    results = []
+    for variant, movie in zip(variants, movies):
+        target = output_dir / f"{variant.name}{Path(movie).suffix}"
+        shutil.copy(movie, target)
+        results.append((variant, target))
+        print(f"✓ {target.relative_to(output_dir.parent)}")
+
+    write_index(output_dir, args.spec.stem, results)
+    print(f"Gallery: {output_dir / 'index.html'}")
+
+
+if __name__ == "__main__":
+    main()
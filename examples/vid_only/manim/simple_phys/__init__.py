@@ -0,0 +1,30 @@
+"""Headless NumPy port of simple_phys.js for generating scene data.
+
+Pure NumPy (no manim import), so it can run in benchmarks and worker processes.
+"""
+
+from .integrators import METHODS, Trajectory, central_gravity, constant_acceleration, integrate, spring
+from .mat2x2 import mat2x2_det, mat2x2_solve
+from .effective_mass import axis_effective_mass, contact_effective_masses, cross, point_mass_matrix, rotate90cw
+from .soft import SoftParams, soft_constraint_params
+from .bodies import CircleShape, ConvexPolygonShape
+from .constraints import ConstraintSettings, SoftSettings
+from .world import PhysWorld
+from .broadphase import SweepAndPrune, UniformGrid
+from .narrowphase import find_contacts_batched
+from .contact_cache import CacheStats, ContactCache
+from .islands import SleepSettings, find_islands
+from .ccd import CCDSettings, time_of_impact
+from .parallel import IslandSolver, island_buckets
+from .ragdoll import Ragdoll, spawn_ragdoll
+from .coloured import colour_constraints, solve_coloured
+from .trajectory import TrajectoryFile, TrajectoryWriter, record_trajectory
+from .stream import SimulationStream, simulate
+from .snapshot import load_snapshot, restore, save_snapshot, snapshot
+from .replay import ReplayLog, ReplayRecorder, replay, state_hash, verify
+from .verlet import VerletWorld, add_blob, add_cloth, add_slime
+from .fabrik import FabrikResult, solve_fabrik
+from .balance import BalanceGains, StepController
+from .gain_search import GainSearch, Rollout
+from .adaptive import AdaptiveTrajectory, integrate_adaptive
+from .tuning import AccuracyBudget, SettingsTuner, StepSettings, load_profile, tuned_settings
@@ -0,0 +1,188 @@
+"""StepController from self_balancing_ragdoll.js, with its tuning pulled out as gains.
+
+Every hand-tuned number in the JS controller (each setMotorTargetAngle's
+maxForce / freq / dampingRatio, the step placement scales, the foot lift and
+the leg-switch hold time) is a field of BalanceGains, defaulting to the JS
+value, so a search can vary them without touching the control logic.
+
+The controller logic follows StepController.update: the leg further from the
+centre of mass (or the one off the ground) steps to the support ankle mirrored
+across the centre of mass, the support knee bends to half its spawn angle, the
+support hip turns the pelvis upright, the arms reach over the ankles and the
+ankles keep the feet flat. Date.now() becomes simulated time. The stepping
+leg and both arms are solved as IKChain does, in one solve_fabrik batch, with
+the one-segment arms padded to two.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .bodies import rotate
+from .fabrik import solve_fabrik
+from .ragdoll import Ragdoll, _anchor
+from .world import PhysWorld
+
+ELBOW_REST_ANGLE = 0.3
+BICEP_LENGTH = 0.95
+FOREARM_LENGTH = 1.05
+
+
+@dataclass(frozen=True)
+class BalanceGains:
+    """The numbers StepController hard-codes, named after the joint they drive."""
+
+    ik_force: float = 15.0  # IKChain motors on the stepping leg and the arms
+    ik_freq: float = 12.0
+    ik_damping: float = 2.0
+    knee_force: float = 15.0  # support knee held at half its spawn angle
+    knee_freq: float = 5.0
+    knee_damping: float = 2.0
+    hip_force: float = 15.0  # support hip turning the pelvis upright
+    hip_freq: float = 8.0
+    hip_damping: float = 4.0
+    ankle_force: float = 2.0  # ankles keeping the feet flat
+    ankle_freq: float = 12.0
+    ankle_damping: float = 2.0
+    rest_force: float = 25.0  # hips, knees and shoulders held where they spawned
+    rest_freq: float = 20.0
+    rest_damping: float = 5.0
+    step_forward: float = 0.7  # mirrored support ankle distance when stepping forward
+    step_back: float = 1.05  # ... and when stepping back
+    step_lift: float = 0.4  # foot clearance for a step of 1 or more
+    switch_hold: float = 0.2  # seconds before the stepping leg may change again
+
+
+def _short_diff(a: float, b: float) -> float:
+    d = (a - b + math.pi) % math.tau - math.pi
+    return math.pi if d == -math.pi else d
+
+
+class StepController:
+    """Keeps a spawn_ragdoll rig standing. Call update(dt) once per frame, before world.step."""
+
+    def __init__(self, world: PhysWorld, ragdoll: Ragdoll, gains: BalanceGains | None = None) -> None:
+        self.world = world
+        self.ragdoll = ragdoll
+        self.gains = gains or BalanceGains()
+        self.time = 0.0
+        self.stepping: str | None = None  # "r" | "l"
+        self.step_start_x = 0.0
+        self.stepping_forward = False
+        self.last_switch = -math.inf
+        self.bodies = ragdoll.bodies
+        self.mass = 1 / world.bodies.inv_mass[self.bodies]
+
+        joints, j = world.joints, ragdoll.joints
+        self.default_knee = {
+            side: 0.5 * float(world.bodies.angle[ragdoll.limbs[f"{side}_calf"]] - world.bodies.angle[ragdoll.limbs[f"{side}_thigh"]])
+            for side in "rl"
+        }
+        # resetMotorTargetAnglesToCurrentAngles
+        g = self.gains
+        for side in "rl":
+            joints.set_motor_target_angle(j[f"{side}_fore"], ELBOW_REST_ANGLE, 10, 5, 5, False)
+            for limb in ("thigh", "calf", "bicep"):
+                row = j[f"{side}_{limb}"]
+                joints.set_motor_target_angle(row, self._rotation(row), g.rest_force, g.rest_freq, g.rest_damping, False)
+
+    def _rotation(self, row: int) -> float:
+        """RevoluteConstraint.getRotation."""
+        joints, angle = self.world.joints, self.world.bodies.angle
+        return float(angle[joints.body_b[row]] - angle[joints.body_a[row]])
+
+    def _anchor(self, limb: str, which: str) -> np.ndarray:
+        """Limb.getWorldAnchor."""
+        body = self.ragdoll.limbs[limb]
+        bodies = self.world.bodies
+        return bodies.position[body] + rotate(_anchor(self.world, body, which), bodies.angle[body])
+
+    def _grounded(self, side: str) -> bool:
+        """Limb.isColliding for the foot."""
+        foot, contacts = self.ragdoll.limbs[f"{side}_foot"], self.world.contacts
+        return bool((contacts.body_a == foot).any() or (contacts.body_b == foot).any())
+
+    def centre_of_mass(self) -> np.ndarray:
+        """Rig.getCenterOfMass."""
+        return self.mass @ self.world.bodies.position[self.bodies] / self.mass.sum()
+
+    def _solve_chains(self, chains: list[list[str]], targets: list[np.ndarray]) -> None:
+        """IKChain.solve for several chains of at most two limbs, in one batch."""
+        joints, angle, j = self.world.joints, self.world.bodies.angle, self.ragdoll.joints
+        points = np.empty((len(chains), 3, 2))
+        lower = np.full((len(chains), 2), np.nan)
+        upper = np.full((len(chains), 2), np.nan)
+        for k, limbs in enumerate(chains):
+            points[k, 0] = self._anchor(limbs[0], "start")
+            for i, limb in enumerate(limbs):
+                points[k, i + 1] = self._anchor(limb, "end")
+            points[k, len(limbs) + 1:] = points[k, len(limbs)]  # zero-length padding
+            # obeyFirstJointLimits is off, so only the second limb's joint limits the chain
+            if len(limbs) > 1:
+                lower[k, 1], upper[k, 1] = joints.lower_limit[j[limbs[1]]], joints.upper_limit[j[limbs[1]]]
+        solved = solve_fabrik(points, np.array(targets), lower, upper, tolerance=0.001, mirror=True).points
+
+        g = self.gains
+        for k, limbs in enumerate(chains):
+            last_diff = 0.0
+            for i, limb in enumerate(limbs):
+                row = j[limb]
+                direction = solved[k, i + 1] - solved[k, i]
+                parent = float(angle[joints.body_a[row]])
+                relative = _short_diff(math.atan2(direction[1], direction[0]), parent + last_diff)
+                last_diff = relative - self._rotation(row)
+                joints.set_motor_target_angle(row, relative, g.ik_force, g.ik_freq, g.ik_damping, True)
+
+    def update(self, dt: float) -> None:
+        """StepController.update."""
+        self.time += dt
+        g, joints, bodies = self.gains, self.world.joints, self.world.bodies
+        limbs, j = self.ragdoll.limbs, self.ragdoll.joints
+        com = self.centre_of_mass()
+        ankle = {side: self._anchor(f"{side}_calf", "end") for side in "rl"}
+        distance = {side: abs(ankle[side][0] - com[0]) for side in "rl"}
+        grounded = {side: self._grounded(side) for side in "rl"}
+
+        if grounded["r"] == grounded["l"]:
+            far = distance["l"] > distance["r"] and abs(distance["l"] - distance["r"]) > 0.01
+            stepping = "l" if far else "r"
+        else:
+            stepping = "l" if grounded["r"] else "r"
+        if self.time - self.last_switch < g.switch_hold:
+            stepping = self.stepping
+        support = "l" if stepping == "r" else "r"
+
+        def mirrored(scale: float) -> np.ndarray:
+            # flipAcrossCOM
+            return (ankle[support] - com) * (-scale, 1.0) + com
+
+        if stepping != self.stepping:
+            self.stepping = stepping
+            self.step_start_x = float(ankle[stepping][0])
+            self.last_switch = self.time
+            self.stepping_forward = mirrored(1.0)[0] > self.step_start_x
+        target = mirrored(g.step_forward if self.stepping_forward else g.step_back)
+        target[1] += g.step_lift * min(1.0, abs(target[0] - ankle[stepping][0]))
+
+        # The stepping leg, and each arm reaching over the opposite ankle
+        arm_y = bodies.position[limbs["pelvis"], 1] - 0.5
+        self._solve_chains(
+            [[f"{stepping}_thigh", f"{stepping}_calf"], [f"{stepping}_bicep"], [f"{support}_bicep"]],
+            [target, np.array([ankle[support][0], arm_y]), np.array([ankle[stepping][0], arm_y])],
+        )
+
+        joints.set_motor_target_angle(
+            j[f"{support}_calf"], self.default_knee[support], g.knee_force, g.knee_freq, g.knee_damping, False
+        )
+        from_up = _short_diff(math.pi / 2, float(bodies.angle[limbs["pelvis"]]))
+        hip = j[f"{support}_thigh"]
+        joints.set_motor_target_angle(hip, self._rotation(hip) - from_up, g.hip_force, g.hip_freq, g.hip_damping, False)
+
+        elbow = complex(BICEP_LENGTH, 0) + FOREARM_LENGTH * complex(math.cos(ELBOW_REST_ANGLE), math.sin(ELBOW_REST_ANGLE))
+        for side in "rl":
+            joints.motor_target_angle[j[f"{side}_bicep"]] -= abs(math.atan2(elbow.imag, elbow.real))
+            target_angle = -float(bodies.angle[limbs[f"{side}_calf"]]) - 0.042
+            joints.set_motor_target_angle(j[f"{side}_foot"], target_angle, g.ankle_force, g.ankle_freq, g.ankle_damping, True)
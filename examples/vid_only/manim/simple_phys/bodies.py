@@ -0,0 +1,110 @@
+"""Rigid bodies and their shapes as structure-of-arrays tables.
+
+Body i is PhysObject with id i + 1 in simple_phys.js (ids start at 1 there,
+and contact feature ids are built from them). Static bodies have 0 inverse
+mass and inertia, like the JS's Infinity mass.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .table import ArrayTable
+
+CIRCLE = 0
+POLYGON = 1
+
+
+@dataclass
+class CircleShape:
+    radius: float
+    offset: tuple[float, float] = (0.0, 0.0)
+
+
+@dataclass
+class ConvexPolygonShape:
+    vertices: list[tuple[float, float]] = field(default_factory=list)  # counter-clockwise
+
+
+class Bodies(ArrayTable):
+    COLUMNS = {
+        "position": ((2,), np.float64, 0.0),
+        "velocity": ((2,), np.float64, 0.0),
+        "angle": ((), np.float64, 0.0),  # PhysObject.rotation
+        "angular_velocity": ((), np.float64, 0.0),
+        "inv_mass": ((), np.float64, 0.0),
+        "inv_inertia": ((), np.float64, 0.0),
+        "is_static": ((), np.bool_, False),
+        "is_bullet": ((), np.bool_, False),  # swept for time of impact each substep, see ccd.py
+        "friction": ((), np.float64, 0.6),
+        "restitution": ((), np.float64, 0.05),
+        "collision_mask": ((), np.int64, 0xFFFFFF),
+        "collision_mask_ignore": ((), np.int64, 0x000000),
+        "shape_start": ((), np.int64, 0),
+        "shape_count": ((), np.int64, 0),
+        "awake": ((), np.bool_, True),  # only ever False with world.sleep.enabled
+        "sleep_time": ((), np.float64, 0.0),
+    }
+
+    @property
+    def ids(self) -> np.ndarray:
+        return np.arange(1, self.count + 1)
+
+
+class Shapes(ArrayTable):
+    COLUMNS = {
+        "body": ((), np.int64, 0),
+        "kind": ((), np.int8, CIRCLE),
+        "local_id": ((), np.int64, 0),  # index within its body, the JS shape.id
+        "radius": ((), np.float64, 0.0),
+        "offset": ((2,), np.float64, 0.0),
+        "vertex_start": ((), np.int64, 0),
+        "vertex_count": ((), np.int64, 0),
+    }
+
+
+class Vertices(ArrayTable):
+    COLUMNS = {"local": ((2,), np.float64, 0.0)}
+
+
+def rotate(vectors: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Rotate (..., 2) vectors by matching angles, Vec2.rotate on arrays."""
+    c, s = np.cos(angles), np.sin(angles)
+    x, y = vectors[..., 0], vectors[..., 1]
+    return np.stack([x * c - y * s, x * s + y * c], axis=-1)
+
+
+def world_vertices(bodies: Bodies, shapes: Shapes, vertices: Vertices) -> np.ndarray:
+    """Every polygon vertex in world space, in the same order as vertices.local."""
+    owner_shape = np.repeat(np.arange(len(shapes)), shapes.vertex_count)
+    owner_body = shapes.body[owner_shape]
+    return bodies.position[owner_body] + rotate(vertices.local, bodies.angle[owner_body])
+
+
+def body_aabbs(bodies: Bodies, shapes: Shapes, vertices: Vertices) -> tuple[np.ndarray, np.ndarray]:
+    """(min, max) corners of every body's AABB, each (N, 2). PhysObject.getAABB on arrays."""
+    shape_min = np.full((len(shapes), 2), np.inf)
+    shape_max = np.full((len(shapes), 2), -np.inf)
+
+    circles = np.flatnonzero(shapes.kind == CIRCLE)
+    if len(circles):
+        owner = shapes.body[circles]
+        centers = bodies.position[owner] + rotate(shapes.offset[circles], bodies.angle[owner])
+        radius = shapes.radius[circles, None]
+        shape_min[circles] = centers - radius
+        shape_max[circles] = centers + radius
+
+    polygons = np.flatnonzero(shapes.kind == POLYGON)
+    if len(polygons):
+        verts = world_vertices(bodies, shapes, vertices)
+        starts = shapes.vertex_start[polygons]
+        shape_min[polygons] = np.minimum.reduceat(verts, starts, axis=0)
+        shape_max[polygons] = np.maximum.reduceat(verts, starts, axis=0)
+
+    aabb_min = np.full((len(bodies), 2), np.inf)
+    aabb_max = np.full((len(bodies), 2), -np.inf)
+    np.minimum.at(aabb_min, shapes.body, shape_min)
+    np.maximum.at(aabb_max, shapes.body, shape_max)
+    return aabb_min, aabb_max
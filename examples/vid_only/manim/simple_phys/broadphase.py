@@ -0,0 +1,127 @@
+"""Broadphases for PhysWorld: candidate body pairs without testing every pair.
+
+CollisionHelper.handleCollisions tries all i < j and rejects with an AABB
+check, which is collision.candidate_pairs here. Both classes below return the
+same pairs as arrays (a, b) with a < b, sorted the same way as that nested
+loop, so swapping them in never changes the contact order the solver sees.
+
+- SweepAndPrune sorts AABB intervals along the axis with the most spread and
+  keeps that order between calls. Bodies barely move between substeps, so the
+  re-sort is a stable (Timsort) pass over almost sorted data. Bodies spread
+  evenly in 2D overlap on one axis far more often than on both, so this is
+  best for wide scenes (a row of ragdolls, a long floor of boxes).
+- UniformGrid buckets AABBs into square cells. Bodies covering too many cells
+  (the ground) are kept out of the grid and tested against everything.
+  Close to linear in body count for piles and scattered scenes.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .bodies import Bodies, Shapes, Vertices, body_aabbs
+from .collision import should_collide
+
+
+def _pairs_after(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Every (p, q) with starts[p] <= q < ends[p], fully vectorised
+    counts = np.maximum(ends - starts, 0)
+    first = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.cumsum(counts) - counts
+    second = np.repeat(starts, counts) + np.arange(counts.sum()) - np.repeat(offsets, counts)
+    return first, second
+
+
+def filter_pairs(
+    bodies: Bodies, aabb_min: np.ndarray, aabb_max: np.ndarray, a: np.ndarray, b: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Keep overlapping pairs that shouldCollide, as (low, high) in nested loop order."""
+    overlap = (
+        (aabb_min[a, 0] <= aabb_max[b, 0]) & (aabb_max[a, 0] >= aabb_min[b, 0])
+        & (aabb_min[a, 1] <= aabb_max[b, 1]) & (aabb_max[a, 1] >= aabb_min[b, 1])
+    )
+    a, b = a[overlap], b[overlap]
+    keep = should_collide(bodies, a, b)
+    low, high = np.minimum(a[keep], b[keep]), np.maximum(a[keep], b[keep])
+    order = np.argsort(low * len(bodies) + high, kind="stable")
+    return low[order], high[order]
+
+
+class SweepAndPrune:
+    def __init__(self) -> None:
+        self.axis = 0
+        self.order = np.empty(0, dtype=np.int64)
+
+    def __call__(self, bodies: Bodies, shapes: Shapes, vertices: Vertices) -> tuple[np.ndarray, np.ndarray]:
+        aabb_min, aabb_max = body_aabbs(bodies, shapes, vertices)
+        return self.pairs(bodies, aabb_min, aabb_max)
+
+    def pairs(self, bodies: Bodies, aabb_min: np.ndarray, aabb_max: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        n = len(aabb_min)
+        finite = np.isfinite(aabb_min[:, 0])
+        centers = (aabb_min[finite] + aabb_max[finite]) / 2
+        axis = int(np.argmax(centers.var(axis=0))) if len(centers) > 1 else 0
+        if axis != self.axis or len(self.order) > n:
+            self.axis, self.order = axis, np.arange(n)
+        elif len(self.order) < n:
+            # New bodies go on the end and get sorted in
+            self.order = np.concatenate([self.order, np.arange(len(self.order), n)])
+
+        self.order = self.order[np.argsort(aabb_min[self.order, axis], kind="stable")]
+        order = self.order[finite[self.order]]
+        sorted_min = aabb_min[order, axis]
+        # Intervals after p overlap it on this axis until one starts past p's max
+        ends = np.searchsorted(sorted_min, aabb_max[order, axis], side="right")
+        first, second = _pairs_after(np.arange(len(order)) + 1, ends)
+        return filter_pairs(bodies, aabb_min, aabb_max, order[first], order[second])
+
+
+class UniformGrid:
+    def __init__(self, cell_size: float | None = None, max_cells_per_body: int = 64) -> None:
+        self.cell_size = cell_size  # None: twice the median AABB extent
+        self.max_cells_per_body = max_cells_per_body
+
+    def __call__(self, bodies: Bodies, shapes: Shapes, vertices: Vertices) -> tuple[np.ndarray, np.ndarray]:
+        aabb_min, aabb_max = body_aabbs(bodies, shapes, vertices)
+        return self.pairs(bodies, aabb_min, aabb_max)
+
+    def pairs(self, bodies: Bodies, aabb_min: np.ndarray, aabb_max: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        n = len(aabb_min)
+        finite = np.flatnonzero(np.isfinite(aabb_min[:, 0]))
+        if len(finite) < 2:
+            return np.empty(0, np.int64), np.empty(0, np.int64)
+        extent = (aabb_max[finite] - aabb_min[finite]).max(axis=1)
+        cell = self.cell_size or 2 * max(float(np.median(extent)), 1e-6)
+
+        low = np.floor(aabb_min[finite] / cell).astype(np.int64)
+        high = np.floor(aabb_max[finite] / cell).astype(np.int64)
+        span = high - low + 1
+        cells = span[:, 0] * span[:, 1]
+        large = cells > self.max_cells_per_body
+        small = ~large
+
+        # One entry per (body, covered cell), then pair up bodies sharing a cell
+        body = np.repeat(finite[small], cells[small])
+        offsets = np.cumsum(cells[small]) - cells[small]
+        local = np.arange(cells[small].sum()) - np.repeat(offsets, cells[small])
+        width = np.repeat(span[small, 0], cells[small])
+        cx = np.repeat(low[small, 0], cells[small]) + local % width
+        cy = np.repeat(low[small, 1], cells[small]) + local // width
+        key = (cx - cx.min(initial=0)) * (cy.max(initial=0) - cy.min(initial=0) + 1) + (cy - cy.min(initial=0))
+        sort = np.argsort(key, kind="stable")
+        key, body = key[sort], body[sort]
+        ends = np.searchsorted(key, key, side="right")
+        first, second = _pairs_after(np.arange(len(key)) + 1, ends)
+        a, b = [body[first]], [body[second]]
+
+        # Oversized bodies against every body
+        for big in finite[large].tolist():
+            others = finite[finite != big]
+            a.append(np.full(len(others), big))
+            b.append(others)
+
+        a, b = np.concatenate(a), np.concatenate(b)
+        low_id, high_id = np.minimum(a, b), np.maximum(a, b)
+        # A pair sharing several cells shows up once per cell
+        unique = np.unique(low_id * n + high_id)
+        return filter_pairs(bodies, aabb_min, aabb_max, unique // n, unique % n)
@@ -0,0 +1,303 @@
+"""Continuous collision detection for fast bodies (simple_phys.js has none).
+
+Bodies with is_bullet set are swept over each substep before they move. The
+motion of every body is taken as linear in position and angle across the
+substep, and conservative advancement finds the time of impact against every
+body whose swept AABB a bullet's overlaps. At (normalised) time t the pair is
+d apart, and no point of either body approaches the other faster than
+
+    |dp_a - dp_b| + r_a |dangle_a| + r_b |dangle_b|   per substep
+
+(dp and dangle the substep's displacement and rotation, r the farthest any
+shape reaches from the body's origin), so t can safely advance by d over that
+bound. Advancement aims `overlap` past touching (well inside the solver's
+slop), so the next substep's narrowphase finds an ordinary contact, and the
+bullet only integrates up to that time. The rest of the substep's motion is
+dropped, as Box2D does for bullets: the velocity is kept, the bullet just
+loses a little time on impact.
+
+Pairs already in contact, or closer than `sink` of the bullet's smallest
+extent, are where advancement crawls (a bullet rolling along the floor, or
+pivoting about the corner it just hit). The bullet is free to move along the
+surface there, but not to sink more than that allowance deeper than it
+started, measured by the SAT separation. That is checked at evenly spaced
+times, close enough that nothing moves more than the allowance between two of
+them, and the bullet stops at the last one that passed. The contact does the
+rest, and the bullet's middle never reaches a thin wall's far side.
+
+Distances are exact for circle/circle and circle/polygon; polygon/polygon
+uses the smallest vertex-to-edge distance either way, which is exact for
+separated convex polygons.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .bodies import CIRCLE, Bodies, Shapes, Vertices, body_aabbs, rotate
+from .broadphase import SweepAndPrune
+from .collision import SLOP_LINEAR, normalized
+from .narrowphase import _PaddedPolygons, expand_shape_pairs
+
+
+@dataclass
+class CCDSettings:
+    enabled: bool = True  # only bodies with is_bullet set are ever swept
+    tolerance: float = 0.25 * SLOP_LINEAR  # conservative advancement stops this close
+    overlap: float = 0.5 * SLOP_LINEAR  # most a clamped bullet sinks in, under the solver's slop
+    sink: float = 0.25  # of the smallest extent, how much deeper a bullet in contact may get per substep
+    max_iterations: int = 20  # conservative advancement steps per pair
+    max_samples: int = 256  # times checked per pair in contact, beyond which the spacing widens
+
+
+def reach(bodies: Bodies, shapes: Shapes, vertices: Vertices) -> np.ndarray:
+    """Farthest any polygon vertex or circle center is from each body's position, (N,).
+
+    A circle's distance to anything only depends on its center, so spinning
+    a ball in place never brings it closer to anything.
+    """
+    extent = np.where(shapes.kind == CIRCLE, np.hypot(*shapes.offset.T), 0.0)
+    owner = np.repeat(np.arange(len(shapes)), shapes.vertex_count)
+    np.maximum.at(extent, owner, np.hypot(*vertices.local.T))
+    radius = np.zeros(len(bodies))
+    np.maximum.at(radius, shapes.body, extent)
+    return radius
+
+
+def _local_normals(shapes: Shapes, vertices: Vertices) -> tuple[np.ndarray, np.ndarray]:
+    # (next vertex index, outward edge normal) per vertex in body space, as in collision.world_geometry
+    counts, starts = shapes.vertex_count, shapes.vertex_start
+    local_index = np.arange(len(vertices)) - np.repeat(starts, counts)
+    next_index = np.repeat(starts, counts) + (local_index + 1) % np.maximum(np.repeat(counts, counts), 1)
+    edges = vertices.local[next_index] - vertices.local
+    return next_index, normalized(np.stack([edges[:, 1], -edges[:, 0]], axis=-1))
+
+
+def smallest_extent(bodies: Bodies, shapes: Shapes, vertices: Vertices) -> np.ndarray:
+    """Thinnest half-width of each body's shapes, (N,): circle radii and polygon centroid-to-face distances."""
+    extent = shapes.radius.copy()
+    polygons = shapes.kind != CIRCLE
+    if polygons.any():
+        _, normals = _local_normals(shapes, vertices)
+        owner = np.repeat(np.arange(len(shapes)), shapes.vertex_count)
+        centroid = np.zeros((len(shapes), 2))
+        np.add.at(centroid, owner, vertices.local)
+        centroid /= np.maximum(shapes.vertex_count, 1)[:, None]
+        faces = np.full(len(shapes), np.inf)
+        np.minimum.at(faces, owner, ((vertices.local - centroid[owner]) * normals).sum(axis=-1))
+        extent[polygons] = faces[polygons]
+    smallest = np.full(len(bodies), np.inf)
+    np.minimum.at(smallest, shapes.body, extent)
+    return smallest
+
+
+def _point_segment_distance(points: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    # points (S, P, 2) against segments (S, E, 2) -> (S, P, E)
+    edge = (ends - starts)[:, None, :, :]
+    offset = points[:, :, None, :] - starts[:, None, :, :]
+    length_sq = np.maximum((edge * edge).sum(axis=-1), 1e-300)
+    along = np.clip((offset * edge).sum(axis=-1) / length_sq, 0.0, 1.0)
+    gap = offset - edge * along[..., None]
+    return np.sqrt((gap * gap).sum(axis=-1))
+
+
+def _take(value, rows: np.ndarray):
+    # Rows of a group's column, or of each column in a tuple of them
+    if isinstance(value, tuple):
+        return tuple(_take(v, rows) for v in value)
+    return value[rows] if isinstance(value, np.ndarray) else value
+
+
+class _SweptShapes:
+    """Shape pairs of the candidate body pairs, with their geometry in body space.
+
+    distance(t) poses every shape at its pair's time t (P,) and returns each
+    body pair's signed distance, negative (the SAT separation) where shapes
+    overlap.
+    """
+
+    def __init__(self, bodies: Bodies, shapes: Shapes, vertices: Vertices, a: np.ndarray, b: np.ndarray,
+                 displacement: np.ndarray, rotation: np.ndarray) -> None:
+        self.pairs = len(a)
+        pair, sa, sb = expand_shape_pairs(bodies, a, b)
+        self.position, self.angle = bodies.position, bodies.angle
+        self.displacement, self.rotation = displacement, rotation
+        next_index, normals = _local_normals(shapes, vertices)
+        polygons = _PaddedPolygons(shapes, vertices.local, normals)
+        following = _PaddedPolygons(shapes, vertices.local[next_index], normals)
+
+        circle_a, circle_b = shapes.kind[sa] == CIRCLE, shapes.kind[sb] == CIRCLE
+
+        def polygon(shape: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            width = int(shapes.vertex_count[shape].max())
+            verts, normals, mask = polygons.gather(shape, width)
+            return verts, following.gather(shape, width)[0], normals, mask
+
+        self.groups = []
+        rows = np.flatnonzero(circle_a & circle_b)
+        if len(rows):
+            s1, s2 = sa[rows], sb[rows]
+            self.groups.append({
+                "kind": "circles", "pair": pair[rows], "body": (shapes.body[s1], shapes.body[s2]),
+                "offset": (shapes.offset[s1], shapes.offset[s2]), "radius": shapes.radius[s1] + shapes.radius[s2],
+            })
+        for rows, circle, poly in [(np.flatnonzero(circle_a & ~circle_b), sa, sb), (np.flatnonzero(~circle_a & circle_b), sb, sa)]:
+            if len(rows):
+                s1, s2 = circle[rows], poly[rows]
+                self.groups.append({
+                    "kind": "circle_polygon", "pair": pair[rows], "body": (shapes.body[s1], shapes.body[s2]),
+                    "offset": shapes.offset[s1], "radius": shapes.radius[s1], "polygon": polygon(s2),
+                })
+        rows = np.flatnonzero(~circle_a & ~circle_b)
+        if len(rows):
+            s1, s2 = sa[rows], sb[rows]
+            self.groups.append({
+                "kind": "polygons", "pair": pair[rows], "body": (shapes.body[s1], shapes.body[s2]),
+                "other": polygon(s1), "polygon": polygon(s2),
+            })
+
+    def _pose(self, body: np.ndarray, t: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return self.position[body] + self.displacement[body] * t[:, None], self.angle[body] + self.rotation[body] * t
+
+    def _world(self, local: np.ndarray, position: np.ndarray, angle: np.ndarray) -> np.ndarray:
+        return position[:, None, :] + rotate(local, angle[:, None])
+
+    def distance(self, t: np.ndarray, active: np.ndarray | None = None) -> np.ndarray:
+        """Signed distance of every body pair at times t, inf outside the `active` pairs if given."""
+        result = np.full(self.pairs, np.inf)
+        for full in self.groups:
+            group = full
+            if active is not None:
+                rows = np.flatnonzero(active[full["pair"]])
+                if not len(rows):
+                    continue
+                group = {name: _take(value, rows) for name, value in full.items()}
+            pair = group["pair"]
+            time = t[pair]
+            position_1, angle_1 = self._pose(group["body"][0], time)
+            position_2, angle_2 = self._pose(group["body"][1], time)
+            if group["kind"] == "circles":
+                offset_1, offset_2 = group["offset"]
+                gap = position_2 + rotate(offset_2, angle_2) - position_1 - rotate(offset_1, angle_1)
+                d = np.hypot(gap[:, 0], gap[:, 1]) - group["radius"]
+            else:
+                verts, ends, normals, mask = group["polygon"]
+                verts, ends = self._world(verts, position_2, angle_2), self._world(ends, position_2, angle_2)
+                normals = rotate(normals, angle_2[:, None])
+                if group["kind"] == "circle_polygon":
+                    center = position_1 + rotate(group["offset"], angle_1)
+                    # The center's signed distance from the faces is <= 0 only inside the polygon
+                    face = np.where(mask, ((center[:, None, :] - verts) * normals).sum(axis=-1), -np.inf).max(axis=1)
+                    edge = np.where(mask, _point_segment_distance(center[:, None, :], verts, ends)[:, 0], np.inf).min(axis=1)
+                    d = np.where(face > 0, edge, face) - group["radius"]
+                else:
+                    other, other_ends, other_normals, other_mask = group["other"]
+                    other = self._world(other, position_1, angle_1)
+                    other_ends = self._world(other_ends, position_1, angle_1)
+                    other_normals = rotate(other_normals, angle_1[:, None])
+                    separation = np.maximum(
+                        self._separation(other, other_mask, verts, normals, mask),
+                        self._separation(verts, mask, other, other_normals, other_mask),
+                    )
+                    closest = np.minimum(
+                        self._vertex_edge(other, other_mask, verts, ends, mask),
+                        self._vertex_edge(verts, mask, other, other_ends, other_mask),
+                    )
+                    d = np.where(separation > 0, closest, separation)
+            np.minimum.at(result, pair, d)
+        return result
+
+    @staticmethod
+    def _vertex_edge(points, point_mask, starts, ends, edge_mask) -> np.ndarray:
+        distance = _point_segment_distance(points, starts, ends)
+        return np.where(point_mask[:, :, None] & edge_mask[:, None, :], distance, np.inf).min(axis=(1, 2))
+
+    @staticmethod
+    def _separation(points, point_mask, face_verts, face_normals, face_mask) -> np.ndarray:
+        # Largest gap between the points and a face of the other polygon, along that face's normal
+        dots = ((points[:, :, None, :] - face_verts[:, None, :, :]) * face_normals[:, None, :, :]).sum(axis=-1)
+        closest = np.where(point_mask[:, :, None], dots, np.inf).min(axis=1)
+        return np.where(face_mask, closest, -np.inf).max(axis=1)
+
+
+def _advance(
+    swept: _SweptShapes, bound: np.ndarray, active: np.ndarray, target: float, settings: CCDSettings
+) -> tuple[np.ndarray, np.ndarray]:
+    # Conservative advancement of the active pairs until they're within tolerance above `target`:
+    # (hit, time to integrate up to). Running out of iterations short of it stops early, but safely.
+    t = np.zeros(swept.pairs)
+    d = swept.distance(t, active)
+    active = active & (bound > 0) & (d - target > settings.tolerance)
+    hit = np.zeros(swept.pairs, dtype=bool)
+    for _ in range(settings.max_iterations):
+        if not active.any():
+            break
+        t = np.where(active, t + (d - target) / np.where(active, bound, 1.0), t)
+        active &= t <= 1.0
+        d = np.where(active, swept.distance(np.minimum(t, 1.0), active), d)
+        hit |= active & (d - target <= settings.tolerance)
+        active &= d - target > settings.tolerance
+    return hit | active, np.minimum(t, 1.0)
+
+
+def _sample(
+    bodies: Bodies, shapes: Shapes, vertices: Vertices, a: np.ndarray, b: np.ndarray, displacement: np.ndarray,
+    rotation: np.ndarray, bound: np.ndarray, floor: np.ndarray, spacing: np.ndarray, settings: CCDSettings,
+) -> tuple[np.ndarray, np.ndarray]:
+    # (hit, time to integrate up to) for pairs that must stay above distance `floor`, checked every `spacing` of motion
+    samples = np.clip(np.ceil(bound / spacing), 1, settings.max_samples).astype(np.int64)
+    pair = np.repeat(np.arange(len(a)), samples)
+    k = np.arange(len(pair)) - np.repeat(np.cumsum(samples) - samples, samples) + 1
+    swept = _SweptShapes(bodies, shapes, vertices, a[pair], b[pair], displacement, rotation)
+    below = swept.distance(k / samples[pair]) < floor[pair]
+    first = samples + 1
+    np.minimum.at(first, pair[below], k[below])
+    hit = first <= samples
+    return hit, np.where(hit, (first - 1) / samples, 1.0)
+
+
+def time_of_impact(
+    bodies: Bodies, shapes: Shapes, vertices: Vertices, moving: np.ndarray, dt: float, settings: CCDSettings
+) -> np.ndarray:
+    """Share of the substep, in [0, 1], each body may integrate before it hits something. 1 for all but bullets."""
+    fraction = np.ones(len(bodies))
+    bullets = moving & bodies.is_bullet
+    if not settings.enabled or not bullets.any():
+        return fraction
+
+    displacement = np.where(moving[:, None], bodies.velocity * dt, 0.0)
+    rotation = np.where(moving, bodies.angular_velocity * dt, 0.0)
+    radius = reach(bodies, shapes, vertices)
+    start_min, start_max = body_aabbs(bodies, shapes, vertices)
+    sweep = np.minimum(np.abs(rotation), 2.0) * radius  # how far a point can swing, capped at the diameter
+    swept_min = np.minimum(start_min, start_min + displacement) - sweep[:, None]
+    swept_max = np.maximum(start_max, start_max + displacement) + sweep[:, None]
+    low, high = SweepAndPrune().pairs(bodies, swept_min, swept_max)
+    # The bullet goes first, the sink allowance is its own
+    first = bullets[low]
+    a, b = np.where(first, low, high)[first | bullets[high]], np.where(first, high, low)[first | bullets[high]]
+    if not len(a):
+        return fraction
+
+    bound = (
+        np.hypot(*(displacement[a] - displacement[b]).T) + radius[a] * np.abs(rotation[a]) + radius[b] * np.abs(rotation[b])
+    )
+    swept = _SweptShapes(bodies, shapes, vertices, a, b, displacement, rotation)
+    start = swept.distance(np.zeros(len(a)))
+    allowance = settings.sink * smallest_extent(bodies, shapes, vertices)[a]
+    # In contact, or too close for advancement to get anywhere when moving along the surface
+    near = start < allowance
+    hit, impact = _advance(swept, bound, ~near, -settings.overlap, settings)
+    rows = np.flatnonzero(near)
+    if len(rows):
+        hit[rows], impact[rows] = _sample(
+            bodies, shapes, vertices, a[rows], b[rows], displacement, rotation, bound[rows],
+            np.minimum(start[rows], 0.0) - allowance[rows], allowance[rows], settings,
+        )
+
+    np.minimum.at(fraction, a[hit], impact[hit])
+    both = hit & bullets[b]
+    np.minimum.at(fraction, b[both], impact[both])
+    return fraction
@@ -0,0 +1,336 @@
+"""Collision detection, a port of CollisionHelper in simple_phys.js.
+
+World-space geometry for all shapes is computed with NumPy once per step
+(ShapeFrame); the SAT tests and contact clipping then run per candidate pair
+with the same branches, tolerances and feature ids as the JS, so contacts
+persist across steps the same way.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import numpy as np
+
+from .bodies import CIRCLE, Bodies, Shapes, Vertices, body_aabbs, rotate, world_vertices
+
+SLOP_LINEAR = 0.002
+FACE_SWITCH_TOL = 1e-4
+
+
+class ContactPoint(NamedTuple):
+    body_a: int
+    body_b: int
+    point: tuple[float, float]
+    normal: tuple[float, float]
+    penetration: float
+    feature_id: int
+
+
+@dataclass
+class ContactArrays:
+    """Contact points as arrays, in CollisionHelper.handleCollisions order."""
+
+    body_a: np.ndarray
+    body_b: np.ndarray
+    point: np.ndarray  # (N, 2)
+    normal: np.ndarray  # (N, 2), points from A to B
+    penetration: np.ndarray
+    feature_id: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.body_a)
+
+    @classmethod
+    def from_points(cls, points: list[ContactPoint]) -> ContactArrays:
+        return cls(
+            np.array([p.body_a for p in points], dtype=np.int64),
+            np.array([p.body_b for p in points], dtype=np.int64),
+            np.array([p.point for p in points], dtype=np.float64).reshape(-1, 2),
+            np.array([p.normal for p in points], dtype=np.float64).reshape(-1, 2),
+            np.array([p.penetration for p in points], dtype=np.float64),
+            np.array([p.feature_id for p in points], dtype=np.int64),
+        )
+
+
+def normalized(v: np.ndarray) -> np.ndarray:
+    """Vec2.normalized on (..., 2) arrays, including the (1, 0) fallback for tiny vectors."""
+    x, y = v[..., 0], v[..., 1]
+    tiny = (np.abs(x) < 1e-10) & (np.abs(y) < 1e-10)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_length = 1 / np.sqrt(x * x + y * y)
+    return np.where(tiny[..., None], [1.0, 0.0], v * np.where(tiny, 1.0, inv_length)[..., None])
+
+
+def world_geometry(bodies: Bodies, shapes: Shapes, vertices: Vertices) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(circle centers per shape, polygon vertices, edge normals) in world space."""
+    owner = shapes.body
+    centers = bodies.position[owner] + rotate(shapes.offset, bodies.angle[owner])
+    verts = world_vertices(bodies, shapes, vertices)
+    counts, starts = shapes.vertex_count, shapes.vertex_start
+    # Next vertex of the same polygon, wrapping around (ConvexPolygonShape.getNormals)
+    local_index = np.arange(len(verts)) - np.repeat(starts, counts)
+    next_index = np.repeat(starts, counts) + (local_index + 1) % np.maximum(np.repeat(counts, counts), 1)
+    edges = verts[next_index] - verts
+    normals = normalized(np.stack([edges[:, 1], -edges[:, 0]], axis=-1))  # rotate90CW
+    return centers, verts, normals
+
+
+class ShapeFrame:
+    """World-space vertices, edge normals and circle centers of every shape for one step."""
+
+    def __init__(self, bodies: Bodies, shapes: Shapes, vertices: Vertices) -> None:
+        self.body = shapes.body.tolist()
+        self.local_id = shapes.local_id.tolist()
+        self.is_circle = (shapes.kind == CIRCLE).tolist()
+        self.radius = shapes.radius.tolist()
+        self.body_position = bodies.position.tolist()
+        self.shape_start = bodies.shape_start.tolist()
+        self.shape_count = bodies.shape_count.tolist()
+
+        centers, verts, normals = world_geometry(bodies, shapes, vertices)
+        self.center = centers.tolist()
+        starts, counts = shapes.vertex_start, shapes.vertex_count
+
+        verts_list, normals_list = verts.tolist(), normals.tolist()
+        self.verts = [verts_list[s: s + c] for s, c in zip(starts.tolist(), counts.tolist())]
+        self.normals = [normals_list[s: s + c] for s, c in zip(starts.tolist(), counts.tolist())]
+
+
+def should_collide(bodies: Bodies, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """CollisionHelper.shouldCollide for arrays of body index pairs."""
+    mask_a, mask_b = bodies.collision_mask[a], bodies.collision_mask[b]
+    ignore_a, ignore_b = bodies.collision_mask_ignore[a], bodies.collision_mask_ignore[b]
+    return (
+        ~(bodies.is_static[a] & bodies.is_static[b])
+        & ((mask_a & mask_b) != 0)
+        & ((ignore_a & mask_b) != mask_b)
+        & ((ignore_b & mask_a) != mask_a)
+    )
+
+
+def all_pairs(aabb_min: np.ndarray, aabb_max: np.ndarray, chunk: int = 1024) -> tuple[np.ndarray, np.ndarray]:
+    """Every overlapping (i, j) with i < j, in the JS's nested loop order. O(n^2)."""
+    n = len(aabb_min)
+    first, second = [], []
+    for start in range(0, n, chunk):
+        rows = np.arange(start, min(start + chunk, n))
+        overlap = (
+            (aabb_min[rows, None, 0] <= aabb_max[None, :, 0]) & (aabb_max[rows, None, 0] >= aabb_min[None, :, 0])
+            & (aabb_min[rows, None, 1] <= aabb_max[None, :, 1]) & (aabb_max[rows, None, 1] >= aabb_min[None, :, 1])
+        )
+        overlap &= np.arange(n)[None, :] > rows[:, None]
+        i, j = np.nonzero(overlap)
+        first.append(rows[i])
+        second.append(j)
+    if not first:
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    return np.concatenate(first), np.concatenate(second)
+
+
+def _project(verts, axis) -> tuple[float, float]:
+    ax, ay = axis
+    dots = [x * ax + y * ay for x, y in verts]
+    return min(dots), max(dots)
+
+
+def _normalized(x: float, y: float) -> tuple[float, float]:
+    if abs(x) < 1e-10 and abs(y) < 1e-10:
+        return (1.0, 0.0)
+    inv_length = 1 / math.sqrt(x * x + y * y)
+    return (x * inv_length, y * inv_length)
+
+
+def poly_to_poly_sat(frame: ShapeFrame, sa: int, sb: int):
+    verts_a, verts_b = frame.verts[sa], frame.verts[sb]
+    normals_a, normals_b = frame.normals[sa], frame.normals[sb]
+
+    min_sep_a, min_edge_a = -math.inf, 0
+    for i, n in enumerate(normals_a):
+        min_a, max_a = _project(verts_a, n)
+        min_b, max_b = _project(verts_b, n)
+        if min_a > max_b or min_b > max_a:
+            return None
+        sep = min_b - max_a
+        if sep > min_sep_a:
+            min_sep_a, min_edge_a = sep, i
+
+    min_sep_b, min_edge_b = -math.inf, 0
+    for i, n in enumerate(normals_b):
+        min_a, max_a = _project(verts_a, n)
+        min_b, max_b = _project(verts_b, n)
+        if min_a > max_b or min_b > max_a:
+            return None
+        sep = min_a - max_b
+        if sep > min_sep_b:
+            min_sep_b, min_edge_b = sep, i
+
+    # Small buffer so we don't flip reference faces when they're nearly tied
+    if min_sep_b > min_sep_a + FACE_SWITCH_TOL:
+        return normals_b[min_edge_b], -min_sep_b, False, min_edge_b
+    return normals_a[min_edge_a], -min_sep_a, True, min_edge_a
+
+
+def circle_to_poly_sat(frame: ShapeFrame, circle: int, poly: int):
+    cx, cy = frame.center[circle]
+    radius = frame.radius[circle]
+    verts = frame.verts[poly]
+    min_pen, normal = math.inf, None
+
+    for n in frame.normals[poly]:
+        min_a, max_a = _project(verts, n)
+        proj = cx * n[0] + cy * n[1]
+        min_b, max_b = proj - radius, proj + radius
+        if min_a > max_b or min_b > max_a:
+            return None
+        pen = min(max_a, max_b) - max(min_a, min_b)
+        if pen < min_pen:
+            min_pen, normal = pen, n
+
+    # Closest point may be a vertex rather than an edge
+    closest = min(verts, key=lambda v: math.sqrt((v[0] - cx) * (v[0] - cx) + (v[1] - cy) * (v[1] - cy)))
+    axis = _normalized(closest[0] - cx, closest[1] - cy)
+    min_a, max_a = _project(verts, axis)
+    proj = cx * axis[0] + cy * axis[1]
+    min_b, max_b = proj - radius, proj + radius
+    if min_a > max_b or min_b > max_a:
+        return None
+    pen = min(max_a, max_b) - max(min_a, min_b)
+    if pen < min_pen:
+        min_pen, normal = pen, axis
+    return normal, min_pen
+
+
+def circle_to_circle_sat(frame: ShapeFrame, sa: int, sb: int):
+    ax, ay = frame.center[sa]
+    bx, by = frame.center[sb]
+    dx, dy = bx - ax, by - ay
+    dist = math.sqrt(dx * dx + dy * dy)
+    total = frame.radius[sa] + frame.radius[sb]
+    if dist > total:
+        return None
+    return _normalized(dx, dy), total - dist
+
+
+def clip_line_segment_to_line(p1, p2, normal, offset) -> list[tuple[float, float]]:
+    d0 = (p1[0] - offset[0]) * normal[0] + (p1[1] - offset[1]) * normal[1]
+    d1 = (p2[0] - offset[0]) * normal[0] + (p2[1] - offset[1]) * normal[1]
+    clipped = []
+    if d0 <= 0:
+        clipped.append(p1)
+    if d1 <= 0:
+        clipped.append(p2)
+    if _sign(d0) != _sign(d1) and len(clipped) < 2:
+        pct = d1 / (d1 - d0)
+        clipped.append((p2[0] + (p1[0] - p2[0]) * pct, p2[1] + (p1[1] - p2[1]) * pct))
+    return clipped
+
+
+def _sign(x: float) -> float:
+    return (x > 0) - (x < 0)
+
+
+def _feature_prefix(id_a: int, id_b: int, shape_a: int, shape_b: int) -> int:
+    return ((id_a & 0xFF) << 24) | ((id_b & 0xFF) << 16) | ((shape_a & 0xFF) << 8) | (shape_b & 0xFF)
+
+
+def clip_poly_to_poly(frame: ShapeFrame, ref: int, inc: int, normal_index: int):
+    ref_verts, inc_verts = frame.verts[ref], frame.verts[inc]
+    a1 = ref_verts[normal_index]
+    a2 = ref_verts[(normal_index + 1) % len(ref_verts)]
+    n = frame.normals[ref][normal_index]
+
+    # Incident edge: normal pointing most opposite to n
+    dots = [n[0] * m[0] + n[1] * m[1] for m in frame.normals[inc]]
+    incident = dots.index(min(dots))
+    b2 = inc_verts[incident]
+    b1 = inc_verts[(incident + 1) % len(inc_verts)]
+
+    tangent = _normalized(a2[0] - a1[0], a2[1] - a1[1])
+    clipped = clip_line_segment_to_line(b1, b2, (-tangent[0], -tangent[1]), a1)
+    if not clipped:
+        return [], []
+    clipped = clip_line_segment_to_line(clipped[0], clipped[1], tangent, a2)
+    points = [p for p in clipped if n[0] * (p[0] - a1[0]) + n[1] * (p[1] - a1[1]) <= SLOP_LINEAR]
+
+    # Box2D style feature ids: object/shape ids plus the vertex indices of both edges
+    i11, i12 = normal_index, (normal_index + 1) % len(ref_verts)
+    i21, i22 = (incident + 1) % len(inc_verts), incident
+    ref_body, inc_body = frame.body[ref], frame.body[inc]
+    prefix = (
+        (((ref_body + 1) & 0xFF) << 24) | (((inc_body + 1) & 0xFF) << 16)
+        | ((frame.local_id[ref] & 0xF) << 12) | ((frame.local_id[inc] & 0xF) << 8)
+    )
+    ids = [
+        prefix | (((i11 & 0xF) << 4) | (i22 & 0xF) if k == 0 else ((i12 & 0xF) << 4) | (i21 & 0xF))
+        for k in range(len(points))
+    ]
+    return points, ids
+
+
+def collide_bodies(frame: ShapeFrame, a: int, b: int) -> list[ContactPoint]:
+    """CollisionHelper.checkCollision after the mask and AABB checks."""
+    contacts = []
+    pax, pay = frame.body_position[a]
+    pbx, pby = frame.body_position[b]
+    for sa in range(frame.shape_start[a], frame.shape_start[a] + frame.shape_count[a]):
+        for sb in range(frame.shape_start[b], frame.shape_start[b] + frame.shape_count[b]):
+            circle_a, circle_b = frame.is_circle[sa], frame.is_circle[sb]
+            if circle_a and circle_b:
+                hit = circle_to_circle_sat(frame, sa, sb)
+            elif circle_a:
+                hit = circle_to_poly_sat(frame, sa, sb)
+            elif circle_b:
+                hit = circle_to_poly_sat(frame, sb, sa)
+            else:
+                hit = poly_to_poly_sat(frame, sa, sb)
+            if hit is None:
+                continue
+
+            normal, penetration = hit[0], hit[1]
+            # Normal always points A -> B, the contact pushes B along +normal
+            if normal[0] * (pbx - pax) + normal[1] * (pby - pay) < 0:
+                normal = (-normal[0], -normal[1])
+
+            if circle_a or circle_b:
+                circle, poly_body = (sa, b) if circle_a else (sb, a)
+                cx, cy = frame.center[circle]
+                radius = frame.radius[circle]
+                if circle_a and circle_b:
+                    sign = 1.0
+                else:
+                    # March from the circle center towards the polygon's body
+                    px, py = frame.body_position[poly_body]
+                    sign = _sign(normal[0] * (px - cx) + normal[1] * (py - cy)) or 1.0
+                points = [(cx + normal[0] * radius * sign, cy + normal[1] * radius * sign)]
+                other = sb if circle == sa else sa
+                ids = [_feature_prefix(frame.body[circle] + 1, frame.body[other] + 1, frame.local_id[circle], frame.local_id[other])]
+            else:
+                reference_is_a, edge = hit[2], hit[3]
+                points, ids = clip_poly_to_poly(frame, sa, sb, edge) if reference_is_a else clip_poly_to_poly(frame, sb, sa, edge)
+
+            for point, feature_id in zip(points, ids):
+                contacts.append(ContactPoint(a, b, tuple(point), tuple(normal), penetration, feature_id))
+    return contacts
+
+
+def candidate_pairs(bodies: Bodies, shapes: Shapes, vertices: Vertices) -> tuple[np.ndarray, np.ndarray]:
+    """All-pairs broadphase: AABB overlap and collision masks, i < j."""
+    aabb_min, aabb_max = body_aabbs(bodies, shapes, vertices)
+    a, b = all_pairs(aabb_min, aabb_max)
+    keep = should_collide(bodies, a, b)
+    return a[keep], b[keep]
+
+
+def find_contacts(
+    bodies: Bodies, shapes: Shapes, vertices: Vertices, pairs: tuple[np.ndarray, np.ndarray] | None = None
+) -> ContactArrays:
+    """Contact points for every candidate pair, one pair at a time like the JS."""
+    a, b = candidate_pairs(bodies, shapes, vertices) if pairs is None else pairs
+    frame = ShapeFrame(bodies, shapes, vertices)
+    contacts = []
+    for i, j in zip(a.tolist(), b.tolist()):
+        contacts.extend(collide_bodies(frame, i, j))
+    return ContactArrays.from_points(contacts)
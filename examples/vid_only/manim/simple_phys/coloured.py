@@ -0,0 +1,220 @@
+"""Graph-coloured constraint solving: whole batches of constraints per NumPy call.
+
+solve_sequential (PhysWorld.solveConstraints) applies every impulse before the
+next constraint reads the velocities, so the loop can't be vectorised.
+solve_coloured first colours the constraint graph: constraints of one colour
+share no dynamic body, so all of them can read the velocities, compute their
+impulses and apply them at once without any two writing the same body. Static
+bodies may appear in many constraints of a colour, their velocities never change.
+
+Each iteration still runs joints before contacts and the colours in order, so it
+is Gauss-Seidel between colours and Jacobi within one. The constraint physics,
+the iteration count and the soft/baumgarte settings are those of
+solve_sequential; only the order of the updates differs, so the results are
+close to but not bit-identical with the sequential solver.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from .bodies import Bodies, rotate
+from .constraints import RESTITUTION_THRESHOLD, ConstraintSettings, Contacts, Joints, _soft_terms
+from .effective_mass import contact_effective_masses, cross, point_mass_matrix
+from .soft import SLOP_LINEAR
+
+
+def colour_constraints(body_a: np.ndarray, body_b: np.ndarray, is_static: np.ndarray) -> np.ndarray:
+    """Greedy colouring in row order: each constraint takes the lowest colour its dynamic bodies don't have yet."""
+    static = is_static.tolist()
+    used = [0] * len(static)  # bit c set: the body already has a constraint of colour c
+    colours = []
+    for a, b in zip(body_a.tolist(), body_b.tolist()):
+        taken = (0 if static[a] else used[a]) | (0 if static[b] else used[b])
+        bit = ~taken & (taken + 1)  # lowest clear bit
+        if not static[a]:
+            used[a] |= bit
+        if not static[b]:
+            used[b] |= bit
+        colours.append(bit.bit_length() - 1)
+    return np.array(colours, dtype=np.int64)
+
+
+def colour_batches(colours: np.ndarray) -> tuple[np.ndarray, list[slice]]:
+    """Rows sorted by colour (row order kept within a colour) and the slice of each colour in that order."""
+    order = np.argsort(colours, kind="stable")
+    bounds = np.searchsorted(colours[order], np.arange(colours.max() + 2 if len(colours) else 1))
+    return order, [slice(start, end) for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
+
+
+def _relative_velocity(v, w, a, b, rA, rB) -> np.ndarray:
+    # vB + wB x rB - vA - wA x rA, shape (N, 2)
+    return np.column_stack([
+        v[b, 0] - rB[:, 1] * w[b] - v[a, 0] + rA[:, 1] * w[a],
+        v[b, 1] + rB[:, 0] * w[b] - v[a, 1] - rA[:, 0] * w[a],
+    ])
+
+
+def _apply(v, w, a, b, ma, mb, ia, ib, rA, rB, p) -> None:
+    v[a] -= p * ma[:, None]
+    w[a] -= cross(rA, p) * ia
+    v[b] += p * mb[:, None]
+    w[b] += cross(rB, p) * ib
+
+
+def _dot(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[:, 0] * v[:, 0] + u[:, 1] * v[:, 1]
+
+
+def solve_coloured(
+    bodies: Bodies,
+    joints: Joints,
+    contacts: Contacts,
+    settings: ConstraintSettings,
+    dt: float,
+    iterations: int,
+) -> None:
+    """PhysWorld.solveConstraints with every colour of constraints solved as one batch."""
+    warm = settings.warm_starting
+    v, w = bodies.velocity.copy(), bodies.angular_velocity.copy()
+    im, ii = bodies.inv_mass, bodies.inv_inertia
+    j_order, j_batches = colour_batches(colour_constraints(joints.body_a, joints.body_b, bodies.is_static))
+    c_order, c_batches = colour_batches(colour_constraints(contacts.body_a, contacts.body_b, bodies.is_static))
+    J, C = joints.subset(j_order), contacts.subset(c_order)
+
+    # RevoluteConstraint.update, in colour order
+    ja, jb = J.body_a, J.body_b
+    rA, rB = rotate(J.local_a, bodies.angle[ja]), rotate(J.local_b, bodies.angle[jb])
+    error = bodies.position[jb] + rB - bodies.position[ja] - rA
+    K = point_mass_matrix(rA, rB, im[ja], im[jb], ii[ja], ii[jb])
+    det = K[:, 0, 0] * K[:, 1, 1] - K[:, 0, 1] * K[:, 0, 1]
+    inv_det = np.divide(1.0, det, out=np.zeros_like(det), where=det != 0)
+    J.current_angle = bodies.angle[jb] - bodies.angle[ja]
+    with np.errstate(invalid="ignore"):
+        J.angle_violation = np.where(
+            J.current_angle < J.lower_limit, J.current_angle - J.lower_limit,
+            np.where(J.current_angle > J.upper_limit, J.current_angle - J.upper_limit, 0.0),
+        )
+    violation = J.angle_violation
+    j_ma, j_mb, j_ia, j_ib = im[ja], im[jb], ii[ja], ii[jb]
+    inv_i = j_ia + j_ib
+    acc = J.acc_impulse
+
+    # solveMotor's impulse is (goal - rel) / denominator, for a servo target or a motor speed
+    motor = J.motor_enabled & (inv_i != 0)
+    servo = motor & ~np.isnan(J.motor_target_angle)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        i_eff = 1 / inv_i
+        omega = 2 * math.pi * J.motor_freq
+        stiff = i_eff * omega * omega
+        damp = 2 * i_eff * J.motor_damping_ratio * omega
+        gamma = 1 / (dt * (damp + stiff * dt))
+        motor_bias = (J.current_angle - J.motor_target_angle) * stiff * dt * gamma
+    motor_goal = np.where(servo, -motor_bias, J.motor_speed)
+    motor_denominator = np.where(servo, inv_i + gamma, np.where(motor, inv_i, 1.0))
+    max_motor_impulse = J.max_motor_force * dt
+    limited = ~(np.isnan(J.lower_limit) & np.isnan(J.upper_limit)) & (violation != 0) & (inv_i >= 1e-6)
+    safe_inv_i = np.where(inv_i != 0, inv_i, 1.0)
+
+    # ContactConstraint.update, in colour order
+    ca, cb = C.body_a, C.body_b
+    crA, crB = rotate(C.local_a, bodies.angle[ca]), rotate(C.local_b, bodies.angle[cb])
+    em_n, em_t = contact_effective_masses(crA, crB, C.normal, im[ca], im[cb], ii[ca], ii[cb])
+    c_ma, c_mb, c_ia, c_ib = im[ca], im[cb], ii[ca], ii[cb]
+    normal, tangent = C.normal, C.tangent
+    acc_n, acc_t = C.acc_normal, C.acc_friction
+    has_normal = em_n >= 1e-6
+    has_friction = (C.friction > 0) & (em_t >= 1e-6)
+    safe_em_n, safe_em_t = np.where(has_normal, em_n, 1.0), np.where(has_friction, em_t, 1.0)
+    rel_vel = C.relative_velocity
+
+    j_rate, j_mass_scale, j_impulse_scale = _soft_terms(settings, settings.joint_soft, dt)
+    c_rate, c_mass_scale, c_impulse_scale = _soft_terms(settings, settings.contact_soft, dt)
+    max_bias_speed = settings.contact_speed if settings.mode == "soft" else math.inf
+    bias = np.maximum(c_rate * np.minimum(0.0, -C.penetration + SLOP_LINEAR), -max_bias_speed)
+
+    def joint_args(s):
+        return ja[s], jb[s], j_ma[s], j_mb[s], j_ia[s], j_ib[s], rA[s], rB[s]
+
+    def contact_args(s):
+        return ca[s], cb[s], c_ma[s], c_mb[s], c_ia[s], c_ib[s], crA[s], crB[s]
+
+    if warm:
+        for s in j_batches:
+            _apply(v, w, *joint_args(s), acc[s])
+    for s in c_batches:
+        args = contact_args(s)
+        # Relative normal velocity before warm starting, for restitution
+        rel_vel[s] = _dot(normal[s], _relative_velocity(v, w, args[0], args[1], args[6], args[7]))
+        _apply(v, w, *args, normal[s] * acc_n[s, None] + tangent[s] * acc_t[s, None])
+
+    for _ in range(iterations):
+        for s in j_batches:
+            a, b, ma, mb, ia, ib, ra, rb = joint_args(s)
+
+            # solvePointConstraint
+            rhs = -(_relative_velocity(v, w, a, b, ra, rb) + j_rate * error[s])
+            k00, k01, k11 = K[s, 0, 0], K[s, 0, 1], K[s, 1, 1]
+            p = np.column_stack([
+                j_mass_scale * inv_det[s] * (k11 * rhs[:, 0] - k01 * rhs[:, 1]) - j_impulse_scale * acc[s, 0],
+                j_mass_scale * inv_det[s] * (k00 * rhs[:, 1] - k01 * rhs[:, 0]) - j_impulse_scale * acc[s, 1],
+            ])
+            _apply(v, w, a, b, ma, mb, ia, ib, ra, rb, p)
+            if warm:
+                acc[s] += p
+
+            # solveMotor
+            impulse = (motor_goal[s] - (w[b] - w[a])) / motor_denominator[s]
+            impulse = np.where(motor[s], np.clip(impulse, -max_motor_impulse[s], max_motor_impulse[s]), 0.0)
+            w[a] -= ia * impulse
+            w[b] += ib * impulse
+
+            # solveAngleLimits
+            lam = -(j_mass_scale * (w[b] - w[a] + j_rate * violation[s])) / safe_inv_i[s]
+            lam = np.where(violation[s] > 0, np.minimum(lam, 0.0), np.maximum(lam, 0.0))
+            lam = np.where(limited[s], lam, 0.0)
+            w[a] -= ia * lam
+            w[b] += ib * lam
+
+        for s in c_batches:
+            args = contact_args(s)
+            a, b, ra, rb = args[0], args[1], args[6], args[7]
+
+            # solveContact
+            n = normal[s]
+            cdot = _dot(n, _relative_velocity(v, w, a, b, ra, rb))
+            lam = -(c_mass_scale * cdot + bias[s]) / safe_em_n[s] - c_impulse_scale * acc_n[s] / safe_em_n[s]
+            old = acc_n[s].copy()
+            new = np.where(has_normal[s], np.maximum(old + lam, 0.0), old)
+            acc_n[s] = new
+            _apply(v, w, *args, n * (new - old)[:, None])
+
+            # solveFriction
+            t = tangent[s]
+            cdot = _dot(t, _relative_velocity(v, w, a, b, ra, rb))
+            max_friction = C.friction[s] * acc_n[s]
+            old = acc_t[s].copy()
+            new = np.where(has_friction[s], np.clip(old - cdot / safe_em_t[s], -max_friction, max_friction), old)
+            acc_t[s] = new
+            _apply(v, w, *args, t * (new - old)[:, None])
+
+    # applyRestitution, only for new contacts that were approaching fast enough
+    bouncy = (C.restitution != 0) & ~C.is_reused & (rel_vel <= -RESTITUTION_THRESHOLD) & has_normal
+    for s in c_batches:
+        if not bouncy[s].any():
+            continue
+        args = contact_args(s)
+        vn = _dot(normal[s], _relative_velocity(v, w, args[0], args[1], args[6], args[7]))
+        impulse = -(vn + C.restitution[s] * rel_vel[s]) / safe_em_n[s]
+        impulse = np.where(bouncy[s] & (impulse > 0), impulse, 0.0)
+        _apply(v, w, *args, normal[s] * impulse[:, None])
+
+    # Like solve_sequential, only write the bodies these constraints move
+    touched = np.unique(np.concatenate([joints.body_a, joints.body_b, contacts.body_a, contacts.body_b]))
+    touched = touched[~bodies.is_static[touched]]
+    bodies.velocity[touched] = v[touched]
+    bodies.angular_velocity[touched] = w[touched]
+    joints.update_rows(j_order, J)
+    contacts.update_rows(c_order, C)
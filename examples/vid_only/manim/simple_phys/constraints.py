@@ -0,0 +1,306 @@
+"""Revolute joints and contacts as tables, and the sequential impulse solver.
+
+Joints port RevoluteConstraint and contacts ContactConstraint from simple_phys.js.
+solve_sequential is PhysWorld.solveConstraints: update() every constraint (joints
+first, then contacts), `iterations` passes of solve(), then applyRestitution on
+the contacts. Geometry that stays fixed for the whole solve (anchor arms, K,
+effective masses) is computed with NumPy up front; the Gauss-Seidel passes
+themselves are order dependent, so they run over plain floats copied out of the
+arrays and written back at the end.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .bodies import Bodies, rotate
+from .effective_mass import contact_effective_masses, point_mass_matrix
+from .soft import SLOP_LINEAR, soft_constraint_params, solver_hertz
+from .table import ArrayTable
+
+RESTITUTION_THRESHOLD = 1.0
+
+
+@dataclass
+class SoftSettings:
+    hertz: float
+    damping_ratio: float
+
+
+@dataclass
+class ConstraintSettings:
+    """PhysWorld.constraintSettings."""
+
+    mode: str = "soft"  # 'off' | 'baumgarte' | 'soft'
+    baumgarte_factor: float = 0.1
+    contact_soft: SoftSettings = field(default_factory=lambda: SoftSettings(30.0, 10.0))
+    joint_soft: SoftSettings = field(default_factory=lambda: SoftSettings(60.0, 0.0))
+    contact_speed: float = 3.0
+    warm_starting: bool = True
+
+
+class Joints(ArrayTable):
+    """RevoluteConstraint rows. Missing angle limits and servo targets are NaN (null in the JS)."""
+
+    COLUMNS = {
+        "body_a": ((), np.int64, 0),
+        "body_b": ((), np.int64, 0),
+        "local_a": ((2,), np.float64, 0.0),
+        "local_b": ((2,), np.float64, 0.0),
+        "lower_limit": ((), np.float64, np.nan),
+        "upper_limit": ((), np.float64, np.nan),
+        "stiffness": ((), np.float64, 1.0),
+        "motor_enabled": ((), np.bool_, False),
+        "motor_speed": ((), np.float64, 0.0),
+        "max_motor_force": ((), np.float64, 5.0),
+        "motor_target_angle": ((), np.float64, np.nan),
+        "motor_freq": ((), np.float64, 6.0),
+        "motor_damping_ratio": ((), np.float64, 1.0),
+        "acc_impulse": ((2,), np.float64, 0.0),
+        "current_angle": ((), np.float64, 0.0),
+        "angle_violation": ((), np.float64, 0.0),
+    }
+
+    def set_motor_target_angle(
+        self,
+        row: int,
+        target_angle: float,
+        max_force: float | None = None,
+        freq: float | None = None,
+        damping_ratio: float | None = None,
+        target_to_wrapped_closest: bool = True,
+    ) -> None:
+        """RevoluteConstraint.setMotorTargetAngle: servo towards target_angle."""
+        lower, upper = float(self.lower_limit[row]), float(self.upper_limit[row])
+        if target_to_wrapped_closest:
+            def angle_diff(a, b):
+                return ((a - b + math.pi) % (2 * math.pi) + 2 * math.pi) % (2 * math.pi) - math.pi
+
+            current = float(self.current_angle[row])
+            target_angle = current + math.atan2(math.sin(target_angle - current), math.cos(target_angle - current))
+            if not math.isnan(lower) and not math.isnan(upper) and (target_angle < lower or target_angle > upper):
+                if abs(angle_diff(lower, target_angle)) < abs(angle_diff(upper, target_angle)):
+                    target_angle = lower
+                else:
+                    target_angle = upper
+            if not math.isnan(lower):
+                target_angle = max(target_angle, lower)
+            if not math.isnan(upper):
+                target_angle = min(target_angle, upper)
+
+        self.motor_enabled[row] = True
+        self.motor_target_angle[row] = target_angle
+        if max_force is not None:
+            self.max_motor_force[row] = max_force
+        if freq is not None:
+            self.motor_freq[row] = freq
+        if damping_ratio is not None:
+            self.motor_damping_ratio[row] = damping_ratio
+
+
+class Contacts(ArrayTable):
+    """ContactConstraint rows, rebuilt every step by PhysWorld.detect_collisions."""
+
+    COLUMNS = {
+        "body_a": ((), np.int64, 0),
+        "body_b": ((), np.int64, 0),
+        "feature_id": ((), np.int64, 0),
+        "normal": ((2,), np.float64, 0.0),
+        "tangent": ((2,), np.float64, 0.0),
+        "penetration": ((), np.float64, 0.0),
+        "local_a": ((2,), np.float64, 0.0),
+        "local_b": ((2,), np.float64, 0.0),
+        "friction": ((), np.float64, 0.0),
+        "restitution": ((), np.float64, 0.0),
+        "acc_normal": ((), np.float64, 0.0),
+        "acc_friction": ((), np.float64, 0.0),
+        "relative_velocity": ((), np.float64, 0.0),
+        "is_reused": ((), np.bool_, False),
+    }
+
+
+def _soft_terms(settings: ConstraintSettings, soft: SoftSettings, dt: float) -> tuple[float, float, float]:
+    # (bias rate, mass scale, impulse scale) for the constraint mode
+    if settings.mode == "baumgarte":
+        return settings.baumgarte_factor / dt, 1.0, 0.0
+    if settings.mode == "soft":
+        params = soft_constraint_params(solver_hertz(soft.hertz, dt), soft.damping_ratio, dt)
+        return float(params.bias_rate), float(params.mass_scale), float(params.impulse_scale)
+    return 0.0, 1.0, 0.0
+
+
+def solve_sequential(
+    bodies: Bodies,
+    joints: Joints,
+    contacts: Contacts,
+    settings: ConstraintSettings,
+    dt: float,
+    iterations: int,
+) -> None:
+    """PhysWorld.solveConstraints, one constraint at a time in the JS order."""
+    warm = settings.warm_starting
+    vx, vy = bodies.velocity[:, 0].tolist(), bodies.velocity[:, 1].tolist()
+    w = bodies.angular_velocity.tolist()
+    im, ii = bodies.inv_mass.tolist(), bodies.inv_inertia.tolist()
+
+    # RevoluteConstraint.update
+    ja, jb = joints.body_a, joints.body_b
+    rA = rotate(joints.local_a, bodies.angle[ja])
+    rB = rotate(joints.local_b, bodies.angle[jb])
+    C = (bodies.position[jb] + rB - bodies.position[ja] - rA).tolist()
+    K = point_mass_matrix(rA, rB, bodies.inv_mass[ja], bodies.inv_mass[jb], bodies.inv_inertia[ja], bodies.inv_inertia[jb])
+    current = bodies.angle[jb] - bodies.angle[ja]
+    joints.current_angle = current
+    # NaN limits compare False, so missing limits never count as violated
+    with np.errstate(invalid="ignore"):
+        joints.angle_violation = np.where(
+            current < joints.lower_limit, current - joints.lower_limit,
+            np.where(current > joints.upper_limit, current - joints.upper_limit, 0.0),
+        )
+    has_limit = (~(np.isnan(joints.lower_limit) & np.isnan(joints.upper_limit))).tolist()
+    violation = joints.angle_violation.tolist()
+    ja, jb, rA, rB = ja.tolist(), jb.tolist(), rA.tolist(), rB.tolist()
+    k00, k01, k11 = K[:, 0, 0].tolist(), K[:, 0, 1].tolist(), K[:, 1, 1].tolist()
+    acc = joints.acc_impulse.tolist()
+    motor_enabled = joints.motor_enabled.tolist()
+    motor_speed, max_motor_force = joints.motor_speed.tolist(), joints.max_motor_force.tolist()
+    motor_target, motor_freq = joints.motor_target_angle.tolist(), joints.motor_freq.tolist()
+    motor_damping, current = joints.motor_damping_ratio.tolist(), current.tolist()
+
+    if warm:
+        for k in range(len(ja)):
+            a, b, (ax, ay), (bx, by), (px, py) = ja[k], jb[k], rA[k], rB[k], acc[k]
+            vx[a] -= px * im[a]; vy[a] -= py * im[a]; w[a] -= (ax * py - ay * px) * ii[a]
+            vx[b] += px * im[b]; vy[b] += py * im[b]; w[b] += (bx * py - by * px) * ii[b]
+
+    # ContactConstraint.update
+    ca, cb = contacts.body_a, contacts.body_b
+    crA = rotate(contacts.local_a, bodies.angle[ca])
+    crB = rotate(contacts.local_b, bodies.angle[cb])
+    em_n, em_t = contact_effective_masses(
+        crA, crB, contacts.normal, bodies.inv_mass[ca], bodies.inv_mass[cb], bodies.inv_inertia[ca], bodies.inv_inertia[cb]
+    )
+    ca, cb, crA, crB = ca.tolist(), cb.tolist(), crA.tolist(), crB.tolist()
+    em_n, em_t = em_n.tolist(), em_t.tolist()
+    normal, tangent = contacts.normal.tolist(), contacts.tangent.tolist()
+    penetration, friction = contacts.penetration.tolist(), contacts.friction.tolist()
+    acc_n, acc_t = contacts.acc_normal.tolist(), contacts.acc_friction.tolist()
+    rel_vel = [0.0] * len(ca)
+
+    for k in range(len(ca)):
+        a, b, (ax, ay), (bx, by), (nx, ny), (tx, ty) = ca[k], cb[k], crA[k], crB[k], normal[k], tangent[k]
+        # Relative normal velocity before warm starting, for restitution
+        rel_vel[k] = nx * (vx[b] - by * w[b] - vx[a] + ay * w[a]) + ny * (vy[b] + bx * w[b] - vy[a] - ax * w[a])
+        px, py = nx * acc_n[k] + tx * acc_t[k], ny * acc_n[k] + ty * acc_t[k]
+        vx[a] -= px * im[a]; vy[a] -= py * im[a]; w[a] -= ii[a] * (ax * py - ay * px)
+        vx[b] += px * im[b]; vy[b] += py * im[b]; w[b] += ii[b] * (bx * py - by * px)
+
+    j_rate, j_mass_scale, j_impulse_scale = _soft_terms(settings, settings.joint_soft, dt)
+    c_rate, c_mass_scale, c_impulse_scale = _soft_terms(settings, settings.contact_soft, dt)
+    max_bias_speed = settings.contact_speed if settings.mode == "soft" else math.inf
+
+    for _ in range(iterations):
+        for k in range(len(ja)):
+            a, b, (ax, ay), (bx, by) = ja[k], jb[k], rA[k], rB[k]
+            ma, mb, ia, ib = im[a], im[b], ii[a], ii[b]
+
+            # solvePointConstraint
+            cdx = vx[b] - by * w[b] - vx[a] + ay * w[a]
+            cdy = vy[b] + bx * w[b] - vy[a] - ax * w[a]
+            rhs_x = -(cdx + j_rate * C[k][0])
+            rhs_y = -(cdy + j_rate * C[k][1])
+            det = k00[k] * k11[k] - k01[k] * k01[k]
+            inv_det = 1.0 / det if det != 0 else 0.0
+            px = j_mass_scale * inv_det * (k11[k] * rhs_x - k01[k] * rhs_y) - j_impulse_scale * acc[k][0]
+            py = j_mass_scale * inv_det * (k00[k] * rhs_y - k01[k] * rhs_x) - j_impulse_scale * acc[k][1]
+            vx[a] -= px * ma; vy[a] -= py * ma; w[a] -= (ax * py - ay * px) * ia
+            vx[b] += px * mb; vy[b] += py * mb; w[b] += (bx * py - by * px) * ib
+            if warm:
+                acc[k][0] += px
+                acc[k][1] += py
+
+            inv_i = ia + ib
+
+            # solveMotor
+            if motor_enabled[k] and inv_i != 0:
+                rel = w[b] - w[a]
+                if not math.isnan(motor_target[k]):
+                    i_eff = 1 / inv_i
+                    omega = 2 * math.pi * motor_freq[k]
+                    stiff = i_eff * omega * omega
+                    damp = 2 * i_eff * motor_damping[k] * omega
+                    gamma = 1 / (dt * (damp + stiff * dt))
+                    motor_bias = (current[k] - motor_target[k]) * stiff * dt * gamma
+                    impulse = -(rel + motor_bias) / (inv_i + gamma)
+                else:
+                    impulse = (motor_speed[k] - rel) / inv_i
+                max_impulse = max_motor_force[k] * dt
+                impulse = min(max(impulse, -max_impulse), max_impulse)
+                w[a] -= ia * impulse
+                w[b] += ib * impulse
+
+            # solveAngleLimits
+            if has_limit[k] and violation[k] != 0 and inv_i >= 1e-6:
+                lam = -(j_mass_scale * (w[b] - w[a] + j_rate * violation[k])) / inv_i
+                lam = min(lam, 0.0) if violation[k] > 0 else max(lam, 0.0)
+                w[a] -= ia * lam
+                w[b] += ib * lam
+
+        for k in range(len(ca)):
+            a, b, (ax, ay), (bx, by) = ca[k], cb[k], crA[k], crB[k]
+            ma, mb, ia, ib = im[a], im[b], ii[a], ii[b]
+
+            # solveContact
+            em = em_n[k]
+            if em >= 1e-6:
+                nx, ny = normal[k]
+                cdot = nx * (vx[b] - by * w[b] - vx[a] + ay * w[a]) + ny * (vy[b] + bx * w[b] - vy[a] - ax * w[a])
+                bias = max(c_rate * min(0.0, -penetration[k] + SLOP_LINEAR), -max_bias_speed)
+                lam = -(c_mass_scale * cdot + bias) / em - c_impulse_scale * acc_n[k] / em
+                old = acc_n[k]
+                acc_n[k] = max(old + lam, 0.0)
+                lam = acc_n[k] - old
+                if lam != 0:
+                    px, py = nx * lam, ny * lam
+                    vx[a] -= px * ma; vy[a] -= py * ma; w[a] -= (ax * py - ay * px) * ia
+                    vx[b] += px * mb; vy[b] += py * mb; w[b] += (bx * py - by * px) * ib
+
+            # solveFriction
+            if friction[k] > 0 and em_t[k] >= 1e-6:
+                tx, ty = tangent[k]
+                cdot = tx * (vx[b] - by * w[b] - vx[a] + ay * w[a]) + ty * (vy[b] + bx * w[b] - vy[a] - ax * w[a])
+                lam = -cdot / em_t[k]
+                max_friction = friction[k] * acc_n[k]
+                old = acc_t[k]
+                acc_t[k] = max(-max_friction, min(old + lam, max_friction))
+                lam = acc_t[k] - old
+                px, py = tx * lam, ty * lam
+                vx[a] -= px * ma; vy[a] -= py * ma; w[a] -= (ax * py - ay * px) * ia
+                vx[b] += px * mb; vy[b] += py * mb; w[b] += (bx * py - by * px) * ib
+
+    # applyRestitution, only for new contacts that were approaching fast enough
+    restitution, is_reused = contacts.restitution.tolist(), contacts.is_reused.tolist()
+    for k in range(len(ca)):
+        e = restitution[k]
+        if e == 0 or is_reused[k] or rel_vel[k] > -RESTITUTION_THRESHOLD or em_n[k] < 1e-6:
+            continue
+        a, b, (ax, ay), (bx, by), (nx, ny) = ca[k], cb[k], crA[k], crB[k], normal[k]
+        vn = nx * (vx[b] - by * w[b] - vx[a] + ay * w[a]) + ny * (vy[b] + bx * w[b] - vy[a] - ax * w[a])
+        impulse = -(vn + e * rel_vel[k]) / em_n[k]
+        if impulse > 0:
+            px, py = nx * impulse, ny * impulse
+            vx[a] -= px * im[a]; vy[a] -= py * im[a]; w[a] -= (ax * py - ay * px) * ii[a]
+            vx[b] += px * im[b]; vy[b] += py * im[b]; w[b] += (bx * py - by * px) * ii[b]
+
+    # Only write the bodies these constraints move, so solves of disjoint islands can share one body table
+    touched = np.unique(np.concatenate([joints.body_a, joints.body_b, contacts.body_a, contacts.body_b]))
+    touched = touched[~bodies.is_static[touched]]
+    bodies.velocity[touched] = np.column_stack([vx, vy])[touched]
+    bodies.angular_velocity[touched] = np.array(w)[touched]
+    joints.acc_impulse = acc if acc else 0.0
+    contacts.acc_normal = acc_n
+    contacts.acc_friction = acc_t
+    contacts.relative_velocity = rel_vel
@@ -0,0 +1,88 @@
+"""Hash index over last step's contacts, keyed by (body A, body B, featureId).
+
+PhysWorld.detectCollisions in simple_phys.js hands the old ContactConstraints to
+checkCollision, which linearly searches them for every new point and splices
+out the match. Here the contact table of the previous step is indexed once in a
+dict, every new point is an O(1) lookup, and whatever is left unmatched is
+evicted when the new table replaces the old one. The accumulated impulses
+themselves stay in the Contacts table; the cache only maps keys to rows.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .constraints import Contacts
+
+
+@dataclass
+class CacheStats:
+    lookups: int = 0
+    hits: int = 0
+    evictions: int = 0
+    # Same counts for the most recent step only
+    step_lookups: int = 0
+    step_hits: int = 0
+    step_evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def step_hit_rate(self) -> float:
+        return self.step_hits / self.step_lookups if self.step_lookups else 0.0
+
+
+class ContactCache:
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled  # False: every contact starts cold, like an empty reuse list in the JS
+        self.stats = CacheStats()
+        self.contacts = Contacts(0)  # the table the stored rows point into
+        self._rows: dict[tuple[int, int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.contacts)
+
+    def store(self, contacts: Contacts) -> None:
+        """Index the contact table that the next step will match against."""
+        self.contacts = contacts
+        self._rows = {}
+        if not self.enabled:
+            return
+        keys = zip(contacts.body_a.tolist(), contacts.body_b.tolist(), contacts.feature_id.tolist())
+        for row, key in enumerate(keys):
+            # Same key twice: the earlier row is matched first, like the JS splice
+            self._rows.setdefault(key, []).append(row)
+
+    def match(self, body_a: np.ndarray, body_b: np.ndarray, feature_id: np.ndarray, retained: int = 0) -> np.ndarray:
+        """Row of each new point in the stored table, or -1 for a new contact.
+
+        Each stored row matches at most once; rows nobody matched are counted as
+        evicted, except for `retained` rows the caller carries over as they are
+        (the contacts of sleeping islands, which nobody looks up).
+        """
+        rows = self._rows
+        matched = []
+        for key in zip(body_a.tolist(), body_b.tolist(), feature_id.tolist()):
+            candidates = rows.get(key)
+            matched.append(candidates.pop(0) if candidates else -1)
+        matched = np.array(matched, dtype=np.int64)
+
+        stats = self.stats
+        stats.step_lookups = len(matched)
+        stats.step_hits = int((matched >= 0).sum())
+        stats.step_evictions = len(self.contacts) - retained - stats.step_hits
+        stats.lookups += stats.step_lookups
+        stats.hits += stats.step_hits
+        stats.evictions += stats.step_evictions
+        return matched
+
+    def impulses(self, body_a: int, body_b: int, feature_id: int) -> tuple[float, float] | None:
+        """(accumulated normal, accumulated friction) impulse stored for a contact, if cached."""
+        rows = self._rows.get((body_a, body_b, feature_id))
+        if not rows:
+            return None
+        return float(self.contacts.acc_normal[rows[0]]), float(self.contacts.acc_friction[rows[0]])
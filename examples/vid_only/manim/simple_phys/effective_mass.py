@@ -0,0 +1,81 @@
+"""Structure-of-arrays effective mass assembly for constraint points.
+
+Vectorised versions of what RevoluteConstraint.solvePointConstraint and
+ContactConstraint.solveContact/solveFriction compute per constraint in
+simple_phys.js. Every argument is an array over N constraint points:
+rA, rB and normal have shape (N, 2), inverse masses/inertias shape (N,).
+Static bodies simply have 0 inverse mass and inertia.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """2D cross product a.x * b.y - a.y * b.x along the last axis."""
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def rotate90cw(v: np.ndarray) -> np.ndarray:
+    """Vec2.rotate90CW, which is how contacts get their tangent from the normal."""
+    return np.stack([v[..., 1], -v[..., 0]], axis=-1)
+
+
+def point_mass_matrix(
+    rA: np.ndarray,
+    rB: np.ndarray,
+    inv_mass_a: np.ndarray,
+    inv_mass_b: np.ndarray,
+    inv_inertia_a: np.ndarray,
+    inv_inertia_b: np.ndarray,
+) -> np.ndarray:
+    """The revolute point constraint K matrix, shape (N, 2, 2).
+
+    K[0][0] = mA + mB + rA.y^2 iA + rB.y^2 iB
+    K[0][1] = K[1][0] = -rA.x rA.y iA - rB.x rB.y iB
+    K[1][1] = mA + mB + rA.x^2 iA + rB.x^2 iB
+    """
+    m = inv_mass_a + inv_mass_b
+    K = np.empty(np.broadcast_shapes(rA.shape, rB.shape)[:-1] + (2, 2), dtype=np.result_type(rA, rB, m))
+    K[..., 0, 0] = m + rA[..., 1] ** 2 * inv_inertia_a + rB[..., 1] ** 2 * inv_inertia_b
+    K[..., 0, 1] = -rA[..., 1] * rA[..., 0] * inv_inertia_a - rB[..., 1] * rB[..., 0] * inv_inertia_b
+    K[..., 1, 0] = K[..., 0, 1]
+    K[..., 1, 1] = m + rA[..., 0] ** 2 * inv_inertia_a + rB[..., 0] ** 2 * inv_inertia_b
+    return K
+
+
+def axis_effective_mass(
+    rA: np.ndarray,
+    rB: np.ndarray,
+    axis: np.ndarray,
+    inv_mass_a: np.ndarray,
+    inv_mass_b: np.ndarray,
+    inv_inertia_a: np.ndarray,
+    inv_inertia_b: np.ndarray,
+) -> np.ndarray:
+    """mA + mB + iA (rA x axis)^2 + iB (rB x axis)^2, i.e. axis . K . axis. Shape (N,)."""
+    rnA = cross(rA, axis)
+    rnB = cross(rB, axis)
+    return inv_mass_a + inv_mass_b + rnA * rnA * inv_inertia_a + rnB * rnB * inv_inertia_b
+
+
+def contact_effective_masses(
+    rA: np.ndarray,
+    rB: np.ndarray,
+    normal: np.ndarray,
+    inv_mass_a: np.ndarray,
+    inv_mass_b: np.ndarray,
+    inv_inertia_a: np.ndarray,
+    inv_inertia_b: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(normal, tangent) effective masses of contact points, like ContactConstraint.
+
+    These are the denominators of the impulse, not their inverse: solveContact
+    divides by them and skips points where they fall below 1e-6.
+    """
+    masses = (inv_mass_a, inv_mass_b, inv_inertia_a, inv_inertia_b)
+    return (
+        axis_effective_mass(rA, rB, normal, *masses),
+        axis_effective_mass(rA, rB, rotate90cw(normal), *masses),
+    )
@@ -0,0 +1,172 @@
+"""FABRIK inverse kinematics for a whole batch of chains at once.
+
+runFabrik in fabrik_demo.html (and IKChain._runFabrik in
+self_balancing_ragdoll.js) solves one chain: stretch straight at the target if
+it is out of reach, otherwise alternate a backward pass (effector pinned to the
+target) and a forward pass (base pinned back) until the effector is within
+tolerance or the iterations run out. Here every array has a leading batch axis
+and each pass loops over joints only, so a pass moves joint i of every chain in
+one NumPy call. Chains that have converged drop out of the active set, so late
+iterations only touch the stragglers, and every chain reports its own count.
+
+Chains of different lengths share a batch by padding with zero-length segments
+at the end: a zero-length segment just follows the joint before it.
+
+Joint limits mirror RevoluteConstraint's lower/upper angle limits: the angle of
+segment i relative to segment i - 1 (relative to base_angle for the root, the
+parent body's angle) is clamped after each move, the way IKChain applies
+applyConstraintsToSegment. NaN means no limit on that side, like a null limit.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+
+@dataclass
+class FabrikResult:
+    points: np.ndarray  # (B, J + 1, 2) solved joint positions, base first
+    iterations: np.ndarray  # (B,) backward/forward pass pairs run, 0 for out-of-reach targets
+    error: np.ndarray  # (B,) effector distance to the target
+    converged: np.ndarray  # (B,) error <= tolerance
+    reachable: np.ndarray  # (B,) target within the chain's total length
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    norm = np.abs(vector)
+    # Coincident joints (padding, or a target on a joint) keep pointing along +x
+    return np.where(norm > 0, vector / np.where(norm > 0, norm, 1.0), 1.0)
+
+
+@dataclass
+class _Chains:
+    """Joint j of every chain as row j of complex numbers x + iy, so a pass reads contiguous rows."""
+
+    joints: np.ndarray  # (J + 1, B) complex
+    lengths: np.ndarray  # (J, B)
+    lower: np.ndarray  # (J, B), NaN for no limit
+    upper: np.ndarray  # (J, B)
+    base_direction: np.ndarray  # (B,) unit complex, the root's parent frame
+    limited: list[bool]  # per segment: whether any chain limits it
+
+    def take(self, rows: np.ndarray) -> _Chains:
+        return _Chains(
+            self.joints[:, rows], self.lengths[:, rows], self.lower[:, rows], self.upper[:, rows],
+            self.base_direction[rows], self.limited,
+        )
+
+
+def _limit(chains: _Chains, i: int) -> None:
+    """Clamp segment i's angle relative to its parent, moving joint i + 1 if it was outside the limits."""
+    if not chains.limited[i]:
+        return
+    z = chains.joints
+    parent = chains.base_direction if i == 0 else _unit(z[i] - z[i - 1])
+    # Angle of the segment in its parent's frame, already wrapped like _shortDiff
+    relative = np.angle((z[i + 1] - z[i]) * np.conj(parent))
+    # fmax/fmin ignore NaN, so a missing limit leaves that side free
+    clamped = np.fmin(np.fmax(relative, chains.lower[i]), chains.upper[i])
+    moved = clamped != relative
+    if moved.any():
+        rotation = parent[moved] * np.exp(1j * clamped[moved])
+        z[i + 1, moved] = z[i, moved] + chains.lengths[i, moved] * rotation
+
+
+def _passes(chains: _Chains, target: np.ndarray, base: np.ndarray) -> None:
+    # One backward and one forward pass over every chain given, in place
+    z, lengths = chains.joints, chains.lengths
+    z[-1] = target
+    for i in range(len(lengths) - 1, -1, -1):
+        z[i] = z[i + 1] + _unit(z[i] - z[i + 1]) * lengths[i]
+        _limit(chains, i)
+    z[0] = base
+    for i in range(len(lengths)):
+        z[i + 1] = z[i] + _unit(z[i + 1] - z[i]) * lengths[i]
+        _limit(chains, i)
+
+
+def _iterate(chains: _Chains, target: np.ndarray, tolerance: float, max_iterations: int, active: np.ndarray) -> np.ndarray:
+    """Run FABRIK on the `active` chains until each is within tolerance. Returns per-chain iteration counts."""
+    z = chains.joints
+    iterations = np.zeros(z.shape[1], dtype=np.int64)
+    base = z[0].copy()
+    rows = np.flatnonzero(active)
+    for _ in range(max_iterations):
+        rows = rows[np.abs(z[-1, rows] - target[rows]) > tolerance]
+        if not len(rows):
+            break
+        # Work on a compact copy of the stragglers, then write it back
+        sub = chains.take(rows)
+        _passes(sub, target[rows], base[rows])
+        z[:, rows] = sub.joints
+        iterations[rows] += 1
+    return iterations
+
+
+def solve_fabrik(
+    points: np.ndarray,
+    targets: np.ndarray,
+    lower: np.ndarray | None = None,
+    upper: np.ndarray | None = None,
+    base_angle: np.ndarray | float = 0.0,
+    tolerance: float = 0.01,
+    max_iterations: int = 15,
+    mirror: bool = False,
+) -> FabrikResult:
+    """Solve B chains of J segments for their targets.
+
+    points is (B, J + 1, 2), each chain's current joints from base to
+    effector; segment lengths are taken from it. targets is (B, 2). lower and
+    upper are relative angle limits in radians: a scalar for every joint, (J,)
+    or (B, J). mirror also solves each chain reflected across its
+    base-to-target line and keeps whichever ends closer, as IKChain does to
+    escape bending the wrong way against a limit.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    batch, joints = points.shape[:2]
+    z = np.ascontiguousarray(points[..., 0].T) + 1j * points[..., 1].T
+    target = np.asarray(targets, dtype=np.float64) @ [1.0, 1j]
+    shape = (joints - 1, batch)
+
+    def limits(values):
+        if values is None:
+            return np.full(shape, np.nan)
+        values = np.asarray(values, dtype=np.float64)
+        # A scalar or (J,) applies to every chain; (B, J) is per chain
+        return np.broadcast_to(values.T if values.ndim == 2 else values.reshape(-1, 1), shape)
+
+    lower, upper = limits(lower), limits(upper)
+    limited = list(~(np.isnan(lower).all(axis=1) & np.isnan(upper).all(axis=1)))
+    base_direction = np.broadcast_to(np.exp(1j * np.asarray(base_angle, dtype=np.float64)), (batch,))
+    chains = _Chains(z, np.abs(np.diff(z, axis=0)), lower, upper, base_direction, limited)
+    reachable = np.abs(target - z[0]) <= chains.lengths.sum(axis=0)
+
+    far = np.flatnonzero(~reachable)
+    if len(far):
+        # Out of reach: lay the chain straight along the base-to-target direction
+        stretched = chains.take(far)
+        direction = _unit(target[far] - stretched.joints[0])
+        for i in range(joints - 1):
+            stretched.joints[i + 1] = stretched.joints[i] + direction * stretched.lengths[i]
+            _limit(stretched, i)
+        z[:, far] = stretched.joints
+
+    if mirror:
+        # flipChain: every joint of the starting pose reflected across the base-to-target line
+        axis = _unit(target - z[0])
+        flipped = replace(chains, joints=z[0] + axis**2 * np.conj(z - z[0]))
+        flipped_iterations = _iterate(flipped, target, tolerance, max_iterations, reachable)
+
+    iterations = _iterate(chains, target, tolerance, max_iterations, reachable)
+    error = np.abs(z[-1] - target)
+    if mirror:
+        flipped_error = np.abs(flipped.joints[-1] - target)
+        better = reachable & (flipped_error < error)
+        z[:, better] = flipped.joints[:, better]
+        iterations[better] = flipped_iterations[better]
+        error[better] = flipped_error[better]
+
+    solved = np.stack([z.real.T, z.imag.T], axis=-1)
+    return FabrikResult(solved, iterations, error, error <= tolerance, reachable)
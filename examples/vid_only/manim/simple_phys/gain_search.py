@@ -0,0 +1,191 @@
+"""Search StepController gains with headless rollouts on worker processes.
+
+Each rollout spawns one ragdoll on self_balancing_ragdoll.html's floor, runs
+the controller at 60 Hz over a fixed 240 Hz step for a few seconds (with a
+sideways push at the chest partway through, like holding D), and scores it:
+
+    value = upright_time - energy_weight * energy
+
+Upright means the pelvis is above upright_height over the floor and the chest
+within max_tilt of vertical. Energy is the positive work the joint motors do,
+from the servo torque each motor asks for, k (angle - target) + c (relative
+angular velocity) clamped to its max force, times the joints' relative angular
+velocity.
+
+A rollout stops early once it is hopeless: the ragdoll has been down for
+`patience` seconds (the controller has no way to get up again), or even staying
+upright for the rest of the run could not beat the score to beat. Scores are
+cached by (gains, rollout), in memory and optionally in a JSON file, so
+re-running a search only simulates gain sets it has not seen (or that gave up
+against a higher bar than the one asked for now).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import astuple, dataclass, fields, replace
+from pathlib import Path
+
+import numpy as np
+
+from .balance import BalanceGains, StepController
+from .ragdoll import Ragdoll, spawn_ragdoll
+from .rollout_pool import RolloutPool
+from .world import PhysWorld
+
+FLOOR_TOP = -3.0  # addBox(0, -6, 23, 6)
+
+
+@dataclass(frozen=True)
+class Rollout:
+    seconds: float = 8.0
+    dt: float = 1 / 240
+    control_every: int = 4  # substeps per StepController.update
+    push: float = 65.0  # the html's pushN, applied at the chest's end
+    push_start: float = 3.0
+    push_duration: float = 0.5
+    upright_height: float = 2.0  # pelvis above the floor
+    max_tilt: float = 0.5  # radians from vertical, chest
+    patience: float = 0.5  # seconds down before giving up
+    energy_weight: float = 0.002  # the JS gains spend about 450 in 8 s
+
+
+@dataclass(frozen=True)
+class Score:
+    value: float
+    upright_time: float
+    energy: float
+    simulated: float  # seconds actually rolled out
+    stopped: str = ""  # "" | "fell" | "hopeless"
+    to_beat: float = -math.inf  # the bar a hopeless rollout gave up against
+
+
+def _setup(gains: BalanceGains) -> tuple[PhysWorld, Ragdoll, StepController]:
+    world = PhysWorld()
+    floor = world.add_box(0, -6, 23, 6, is_static=True)
+    world.bodies.restitution[floor] = 0.0
+    world.bodies.friction[floor] = 1.0
+    ragdoll = spawn_ragdoll(world)
+    return world, ragdoll, StepController(world, ragdoll, gains)
+
+
+def motor_power(world: PhysWorld, rows: np.ndarray) -> float:
+    """Positive work per second done by the target-angle motors among joint `rows`."""
+    joints, bodies = world.joints, world.bodies
+    rows = rows[joints.motor_enabled[rows] & ~np.isnan(joints.motor_target_angle[rows])]
+    a, b = joints.body_a[rows], joints.body_b[rows]
+    inv_i = bodies.inv_inertia[a] + bodies.inv_inertia[b]
+    rel = bodies.angular_velocity[b] - bodies.angular_velocity[a]
+    i_eff = 1 / inv_i
+    omega = 2 * math.pi * joints.motor_freq[rows]
+    error = bodies.angle[b] - bodies.angle[a] - joints.motor_target_angle[rows]
+    torque = -(i_eff * omega * omega * error + 2 * i_eff * joints.motor_damping_ratio[rows] * omega * rel)
+    limit = joints.max_motor_force[rows]
+    return float(np.maximum(np.clip(torque, -limit, limit) * rel, 0.0).sum())
+
+
+def evaluate(gains: BalanceGains, rollout: Rollout = Rollout(), to_beat: float = -math.inf) -> Score:
+    """Roll out one gain set. Stops as soon as it cannot score above to_beat."""
+    world, ragdoll, controller = _setup(gains)
+    bodies, limbs = world.bodies, ragdoll.limbs
+    rows = np.fromiter(ragdoll.joints.values(), dtype=np.int64)
+    frame = rollout.dt * rollout.control_every
+    frames = round(rollout.seconds / frame)
+    if frames < 1:
+        raise ValueError(f"A {rollout.seconds} s rollout is shorter than one control frame ({frame} s)")
+    upright_time = energy = down = 0.0
+    stopped = ""
+    for k in range(frames):
+        time = k * frame
+        controller.update(frame)
+        if rollout.push_start <= time < rollout.push_start + rollout.push_duration:
+            # body.applyImpulse at the chest's end, horizontal
+            chest = limbs["chest"]
+            arm = controller._anchor("chest", "end") - bodies.position[chest]
+            impulse = rollout.push * frame
+            bodies.velocity[chest, 0] += impulse * bodies.inv_mass[chest]
+            bodies.angular_velocity[chest] -= arm[1] * impulse * bodies.inv_inertia[chest]
+        for _ in range(rollout.control_every):
+            world.step(rollout.dt, rollout.dt)
+            energy += motor_power(world, rows) * rollout.dt
+
+        pelvis_height = bodies.position[limbs["pelvis"], 1] - FLOOR_TOP
+        tilt = abs(math.remainder(bodies.angle[limbs["chest"]] - math.pi / 2, math.tau))
+        if pelvis_height > rollout.upright_height and tilt < rollout.max_tilt:
+            upright_time += frame
+            down = 0.0
+        else:
+            down += frame
+        remaining = (frames - k - 1) * frame
+        if down >= rollout.patience:
+            stopped = "fell"
+        elif upright_time + remaining - rollout.energy_weight * energy <= to_beat:
+            stopped = "hopeless"
+        if stopped:
+            break
+    simulated = (k + 1) * frame
+    value = upright_time - rollout.energy_weight * energy
+    return Score(value, upright_time, energy, simulated, stopped, to_beat)
+
+
+def _key(gains: BalanceGains, rollout: Rollout) -> str:
+    return json.dumps([astuple(gains), astuple(rollout)])
+
+
+class GainSearch(RolloutPool):
+    """Evaluates gain sets on `workers` processes, caching every score.
+
+        with GainSearch(workers=8, cache_path="gains.json") as search:
+            best, score, history = search.search(generations=10, population=32)
+    """
+
+    result_type = Score
+
+    def __init__(self, rollout: Rollout = Rollout(), workers: int | None = None, cache_path: str | Path | None = None) -> None:
+        self.rollout = rollout
+        super().__init__(workers, cache_path)
+
+    def evaluate(self, candidates: list[BalanceGains], to_beat: float = -math.inf) -> list[Score]:
+        """Scores in the order given. Uncached gain sets are rolled out in parallel."""
+        keys = [_key(gains, self.rollout) for gains in candidates]
+        self._roll_out(
+            evaluate,
+            {key: (gains, self.rollout, to_beat) for key, gains in zip(keys, candidates) if not self._cached(key, to_beat)},
+        )
+        return [self.cache[key] for key in keys]
+
+    def _cached(self, key: str, to_beat: float) -> bool:
+        # A rollout that gave up against a higher bar says nothing about a lower one
+        score = self.cache.get(key)
+        return score is not None and (score.stopped != "hopeless" or score.to_beat <= to_beat)
+
+    def search(
+        self,
+        initial: BalanceGains = BalanceGains(),
+        generations: int = 8,
+        population: int = 16,
+        spread: float = 0.3,
+        seed: int = 0,
+    ) -> tuple[BalanceGains, Score, list[Score]]:
+        """(1 + population) evolution: perturb every gain by a log-normal factor, keep the best.
+
+        Candidates only have to beat the current best, so the rest stop as soon
+        as they cannot. Returns the best gains, their score and the best score
+        after each generation.
+        """
+        rng = np.random.default_rng(seed)
+        best, (best_score,) = initial, self.evaluate([initial])
+        names = [f.name for f in fields(BalanceGains)]
+        history = [best_score]
+        for _ in range(generations):
+            factors = np.exp(spread * rng.standard_normal((population, len(names))))
+            candidates = [
+                replace(best, **{name: float(getattr(best, name) * f) for name, f in zip(names, row)}) for row in factors
+            ]
+            scores = self.evaluate(candidates, to_beat=best_score.value)
+            k = int(np.argmax([score.value for score in scores]))
+            if scores[k].value > best_score.value:
+                best, best_score = candidates[k], scores[k]
+            history.append(best_score)
+        return best, best_score, history
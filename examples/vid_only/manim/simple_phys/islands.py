@@ -0,0 +1,81 @@
+"""Constraint islands and sleeping (simple_phys.js has neither; Box2D-style rules).
+
+An island is a set of dynamic bodies linked through contacts or revolute
+joints. Static bodies never join islands, so everything resting on the same
+ground can still sleep separately. A body's sleep_time grows while its speed
+stays under the tolerances, and an island sleeps once every body in it has
+been slow for time_to_sleep. A sleeping island wakes as soon as an awake body
+touches it, since the contact puts them in the same island.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .bodies import Bodies
+
+
+@dataclass
+class SleepSettings:
+    enabled: bool = False  # off by default to keep PhysWorld's semantics
+    linear_tolerance: float = 0.05  # m/s
+    angular_tolerance: float = math.radians(2.0)  # rad/s
+    time_to_sleep: float = 0.5  # s
+
+
+def find_islands(count: int, is_static: np.ndarray, body_a: np.ndarray, body_b: np.ndarray) -> np.ndarray:
+    """Union-find over the (body_a, body_b) edges. Island label per body, -1 for static bodies.
+
+    Labels are the smallest body index in each island, so they don't depend on edge order.
+    """
+    parent = list(range(count))
+    static = is_static.tolist()
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    for a, b in zip(body_a.tolist(), body_b.tolist()):
+        if static[a] or static[b]:
+            continue
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    labels = np.array([find(i) for i in range(count)], dtype=np.int64)
+    labels[is_static] = -1
+    return labels
+
+
+def wake_islands(bodies: Bodies, labels: np.ndarray) -> None:
+    """Wake every island that has at least one awake dynamic body in it."""
+    dynamic = labels >= 0
+    awake_island = np.zeros(len(bodies), dtype=bool)
+    awake_island[labels[dynamic & bodies.awake]] = True
+    woken = dynamic & ~bodies.awake & awake_island[np.maximum(labels, 0)]
+    bodies.awake[woken] = True
+    bodies.sleep_time[woken] = 0.0
+
+
+def update_sleep(bodies: Bodies, labels: np.ndarray, settings: SleepSettings, dt: float) -> np.ndarray:
+    """Advance sleep timers and put resting islands to sleep. Returns the bodies put to sleep."""
+    active = bodies.awake & (labels >= 0)
+    speed_sq = (bodies.velocity ** 2).sum(axis=1)
+    resting = (speed_sq <= settings.linear_tolerance ** 2) & (
+        bodies.angular_velocity ** 2 <= settings.angular_tolerance ** 2
+    )
+    bodies.sleep_time[active] = np.where(resting[active], bodies.sleep_time[active] + dt, 0.0)
+
+    # The island sleeps on its least rested body
+    island_time = np.full(len(bodies), np.inf)
+    np.minimum.at(island_time, labels[active], bodies.sleep_time[active])
+    sleepy = active & (island_time[np.maximum(labels, 0)] >= settings.time_to_sleep)
+    bodies.awake[sleepy] = False
+    bodies.velocity[sleepy] = 0.0
+    bodies.angular_velocity[sleepy] = 0.0
+    return np.flatnonzero(sleepy)
@@ -0,0 +1,31 @@
+"""Batched 2x2 solves, the vectorised form of mat2x2Solve in simple_phys.js.
+
+K has shape (N, 2, 2) and b shape (N, 2). Like mat2x2Solve, a zero determinant
+gives a zero result instead of inf/nan, which is what we want for a joint
+between two static bodies.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def mat2x2_det(K: np.ndarray) -> np.ndarray:
+    return K[..., 0, 0] * K[..., 1, 1] - K[..., 0, 1] * K[..., 1, 0]
+
+
+def mat2x2_solve(K: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Solve K v = b for every stacked system using Cramer's rule."""
+    det = mat2x2_det(K)
+    inv_det = np.divide(1.0, det, out=np.zeros_like(det), where=det != 0)
+    out = np.empty(np.broadcast_shapes(b.shape, det.shape + (2,)), dtype=np.result_type(K, b))
+    out[..., 0] = inv_det * (K[..., 1, 1] * b[..., 0] - K[..., 0, 1] * b[..., 1])
+    out[..., 1] = inv_det * (K[..., 0, 0] * b[..., 1] - K[..., 1, 0] * b[..., 0])
+    return out
+
+
+def mat2x2_solve_scalar(K: list[list[float]], b: tuple[float, float]) -> tuple[float, float]:
+    """Line-by-line port of mat2x2Solve, used as the per-element reference."""
+    det = K[0][0] * K[1][1] - K[0][1] * K[1][0]
+    inv_det = 1.0 / det if det != 0 else 0
+    return (inv_det * (K[1][1] * b[0] - K[0][1] * b[1]), inv_det * (K[0][0] * b[1] - K[1][0] * b[0]))
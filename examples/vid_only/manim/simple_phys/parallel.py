@@ -0,0 +1,194 @@
+"""Constraint islands solved in parallel worker processes over shared memory.
+
+Islands only share static bodies, whose velocities the solver never changes, so
+the Gauss-Seidel passes of one island never see another island's impulses.
+IslandSolver splits the constraints into one bucket of whole islands per worker
+and runs solve_sequential on each bucket with the rows in their original order.
+Every body therefore gets exactly the float operations of a single
+solve_sequential over the whole world, and the result is bit-identical for any
+worker count.
+
+The tables are copied into one SharedMemory block that the workers map by name,
+so a solve only sends row indices through the pool, never body state. Each
+worker writes back the velocities of its own bodies and the impulses of its own
+constraint rows, which no other worker touches.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .bodies import Bodies
+from .constraints import ConstraintSettings, Contacts, Joints, solve_sequential
+from .islands import find_islands
+from .table import ArrayTable
+
+# (table, column, byte offset, row shape, dtype) for every column in the block
+Layout = tuple[tuple[str, str, int, tuple[int, ...], str], ...]
+
+_TABLES = {"bodies": Bodies, "joints": Joints, "contacts": Contacts}
+_attached: dict[str, SharedMemory] = {}  # per worker process
+
+
+def island_buckets(
+    bodies: Bodies, joints: Joints, contacts: Contacts, buckets: int
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Split the constraints into at most `buckets` groups of whole islands, (joint rows, contact rows) each.
+
+    Islands go largest first to the bucket with the fewest constraints so far,
+    ties broken by island label and bucket index, so the split only depends on
+    the constraints.
+    """
+    labels = find_islands(
+        len(bodies),
+        bodies.is_static,
+        np.concatenate([joints.body_a, contacts.body_a]),
+        np.concatenate([joints.body_b, contacts.body_b]),
+    )
+    # A static body is -1, so the max is the island of the dynamic body
+    island = np.maximum(
+        labels[np.concatenate([joints.body_a, contacts.body_a])],
+        labels[np.concatenate([joints.body_b, contacts.body_b])],
+    )
+    names, sizes = np.unique(island, return_counts=True)
+    order = np.lexsort((names, -sizes))
+
+    load = [(0, b) for b in range(min(buckets, len(names)))]
+    bucket_of = np.zeros(len(names), dtype=np.int64)
+    for k in order.tolist():
+        size, b = heapq.heappop(load)
+        bucket_of[k] = b
+        heapq.heappush(load, (size + int(sizes[k]), b))
+
+    row_bucket = bucket_of[np.searchsorted(names, island)]
+    joint_bucket, contact_bucket = row_bucket[: len(joints)], row_bucket[len(joints):]
+    return [
+        (np.flatnonzero(joint_bucket == b), np.flatnonzero(contact_bucket == b))
+        for b in range(len(load))
+    ]
+
+
+def _views(buffer, layout: Layout) -> dict[str, ArrayTable]:
+    columns: dict[str, dict[str, np.ndarray]] = {name: {} for name in _TABLES}
+    for table, column, offset, shape, dtype in layout:
+        columns[table][column] = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+    return {name: _TABLES[name].from_columns(columns[name]) for name in _TABLES}
+
+
+def _solve_bucket(
+    name: str,
+    layout: Layout,
+    joint_rows: np.ndarray,
+    contact_rows: np.ndarray,
+    settings: ConstraintSettings,
+    dt: float,
+    iterations: int,
+) -> None:
+    """Worker side: solve one bucket in place in the shared block."""
+    block = _attached.get(name)
+    if block is None:
+        # The parent replaced the block with a bigger one
+        for old in _attached.values():
+            old.close()
+        _attached.clear()
+        block = _attached[name] = SharedMemory(name)
+    tables = _views(block.buf, layout)
+    joints, contacts = tables["joints"].subset(joint_rows), tables["contacts"].subset(contact_rows)
+    solve_sequential(tables["bodies"], joints, contacts, settings, dt, iterations)
+    tables["joints"].update_rows(joint_rows, joints)
+    tables["contacts"].update_rows(contact_rows, contacts)
+    del tables  # the views must go before the block can be closed
+
+
+class IslandSolver:
+    """Drop-in for PhysWorld.solver that solves islands on `workers` processes.
+
+        world.solver = IslandSolver(workers=4)
+
+    Small solves (fewer than min_constraints constraints, or a single island) run
+    in-process, where the pool round trip would cost more than it saves. Call
+    close() (or use it as a context manager) to stop the workers and free the
+    shared block.
+    """
+
+    def __init__(self, workers: int | None = None, min_constraints: int = 256) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.min_constraints = min_constraints
+        self._pool: ProcessPoolExecutor | None = None
+        self._block: SharedMemory | None = None
+
+    def __call__(
+        self,
+        bodies: Bodies,
+        joints: Joints,
+        contacts: Contacts,
+        settings: ConstraintSettings,
+        dt: float,
+        iterations: int,
+    ) -> None:
+        if self.workers <= 1 or len(joints) + len(contacts) < self.min_constraints:
+            solve_sequential(bodies, joints, contacts, settings, dt, iterations)
+            return
+        buckets = island_buckets(bodies, joints, contacts, self.workers)
+        if len(buckets) <= 1:
+            solve_sequential(bodies, joints, contacts, settings, dt, iterations)
+            return
+
+        tables = {"bodies": bodies, "joints": joints, "contacts": contacts}
+        layout = self._share(tables)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        futures = [
+            self._pool.submit(_solve_bucket, self._block.name, layout, joint_rows, contact_rows, settings, dt, iterations)
+            for joint_rows, contact_rows in buckets
+        ]
+        for future in futures:
+            future.result()
+
+        shared = _views(self._block.buf, layout)
+        bodies.velocity = shared["bodies"].velocity
+        bodies.angular_velocity = shared["bodies"].angular_velocity
+        for name in ("joints", "contacts"):
+            for column, values in shared[name].columns().items():
+                setattr(tables[name], column, values)
+        del shared
+
+    def _share(self, tables: dict[str, ArrayTable]) -> Layout:
+        """Copy the live rows of every table into the shared block, growing it if needed."""
+        layout, values = [], []
+        size = 0
+        for name, table in tables.items():
+            for column, array in table.columns().items():
+                layout.append((name, column, size, array.shape, array.dtype.str))
+                values.append(array)
+                size += -(-array.nbytes // 8) * 8  # keep every column 8-byte aligned
+        if self._block is None or self._block.size < size:
+            self._release_block()
+            self._block = SharedMemory(create=True, size=max(2 * size, 1 << 16))
+
+        for (_, _, offset, shape, dtype), array in zip(layout, values):
+            np.ndarray(shape, dtype=dtype, buffer=self._block.buf, offset=offset)[...] = array
+        return tuple(layout)
+
+    def _release_block(self) -> None:
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._release_block()
+
+    def __enter__(self) -> IslandSolver:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,144 @@
+"""The ragdoll from self_balancing_ragdoll.js, built in a PhysWorld.
+
+Only the rig (Limb / Rig.addLimb and the limb list of spawnSelfBalancingRagdoll)
+is ported, with its joint limits and the servo targets set at spawn time. On
+its own the ragdoll collapses; balance.StepController keeps it standing. Every
+limb has collision mask and ignore bits 0x0F0000, so ragdolls only collide with
+other bodies, never with themselves or each other, and each one is its own
+constraint island.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .bodies import rotate
+from .world import PhysWorld
+
+LIMB_DENSITY = 2.5  # capsules only, circle limbs use density 1 like the JS
+RIG_COLLISION_BITS = 0x0F0000
+
+ELBOW_LIMIT = math.pi * 0.8
+HIP_RANGE = math.pi * 0.75
+KNEE_RANGE = math.pi * 0.8
+ANKLE_RANGE = math.pi * 0.65
+
+
+@dataclass
+class Ragdoll:
+    limbs: dict[str, int] = field(default_factory=dict)  # name -> body row
+    joints: dict[str, int] = field(default_factory=dict)  # child limb name -> joint row
+
+    @property
+    def bodies(self) -> np.ndarray:
+        return np.fromiter(self.limbs.values(), dtype=np.int64)
+
+
+def _anchor(world: PhysWorld, body: int, which: str) -> np.ndarray:
+    """Limb._localAnchor: a capsule's end circles, a circle's center."""
+    bodies = world.bodies
+    if bodies.shape_count[body] < 3:
+        return np.zeros(2)
+    return world.shapes.offset[bodies.shape_start[body] + (2 if which == "end" else 1)].copy()
+
+
+def add_limb(
+    world: PhysWorld,
+    ragdoll: Ragdoll,
+    name: str,
+    kind: str,
+    params: dict,
+    parent: str | None = None,
+    joint: dict | None = None,
+) -> int:
+    """Rig.addLimb. `params` and `joint` take the JS option names. Returns the body row."""
+    joint = joint or {}
+    x, y = params.get("x", 0.0), params.get("y", 0.0)
+    if kind == "capsule":
+        body = world.add_capsule(
+            x, y, params.get("length", 1.0), params.get("radiusA", 0.2), params.get("radiusB", 0.2), LIMB_DENSITY
+        )
+    elif kind == "circle":
+        body = world.add_circle(x, y, params.get("radius", 0.5), 1.0)
+    else:
+        raise ValueError(f"Invalid limb type {kind!r}")
+
+    bodies = world.bodies
+    bodies.restitution[body] = 0.0
+    bodies.friction[body] = 1.0
+    bodies.collision_mask[body] = RIG_COLLISION_BITS
+    bodies.collision_mask_ignore[body] = RIG_COLLISION_BITS
+    bodies.angle[body] = params.get("rotation", 0.0)
+    ragdoll.limbs[name] = body
+    if parent is None:
+        return body
+
+    parent_body = ragdoll.limbs[parent]
+    center = joint.get("center", 0.0)
+    if "rotation" not in params:
+        bodies.angle[body] = bodies.angle[parent_body] + center
+
+    # Place the limb so its anchor meets the parent's, plus the optional offset in the parent's frame
+    world_anchor = bodies.position[parent_body] + rotate(
+        _anchor(world, parent_body, joint.get("anchorA", "end")), bodies.angle[parent_body]
+    )
+    offset = np.array([params.get("offsetX", 0.0), params.get("offsetY", 0.0)])
+    bodies.position[body] = (
+        world_anchor
+        - rotate(_anchor(world, body, joint.get("anchorB", "start")), bodies.angle[body])
+        + rotate(offset, bodies.angle[parent_body])
+    )
+
+    lower = upper = None
+    if "limit" in joint:
+        half_span = joint["limit"] * 0.5
+        lower, upper = center - half_span, center + half_span
+    row = world.add_revolute_constraint(parent_body, body, tuple(world_anchor), lower, upper)
+    world.joints.current_angle[row] = bodies.angle[body] - bodies.angle[parent_body]
+    ragdoll.joints[name] = row
+    return body
+
+
+def spawn_ragdoll(world: PhysWorld, base_x: float = 0.0, base_y: float = 0.0) -> Ragdoll:
+    """spawnSelfBalancingRagdoll without the StepController.
+
+    Like the JS, the pelvis starts 1.46 above base_y and the splayed legs reach
+    about 1.7 below base_y, so spawn at least that high above the ground.
+    """
+    r = Ragdoll()
+    joints = world.joints
+    upright = math.pi / 2
+    add_limb(world, r, "pelvis", "capsule",
+             dict(x=base_x, y=base_y + 1.46, length=0.55, radiusA=0.30, radiusB=0.30, rotation=upright))
+    add_limb(world, r, "mid", "capsule", dict(length=0.55, radiusA=0.30, radiusB=0.30, rotation=upright),
+             "pelvis", dict(limit=math.pi / 6))
+    joints.set_motor_target_angle(r.joints["mid"], 0.0, 200, 100, 15, True)
+    add_limb(world, r, "chest", "capsule", dict(length=0.65, radiusA=0.3, radiusB=0.3, rotation=upright),
+             "mid", dict(limit=math.pi / 6))
+    joints.set_motor_target_angle(r.joints["chest"], 0.0, 200, 100, 15, True)
+    add_limb(world, r, "neck", "capsule", dict(length=0.68, radiusA=0.18, radiusB=0.18, rotation=upright),
+             "chest", dict(limit=0.0))
+    add_limb(world, r, "head", "circle", dict(radius=0.4), "neck", dict(limit=0.0, center=-math.pi / 2))
+
+    for side, rotation in (("r", math.pi * 1.3), ("l", math.pi * 1.7)):
+        add_limb(world, r, f"{side}_bicep", "capsule",
+                 dict(length=0.95, radiusA=0.22, radiusB=0.18, rotation=rotation), "chest")
+        add_limb(world, r, f"{side}_fore", "capsule", dict(length=1.05, radiusA=0.18, radiusB=0.14),
+                 f"{side}_bicep", dict(limit=ELBOW_LIMIT, center=ELBOW_LIMIT / 2))
+        add_limb(world, r, f"{side}_hand", "circle", dict(radius=0.21), f"{side}_fore", dict(limit=0.0))
+
+    for side, thigh, calf in (("r", math.pi * 1.6, math.pi * 1.5), ("l", math.pi * 1.4, math.pi * 1.3)):
+        add_limb(world, r, f"{side}_thigh", "capsule",
+                 dict(length=1.45, radiusA=0.3, radiusB=0.22, rotation=thigh),
+                 "pelvis", dict(anchorA="start", anchorB="start", limit=HIP_RANGE, center=math.pi))
+        add_limb(world, r, f"{side}_calf", "capsule",
+                 dict(length=1.45, radiusA=0.22, radiusB=0.16, rotation=calf),
+                 f"{side}_thigh", dict(limit=KNEE_RANGE, center=-math.pi / 2 + math.pi * 0.1))
+        add_limb(world, r, f"{side}_foot", "capsule",
+                 dict(length=0.70, radiusA=0.14, radiusB=0.10, offsetX=0.05, offsetY=-0.05),
+                 f"{side}_calf", dict(limit=ANKLE_RANGE, center=math.pi / 2))
+        joints.set_motor_target_angle(r.joints[f"{side}_foot"], math.pi * 0.5, 20, 10, 5, True)
+    return r
@@ -0,0 +1,189 @@
+"""Record a run once, then check other solver/collision backends against it.
+
+ReplayRecorder wraps a PhysWorld for the length of a run. It keeps a snapshot
+of the starting state, every step() call and every input the script pokes into
+the tables between steps (a motor speed, a kick to a body's velocity), and
+every `every` steps a rolling hash of the body state:
+
+    hash_k = blake2b(hash_(k-every) + position + velocity + angle + angular_velocity)
+
+Chaining means one matching hash vouches for every hashed state up to it.
+verify() replays the same log on a freshly restored world with another
+backend configured (IslandSolver, solve_coloured, the one-pair-at-a-time
+narrowphase, ...) and compares hashes as it goes. At the first mismatch it
+re-runs the reference from the last matching hash step by step next to the
+candidate, and reports the first step and body whose state differs, so
+"bit-identical" is a claim that can be tested rather than hoped for. Backends
+that are only meant to be close (a different solve order) report how far they
+drifted at that point instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import numpy as np
+
+from .snapshot import restore, snapshot
+from .world import PhysWorld
+
+STATE_COLUMNS = ("position", "velocity", "angle", "angular_velocity")
+
+
+def state_hash(world: PhysWorld, previous: bytes = b"") -> bytes:
+    """8-byte blake2b of the body state, chained onto `previous`."""
+    digest = hashlib.blake2b(previous, digest_size=8)
+    for name in STATE_COLUMNS:
+        digest.update(np.ascontiguousarray(getattr(world.bodies, name)).data)
+    return digest.digest()
+
+
+@dataclass
+class ReplayLog:
+    """Everything needed to re-run a recorded PhysWorld run. Plain data, so it pickles to workers."""
+
+    initial: bytes  # snapshot before the first step
+    every: int
+    calls: list[tuple[float, float, int]] = field(default_factory=list)  # step() arguments, one per step
+    inputs: dict[int, list[tuple[str, str, Any, Any]]] = field(default_factory=dict)  # step -> (table, column, rows, values)
+    hashes: dict[int, bytes] = field(default_factory=dict)  # step -> rolling hash after it
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+
+def _apply_inputs(world: PhysWorld, inputs: list[tuple[str, str, Any, Any]]) -> None:
+    for table, column, rows, values in inputs:
+        getattr(getattr(world, table), column)[rows] = values
+
+
+class ReplayRecorder:
+    """Steps a world and logs what is needed to replay and check it.
+
+        recorder = ReplayRecorder(world, every=10)
+        for step in range(steps):
+            if step == 120:
+                recorder.set("bodies", "velocity", kicked, (4.0, 0.0))
+            recorder.step(dt, dt)
+        log = recorder.log
+    """
+
+    def __init__(self, world: PhysWorld, every: int = 1) -> None:
+        self.world = world
+        self.log = ReplayLog(snapshot(world), every)
+        self._hash = b""
+        self._pending: list[tuple[str, str, Any, Any]] = []
+
+    def set(self, table: str, column: str, rows: Any, values: Any) -> None:
+        """world.<table>.<column>[rows] = values, logged to be applied at the same point on replay."""
+        values = np.array(values)
+        _apply_inputs(self.world, [(table, column, rows, values)])
+        self._pending.append((table, column, rows, values))
+
+    def step(self, time_elapsed_since_last_called: float = 0.0, dt: float = 1 / 240, max_steps: int = 10) -> int:
+        log = self.log
+        if self._pending:
+            log.inputs[len(log)] = self._pending
+            self._pending = []
+        log.calls.append((time_elapsed_since_last_called, dt, max_steps))
+        substeps = self.world.step(time_elapsed_since_last_called, dt, max_steps)
+        if len(log) % log.every == 0:
+            self._hash = state_hash(self.world, self._hash)
+            log.hashes[len(log)] = self._hash
+        return substeps
+
+
+@dataclass
+class Divergence:
+    step: int  # first step (1-based, after that many step() calls) whose state differs
+    body: int  # first body that differs at that step
+    column: str  # its state column with the largest difference
+    reference: np.ndarray
+    candidate: np.ndarray
+    max_difference: float  # over every body and state column at that step
+
+    def __str__(self) -> str:
+        return (
+            f"diverged at step {self.step}, body {self.body} {self.column}: "
+            f"{self.reference} vs {self.candidate} (max difference {self.max_difference:.3g})"
+        )
+
+
+def replay(log: ReplayLog, configure: Callable[[PhysWorld], None] | None = None, steps: int | None = None) -> PhysWorld:
+    """The world after the first `steps` (default all) of the log, with configure(world) applied before stepping."""
+    world = restore(log.initial)
+    if configure:
+        configure(world)
+    for index in range(len(log) if steps is None else steps):
+        _apply_inputs(world, log.inputs.get(index, []))
+        world.step(*log.calls[index])
+    return world
+
+
+def _first_difference(step: int, reference: PhysWorld, candidate: PhysWorld) -> Divergence | None:
+    differs = np.zeros(len(reference.bodies), dtype=bool)
+    gaps = {}
+    for name in STATE_COLUMNS:
+        a, b = getattr(reference.bodies, name), getattr(candidate.bodies, name)
+        gap = np.abs(a - b).reshape(len(a), -1).max(axis=1)
+        gaps[name] = gap
+        differs |= (a != b).reshape(len(a), -1).any(axis=1)
+    if not differs.any():
+        return None
+    body = int(np.argmax(differs))
+    column = max(STATE_COLUMNS, key=lambda name: gaps[name][body])
+    return Divergence(
+        step,
+        body,
+        column,
+        getattr(reference.bodies, column)[body].copy(),
+        getattr(candidate.bodies, column)[body].copy(),
+        float(max(gap.max() for gap in gaps.values())),
+    )
+
+
+def verify(
+    log: ReplayLog,
+    configure: Callable[[PhysWorld], None],
+    reference: Callable[[PhysWorld], None] | None = None,
+) -> Divergence | None:
+    """Replay `log` with configure(world) applied, and find where it first leaves the recording.
+
+    `reference` configures the re-run of the recorded backend for the
+    step-by-step search; the default restored world uses the default stages,
+    so pass it if the recording was made with anything else. None means every
+    recorded hash matched.
+    """
+    world = restore(log.initial)
+    configure(world)
+    rolling, matched_step, matched = b"", 0, log.initial
+    for index in range(len(log)):
+        _apply_inputs(world, log.inputs.get(index, []))
+        world.step(*log.calls[index])
+        expected = log.hashes.get(index + 1)
+        if expected is None:
+            continue
+        rolling = state_hash(world, rolling)
+        if rolling == expected:
+            matched_step, matched = index + 1, snapshot(world)
+            continue
+
+        # Somewhere in (matched_step, index + 1]: step both from the last agreed state. The body
+        # state there is bit-identical, so the candidate's snapshot stands in for the reference's
+        ref = restore(matched)
+        candidate = restore(matched)
+        if reference:
+            reference(ref)
+        configure(candidate)
+        for step in range(matched_step, index + 1):
+            for w in (ref, candidate):
+                _apply_inputs(w, log.inputs.get(step, []))
+                w.step(*log.calls[step])
+            divergence = _first_difference(step + 1, ref, candidate)
+            if divergence:
+                return divergence
+        raise ValueError(f"Hash mismatch at step {index + 1}, but the reference re-run agrees with the candidate; "
+                         "pass the recording's configuration as reference")
+    return None
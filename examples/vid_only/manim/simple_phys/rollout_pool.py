@@ -0,0 +1,71 @@
+"""Headless rollouts on worker processes, with every result cached by key.
+
+The plumbing shared by GainSearch and SettingsTuner. A subclass decides what
+a rollout is, how candidates are keyed and which cached results still answer
+the question being asked; RolloutPool runs the missing ones (in parallel when
+there are workers and more than one of them), keeps the results in memory and
+optionally in a JSON file, so re-running a search only simulates what it has
+not seen.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable
+
+
+class RolloutPool:
+    """Results are dataclasses of type `result_type`, each with a `simulated` field (seconds rolled out).
+
+    Call close() (or use it as a context manager) to stop the workers.
+    """
+
+    result_type: type
+
+    def __init__(self, workers: int | None = None, cache_path: str | Path | None = None) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache: dict[str, Any] = {}
+        self.simulated = 0.0  # seconds rolled out, cache hits excluded
+        self.rollouts = 0
+        self._pool: ProcessPoolExecutor | None = None
+        if self.cache_path and self.cache_path.exists():
+            self.cache = {key: self.result_type(**value) for key, value in json.loads(self.cache_path.read_text()).items()}
+
+    def _roll_out(self, function: Callable[..., Any], todo: dict[str, tuple]) -> None:
+        """function(*args) for every key -> args in todo, into the cache."""
+        if not todo:
+            return
+        if self.workers > 1 and len(todo) > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            futures = {key: self._pool.submit(function, *args) for key, args in todo.items()}
+            results = {key: future.result() for key, future in futures.items()}
+        else:
+            results = {key: function(*args) for key, args in todo.items()}
+        self.cache.update(results)
+        self.simulated += sum(result.simulated for result in results.values())
+        self.rollouts += len(results)
+        self._save()
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+        partial = self.cache_path.with_name(self.cache_path.name + ".partial")
+        partial.write_text(json.dumps({key: asdict(result) for key, result in self.cache.items()}))
+        os.replace(partial, self.cache_path)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
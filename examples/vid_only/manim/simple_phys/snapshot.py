@@ -0,0 +1,167 @@
+"""Whole-world checkpoints as one flat binary blob.
+
+snapshot(world) captures everything the next step depends on: every table
+(bodies, shapes, vertices, joints, contacts with their accumulated impulses),
+the contact cache's table and stats, gravity, the constraint, sleep and CCD
+settings, island labels, the step accumulator and the sweep-and-prune order.
+restore(blob) rebuilds a world from it that steps bit-identically to the one
+that was captured, so a scene can branch "what if warm starting were off" from
+any moment, and a long bake can write one now and then and resume from it
+after a crash.
+
+Layout (little endian, same scheme as trajectory.py):
+
+    magic        8 bytes, b"SPSNAP01"
+    header size  uint64
+    header       JSON: scalar state, plus dtype, shape and offset of each column
+    columns      every array back to back, each 64-byte aligned
+
+Restoring copies the column section once into a private buffer and wraps
+each column as a view into it (ArrayTable.from_columns), so the cost is one
+memcpy plus a few hundred nanoseconds per column, however many bodies there are. The
+swappable stages (broadphase, narrowphase, solver) are code, not state: a new
+world gets the defaults, and restoring into an existing world keeps its own.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import math
+import os
+import struct
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+
+from .bodies import Bodies, Shapes, Vertices
+from .broadphase import SweepAndPrune
+from .ccd import CCDSettings
+from .constraints import ConstraintSettings, Contacts, Joints, SoftSettings
+from .contact_cache import CacheStats
+from .islands import SleepSettings
+from .trajectory import _aligned
+from .world import PhysWorld
+
+MAGIC = b"SPSNAP01"
+_TABLES = {"bodies": Bodies, "shapes": Shapes, "vertices": Vertices, "joints": Joints, "contacts": Contacts}
+
+
+def _state_arrays(world: PhysWorld) -> dict[str, dict[str, np.ndarray]]:
+    # group -> column -> array; each table is a group, "cache" and "world" hold the rest
+    groups = {name: getattr(world, name).columns() for name in _TABLES}
+    cache = world.contact_cache
+    if cache.contacts is not world.contacts:
+        # Normally the same table (detect_collisions stores what it builds), so it's only written once
+        groups["cache"] = cache.contacts.columns()
+    groups["world"] = {"island_labels": world.island_labels}
+    if isinstance(world.broadphase, SweepAndPrune):
+        groups["world"]["sweep_order"] = world.broadphase.order
+    return groups
+
+
+def snapshot(world: PhysWorld) -> bytes:
+    """The world's full simulation state as one binary blob."""
+    groups = _state_arrays(world)
+    layout = {}
+    offset = 0
+    for group, arrays in groups.items():
+        layout[group] = []
+        for name, values in arrays.items():
+            layout[group].append([name, values.dtype.str, list(values.shape), offset])
+            offset = _aligned(offset + values.nbytes)
+    cache = world.contact_cache
+    header = {
+        "version": 1,
+        "gravity": world.gravity.tolist(),
+        "constraint_iterations": world.constraint_iterations,
+        "constraint_settings": asdict(world.constraint_settings),
+        "sleep": asdict(world.sleep),
+        "ccd": asdict(world.ccd),
+        "accumulator": world._accumulator,
+        "cache_enabled": cache.enabled,
+        "cache_stats": asdict(cache.stats),
+        "sweep_axis": getattr(world.broadphase, "axis", 0),
+        "layout": layout,
+    }
+    encoded = json.dumps(header).encode()
+    data_offset = _aligned(16 + len(encoded))
+
+    blob = bytearray(data_offset + offset)
+    blob[:16] = MAGIC + struct.pack("<Q", len(encoded))
+    blob[16: 16 + len(encoded)] = encoded
+    data = np.frombuffer(blob, np.uint8)
+    for group, arrays in groups.items():
+        for (_, _, _, start), values in zip(layout[group], arrays.values()):
+            start += data_offset
+            data[start: start + values.nbytes] = np.ascontiguousarray(values).reshape(-1).view(np.uint8)
+    return bytes(blob)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_header(encoded: bytes) -> tuple[dict, dict[str, list[tuple[str, np.dtype, int, int, tuple[int, ...]]]]]:
+    # Restoring the same checkpoint again (seeking, branching twice) skips the JSON parse
+    header = json.loads(encoded)
+    layout = {
+        group: [(name, np.dtype(dtype), math.prod(shape), offset, tuple(shape)) for name, dtype, shape, offset in columns]
+        for group, columns in header.pop("layout").items()
+    }
+    return header, layout
+
+
+def restore(blob: bytes | bytearray | memoryview, world: PhysWorld | None = None) -> PhysWorld:
+    """A world in the state `blob` was captured in.
+
+    With `world`, its state is overwritten in place (keeping its stages and
+    object identity, so generators and scenes holding it follow along);
+    otherwise a new PhysWorld is returned.
+    """
+    view = memoryview(blob)
+    if bytes(view[:8]) != MAGIC:
+        raise ValueError("Not a simple_phys snapshot")
+    (header_nbytes,) = struct.unpack_from("<Q", view, 8)
+    header, layout = _parse_header(bytes(view[16: 16 + header_nbytes]))
+    data = bytearray(view[_aligned(16 + header_nbytes):])
+
+    groups = {}
+    for group, columns in layout.items():
+        # frombuffer refuses an offset at the very end of the buffer, which an empty last column can have
+        groups[group] = {
+            name: np.frombuffer(data, dtype, count, offset).reshape(shape) if count else np.empty(shape, dtype)
+            for name, dtype, count, offset, shape in columns
+        }
+
+    world = world if world is not None else PhysWorld()
+    for name, table in _TABLES.items():
+        setattr(world, name, table.from_columns(groups[name]))
+    world.gravity = np.array(header["gravity"])
+    world.constraint_iterations = header["constraint_iterations"]
+    settings = header["constraint_settings"]
+    world.constraint_settings = ConstraintSettings(
+        **{**settings, "contact_soft": SoftSettings(**settings["contact_soft"]), "joint_soft": SoftSettings(**settings["joint_soft"])}
+    )
+    world.sleep = SleepSettings(**header["sleep"])
+    world.ccd = CCDSettings(**header.get("ccd", {}))
+    world._accumulator = header["accumulator"]
+    world.island_labels = groups["world"]["island_labels"]
+    if isinstance(world.broadphase, SweepAndPrune) and "sweep_order" in groups["world"]:
+        world.broadphase.axis, world.broadphase.order = header["sweep_axis"], groups["world"]["sweep_order"]
+
+    cache = world.contact_cache
+    cache.enabled = header["cache_enabled"]
+    cache.stats = CacheStats(**header["cache_stats"])
+    cache.store(Contacts.from_columns(groups["cache"]) if "cache" in groups else world.contacts)
+    return world
+
+
+def save_snapshot(world: PhysWorld, path: str | Path) -> None:
+    """Write snapshot(world) to path, atomically, so a crash mid-write never leaves a torn checkpoint."""
+    path = Path(path)
+    partial = path.with_suffix(path.suffix + ".partial")
+    partial.write_bytes(snapshot(world))
+    os.replace(partial, path)
+
+
+def load_snapshot(path: str | Path, world: PhysWorld | None = None) -> PhysWorld:
+    return restore(Path(path).read_bytes(), world)
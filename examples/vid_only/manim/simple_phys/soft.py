@@ -0,0 +1,203 @@
+"""Soft constraint parameters and their discrete response, over whole grids.
+
+soft_constraint_params is getSoftConstraintParams (Box2D's b2MakeSoft) on arrays.
+The response functions replay what one constraint does in PhysWorld.step along
+its axis, for every (hertz, dampingRatio, dt) grid point at once:
+
+- joint: RevoluteConstraint.solvePointConstraint. The body's mass cancels out,
+  so the 1-D state is (C, Cdot, accumulated impulse * invMass).
+- contact: ContactConstraint.solveContact against static ground under gravity,
+  with the clamp to pushing impulses, SLOP_LINEAR and contactSpeed.
+
+Both follow the JS order: gravity, warm start, C measured once at the start of
+the step, `iterations` solver passes, then position integration.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+SLOP_LINEAR = 0.002
+
+
+@dataclass
+class SoftParams:
+    bias_rate: np.ndarray
+    mass_scale: np.ndarray
+    impulse_scale: np.ndarray
+
+
+def soft_constraint_params(hertz: np.ndarray, damping_ratio: np.ndarray, time_step: np.ndarray) -> SoftParams:
+    """Vectorised getSoftConstraintParams; hertz == 0 gives all zeros like the JS."""
+    hertz, damping_ratio, time_step = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (hertz, damping_ratio, time_step))
+    )
+    omega = 2 * np.pi * hertz
+    a1 = 2 * damping_ratio + time_step * omega
+    a2 = time_step * omega * a1
+    a3 = 1 / (1 + a2)
+    off = hertz == 0
+    bias_rate = np.divide(omega, a1, out=np.zeros_like(omega), where=~off)
+    return SoftParams(bias_rate, np.where(off, 0.0, a2 * a3), np.where(off, 0.0, a3))
+
+
+def solver_hertz(hertz: np.ndarray, time_step: np.ndarray) -> np.ndarray:
+    """The solve() functions clamp stiffness to a quarter of the step rate."""
+    return np.minimum(hertz, 0.25 / np.asarray(time_step))
+
+
+@dataclass
+class ResponseSettings:
+    iterations: int = 10  # PhysWorld.constraintIterations
+    warm_starting: bool = True
+    horizon: float = 1.0  # seconds simulated per grid point
+    initial_error: float = 0.1  # joint: starting C; contact: starting penetration
+    gravity: float = 9.81  # contact only
+    contact_speed: float = 3.0  # constraintSettings.contactSpeed
+
+
+def joint_response(soft: SoftParams, dt: float, settings: ResponseSettings) -> np.ndarray:
+    """Positional error C over time, shape (steps + 1, *grid). C starts at initial_error, Cdot at 0."""
+    steps = int(round(settings.horizon / dt))
+    C = np.full(soft.bias_rate.shape, settings.initial_error)
+    v = np.zeros_like(C)
+    accumulated = np.zeros_like(C)
+    history = np.empty((steps + 1,) + C.shape)
+    history[0] = C
+
+    for i in range(1, steps + 1):
+        if settings.warm_starting:
+            v = v + accumulated
+        bias = soft.bias_rate * C
+        for _ in range(settings.iterations):
+            impulse = soft.mass_scale * -(v + bias) - soft.impulse_scale * accumulated
+            v = v + impulse
+            if settings.warm_starting:
+                accumulated = accumulated + impulse
+        C = C + v * dt
+        history[i] = C
+    return history
+
+
+def joint_step_matrix(soft: SoftParams, dt: float, settings: ResponseSettings) -> np.ndarray:
+    """The joint step as a linear map on (C, Cdot, accumulated), shape (*grid, 3, 3)."""
+    grid = soft.bias_rate.shape
+    columns = []
+    for basis in np.eye(3):
+        C, v, accumulated = (np.full(grid, value) for value in basis)
+        if settings.warm_starting:
+            v = v + accumulated
+        bias = soft.bias_rate * C
+        for _ in range(settings.iterations):
+            impulse = soft.mass_scale * -(v + bias) - soft.impulse_scale * accumulated
+            v = v + impulse
+            if settings.warm_starting:
+                accumulated = accumulated + impulse
+        columns.append(np.stack([C + v * dt, v, accumulated], axis=-1))
+    return np.stack(columns, axis=-1)
+
+
+def contact_response(soft: SoftParams, dt: float, settings: ResponseSettings) -> np.ndarray:
+    """Separation over time (negative = penetrating), starting at -initial_error at rest."""
+    steps = int(round(settings.horizon / dt))
+    separation = np.full(soft.bias_rate.shape, -settings.initial_error)
+    v = np.zeros_like(separation)
+    accumulated = np.zeros_like(separation)
+    history = np.empty((steps + 1,) + separation.shape)
+    history[0] = separation
+
+    for i in range(1, steps + 1):
+        v = v - settings.gravity * dt
+        # Contacts only exist while within the speculative slop, a new contact starts from zero impulse
+        touching = separation <= SLOP_LINEAR
+        accumulated = np.where(touching, accumulated, 0.0)
+        v = v + accumulated
+        bias = np.maximum(soft.bias_rate * np.minimum(0.0, separation + SLOP_LINEAR), -settings.contact_speed)
+        for _ in range(settings.iterations):
+            impulse = -(soft.mass_scale * v + bias) - soft.impulse_scale * accumulated
+            new_accumulated = np.where(touching, np.maximum(accumulated + impulse, 0.0), 0.0)
+            v = v + (new_accumulated - accumulated)
+            accumulated = new_accumulated
+        separation = separation + v * dt
+        history[i] = separation
+    return history
+
+
+@dataclass
+class StabilityGrid:
+    hertz: list[float]
+    damping_ratio: list[float]
+    dt: list[float]
+    settings: ResponseSettings = field(default_factory=ResponseSettings)
+
+    def key(self, mode: str) -> str:
+        payload = json.dumps({"mode": mode, **asdict(self)}, sort_keys=True)
+        return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def _settle_time(error: np.ndarray, dt: float, tolerance: float) -> np.ndarray:
+    # First time after which |error| stays within tolerance, inf if it never does
+    outside = np.abs(error) > tolerance
+    last_outside = outside.shape[0] - 1 - np.argmax(outside[::-1], axis=0)
+    settled = ~outside[-1]
+    return np.where(settled, np.where(outside.any(axis=0), (last_outside + 1) * dt, 0.0), np.inf)
+
+
+def compute_stability_map(grid: StabilityGrid, mode: str) -> dict[str, np.ndarray]:
+    """Arrays of shape (len(dt), len(hertz), len(damping_ratio)).
+
+    joint: bias_rate, mass_scale, impulse_scale, spectral_radius (< 1 is stable),
+    overshoot (fraction of the initial error crossed past zero), settle_time.
+    contact: the same without spectral_radius; overshoot is the pop-out height
+    above the surface as a fraction of the initial penetration.
+    """
+    if mode not in ("joint", "contact"):
+        raise ValueError(f"Unknown soft constraint mode: {mode}")
+    settings = grid.settings
+    hertz, damping = np.meshgrid(np.asarray(grid.hertz), np.asarray(grid.damping_ratio), indexing="ij")
+    shape = (len(grid.dt),) + hertz.shape
+    out = {name: np.empty(shape) for name in ("bias_rate", "mass_scale", "impulse_scale", "overshoot", "settle_time")}
+    if mode == "joint":
+        out["spectral_radius"] = np.empty(shape)
+
+    for i, dt in enumerate(grid.dt):
+        soft = soft_constraint_params(solver_hertz(hertz, dt), damping, dt)
+        out["bias_rate"][i], out["mass_scale"][i], out["impulse_scale"][i] = soft.bias_rate, soft.mass_scale, soft.impulse_scale
+        tolerance = 0.02 * settings.initial_error
+        with np.errstate(over="ignore", invalid="ignore"):
+            if mode == "joint":
+                out["spectral_radius"][i] = np.abs(np.linalg.eigvals(joint_step_matrix(soft, dt, settings))).max(axis=-1)
+                error = joint_response(soft, dt, settings)
+                out["overshoot"][i] = np.maximum(0.0, -error.min(axis=0)) / settings.initial_error
+            else:
+                error = contact_response(soft, dt, settings)
+                out["overshoot"][i] = np.maximum(0.0, error.max(axis=0)) / settings.initial_error
+                # Resting contact settles within the slop, not at exactly zero
+                error = error + SLOP_LINEAR
+            error = np.where(np.isfinite(error), error, np.inf)
+            out["settle_time"][i] = _settle_time(error, dt, tolerance)
+    return out
+
+
+def load_or_compute_stability_map(grid: StabilityGrid, mode: str, cache_dir: Path) -> dict[str, np.ndarray]:
+    """compute_stability_map, cached as one memory-mapped .npy per array under cache_dir/<key>/."""
+    folder = Path(cache_dir) / f"soft_{mode}_{grid.key(mode)}"
+    done = folder / "done"
+    if done.exists():
+        return {path.stem: np.load(path, mmap_mode="r") for path in folder.glob("*.npy")}
+
+    folder.mkdir(parents=True, exist_ok=True)
+    result = {}
+    for name, values in compute_stability_map(grid, mode).items():
+        mapped = np.lib.format.open_memmap(folder / f"{name}.npy", mode="w+", dtype=values.dtype, shape=values.shape)
+        mapped[:] = values
+        mapped.flush()
+        result[name] = np.load(folder / f"{name}.npy", mmap_mode="r")
+    (folder / "grid.json").write_text(json.dumps({"mode": mode, **asdict(grid)}, indent=2))
+    done.touch()
+    return result
@@ -0,0 +1,135 @@
+"""Stepping a PhysWorld on demand while a scene renders, in bounded memory.
+
+Baking a trajectory first (see trajectory.py) holds or writes every step before
+the first frame is drawn. A SimulationStream instead advances the world only as
+far as the latest sample() call needs, through a small pipeline:
+
+    simulate(world)  ->  look-ahead window  ->  sample(time)  ->  mobject updater
+
+simulate is a generator of frames, one per fixed step. The stream keeps a
+window of `lookahead` frames around the latest request, half of them already
+simulated ahead of it, so samples slightly in the past and updaters peeking a
+few steps ahead (window()) are served without stepping. Seeking backwards
+restores the nearest checkpoint (a snapshot of the world taken every
+checkpoint_interval seconds, see snapshot.py) into the same world object and
+fast-forwards from there; PhysWorld is deterministic, so the replayed frames
+are identical to the first pass. Once there are more than max_checkpoints,
+every other one is dropped and the interval doubles, so memory stays bounded
+however long the scene runs.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from .bodies import Bodies, Shapes, Vertices
+from .snapshot import restore, snapshot
+from .world import PhysWorld
+
+
+class Frame(NamedTuple):
+    step: int
+    time: float
+    position: np.ndarray  # (N, 2), copies
+    angle: np.ndarray  # (N,)
+
+
+def simulate(world: PhysWorld, dt: float = 1 / 240, start_step: int = 0) -> Iterator[Frame]:
+    """Frames of world forever, one per fixed step. The world is at the yielded frame's state while paused."""
+    step = start_step
+    while True:
+        bodies = world.bodies
+        yield Frame(step, step * dt, bodies.position.copy(), bodies.angle.copy())
+        world.step(dt, dt)
+        step += 1
+
+
+class SimulationStream:
+    """Lazily simulated world that scenes sample by time, like a TrajectoryFile."""
+
+    def __init__(
+        self,
+        world: PhysWorld,
+        dt: float = 1 / 240,
+        lookahead: int = 16,
+        checkpoint_interval: float = 2.0,
+        max_checkpoints: int = 32,
+        duration: float = math.inf,
+    ) -> None:
+        self.world = world
+        self.dt = dt
+        self.lookahead = max(lookahead, 2)
+        self.max_checkpoints = max_checkpoints
+        self.duration = duration  # sample() clamps to it, inf for an open-ended scene
+        self.steps_simulated = 0  # including replays after seeking back
+        self._interval = max(int(round(checkpoint_interval / dt)), 1)  # in steps
+        self._checkpoints = {0: snapshot(world)}
+        self._window: deque[Frame] = deque(maxlen=self.lookahead)
+        self._frames = simulate(world, dt)
+        self._pull(stepped=False)
+
+    # Same static tables as a TrajectoryFile, for TrajectoryPlayback
+    @property
+    def bodies(self) -> Bodies:
+        return self.world.bodies
+
+    @property
+    def shapes(self) -> Shapes:
+        return self.world.shapes
+
+    @property
+    def vertices(self) -> Vertices:
+        return self.world.vertices
+
+    @property
+    def body_count(self) -> int:
+        return len(self.world.bodies)
+
+    @property
+    def checkpoints(self) -> list[int]:
+        return sorted(self._checkpoints)
+
+    def window(self) -> list[Frame]:
+        """The buffered frames, oldest first."""
+        return list(self._window)
+
+    def frame(self, step: int) -> Frame:
+        """The frame of one step, simulating (or seeking back) as needed."""
+        if step < self._window[0].step:
+            self._seek(step)
+        while self._window[-1].step < step + self.lookahead // 2:
+            self._pull()
+        return self._window[step - self._window[0].step]
+
+    def sample(self, time: float) -> tuple[np.ndarray, np.ndarray]:
+        """(positions (N, 2), angles (N,)) at `time`, linear between the two neighbouring steps."""
+        u = min(max(time, 0.0), self.duration) / self.dt
+        i = int(u)
+        alpha = u - i
+        a = self.frame(i)
+        if alpha == 0.0:
+            return a.position, a.angle
+        b = self.frame(i + 1)
+        return (1 - alpha) * a.position + alpha * b.position, (1 - alpha) * a.angle + alpha * b.angle
+
+    def _pull(self, stepped: bool = True) -> None:
+        frame = next(self._frames)
+        self.steps_simulated += stepped
+        if frame.step % self._interval == 0 and frame.step not in self._checkpoints:
+            self._checkpoints[frame.step] = snapshot(self.world)
+            if len(self._checkpoints) > self.max_checkpoints:
+                self._interval *= 2
+                self._checkpoints = {s: w for s, w in self._checkpoints.items() if s % self._interval == 0}
+        self._window.append(frame)
+
+    def _seek(self, step: int) -> None:
+        """Restart from the latest checkpoint at or before `step`."""
+        start = max(s for s in self._checkpoints if s <= step)
+        restore(self._checkpoints[start], self.world)
+        self._frames = simulate(self.world, self.dt, start)
+        self._window.clear()
+        self._pull(stepped=False)
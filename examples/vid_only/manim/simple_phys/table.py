@@ -0,0 +1,102 @@
+"""Growable structure-of-arrays storage shared by bodies, shapes and constraints."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+class ArrayTable:
+    """Named columns with a common row count, grown by doubling.
+
+    Subclasses list their columns as name -> (per-row shape, dtype, default).
+    Reading a column gives a writable view of the live rows, so
+    `bodies.velocity[i] += impulse` works like on a plain array.
+    """
+
+    COLUMNS: dict[str, tuple[tuple[int, ...], Any, Any]] = {}
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.count = 0
+        self._data = {
+            name: np.full((capacity,) + shape, default, dtype=dtype)
+            for name, (shape, dtype, default) in self.COLUMNS.items()
+        }
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, np.ndarray]) -> ArrayTable:
+        """A table over existing full-length column arrays (e.g. views into shared memory), without copying."""
+        table = cls.__new__(cls)
+        table.count = len(next(iter(columns.values()))) if columns else 0
+        table._data = dict(columns)
+        return table
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        data = self.__dict__.get("_data")
+        if data is not None and name in data:
+            return data[name][: self.count]
+        raise AttributeError(f"{type(self).__name__} has no column {name!r}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in type(self).COLUMNS:
+            self._data[name][: self.count] = value
+        else:
+            super().__setattr__(name, value)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, rows: int) -> None:
+        capacity = len(next(iter(self._data.values())))
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, 2 * capacity)
+        for name, (shape, dtype, default) in self.COLUMNS.items():
+            grown = np.full((new_capacity,) + shape, default, dtype=dtype)
+            grown[: self.count] = self._data[name][: self.count]
+            self._data[name] = grown
+
+    def append(self, **values: Any) -> int:
+        """Add one row; missing columns take their default. Returns the row index."""
+        self._reserve(self.count + 1)
+        row = self.count
+        self.count += 1
+        for name, value in values.items():
+            self._data[name][row] = value
+        return row
+
+    def extend(self, rows: int, **values: Any) -> np.ndarray:
+        """Add `rows` rows at once from column arrays. Returns the new row indices."""
+        self._reserve(self.count + rows)
+        start = self.count
+        self.count += rows
+        for name, value in values.items():
+            self._data[name][start: self.count] = value
+        return np.arange(start, self.count)
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def take(self, rows: np.ndarray) -> None:
+        """Keep only `rows` (indices or boolean mask), in that order."""
+        for name in self.COLUMNS:
+            kept = self._data[name][: self.count][rows]
+            self._data[name][: len(kept)] = kept
+        self.count = len(kept) if self.COLUMNS else 0
+
+    def subset(self, rows: np.ndarray) -> ArrayTable:
+        """A new table of the same type holding copies of `rows`."""
+        rows = np.asarray(rows)
+        count = int(rows.sum()) if rows.dtype == bool else len(rows)
+        other = type(self)(max(count, 1))
+        other.extend(count, **{name: column[rows] for name, column in self.columns().items()})
+        return other
+
+    def update_rows(self, rows: np.ndarray, other: ArrayTable) -> None:
+        """Write every column of `other` back into `rows`, the inverse of subset."""
+        for name, column in other.columns().items():
+            self._data[name][: self.count][rows] = column
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: self._data[name][: self.count] for name in self.COLUMNS}
@@ -0,0 +1,218 @@
+"""Baked PhysWorld runs as one flat binary file that readers memory-map.
+
+Layout (little endian, every section 64-byte aligned):
+
+    magic        8 bytes, b"SPTRAJ01"
+    header size  uint64
+    header       JSON: dt, sample dtype, body count, section offsets and column dtypes
+    body table   the world's Bodies, Shapes and Vertices rows when recording started
+    steps        one fixed-size record per recorded step:
+                 time (float64), position (N, 2), angle (N,), velocity (N, 2)
+
+Within a step the arrays are columnar, so one step (or one column over a range
+of steps) is a contiguous read. Samples are float64 or float32; float32 halves
+the file and is still sub-micrometre for scene-sized worlds. Readers never load
+the steps: TrajectoryFile maps them read-only, so any number of render worker
+processes share the same pages through the OS cache, and pickling a
+TrajectoryFile only sends its path.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+from .bodies import Bodies, Shapes, Vertices
+from .table import ArrayTable
+from .world import PhysWorld
+
+MAGIC = b"SPTRAJ01"
+ALIGN = 64
+STEP_FIELDS = {"position": (2,), "angle": (), "velocity": (2,)}
+_TABLES = {"bodies": Bodies, "shapes": Shapes, "vertices": Vertices}
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGN) * ALIGN
+
+
+def step_dtype(body_count: int, sample_dtype: np.dtype) -> np.dtype:
+    fields = [("time", "<f8")]
+    fields += [(name, sample_dtype, (body_count,) + shape) for name, shape in STEP_FIELDS.items()]
+    return np.dtype(fields)
+
+
+def _table_record(table: ArrayTable) -> np.ndarray:
+    """An ArrayTable's live rows as one structured array."""
+    columns = table.columns()
+    dtype = np.dtype([(name, column.dtype, column.shape[1:]) for name, column in columns.items()])
+    record = np.empty(len(table), dtype=dtype)
+    for name, column in columns.items():
+        record[name] = column
+    return record
+
+
+def _column_spec(dtype: np.dtype) -> list:
+    # JSON-friendly [[name, dtype, shape], ...]
+    return [[name, dtype[name].base.str, list(dtype[name].shape)] for name in dtype.names]
+
+
+def _dtype_from_spec(spec: list) -> np.dtype:
+    return np.dtype([(name, base, tuple(shape)) for name, base, shape in spec])
+
+
+class TrajectoryWriter:
+    """Appends one step record per call; the file is complete after every append.
+
+        with TrajectoryWriter(path, world, dt=1 / 240) as writer:
+            for _ in range(steps):
+                world.step(dt, dt)
+                writer.append(world)
+
+    The body table and the first step (time 0) are written on construction.
+    """
+
+    def __init__(self, path: str | Path, world: PhysWorld, dt: float, dtype: np.dtype | type = np.float64) -> None:
+        self.path = Path(path)
+        self.body_count = len(world.bodies)
+        self.sample_dtype = np.dtype(dtype).newbyteorder("<")
+        self.step_dtype = step_dtype(self.body_count, self.sample_dtype)
+        self.steps = 0
+        self.dt = dt
+
+        records = {name: _table_record(getattr(world, name)) for name in _TABLES}
+        header = {
+            "version": 1,
+            "dt": dt,
+            "sample_dtype": self.sample_dtype.str,
+            "body_count": self.body_count,
+            "tables": {},
+            "steps_offset": 0,
+            "step_nbytes": self.step_dtype.itemsize,
+        }
+        # Section offsets depend on the header size, so lay out with a generous guess and grow it until stable
+        header_nbytes = 4096
+        while True:
+            offset = _aligned(16 + header_nbytes)
+            for name, record in records.items():
+                header["tables"][name] = {"offset": offset, "count": len(record), "columns": _column_spec(record.dtype)}
+                offset = _aligned(offset + record.nbytes)
+            header["steps_offset"] = offset
+            encoded = json.dumps(header).encode()
+            if len(encoded) <= header_nbytes:
+                break
+            header_nbytes = _aligned(len(encoded))
+
+        self._file: BinaryIO = open(self.path, "wb")
+        self._file.write(MAGIC + struct.pack("<Q", header_nbytes) + encoded.ljust(header_nbytes))
+        for name, record in records.items():
+            self._file.seek(header["tables"][name]["offset"])
+            self._file.write(record.tobytes())
+        self._file.seek(header["steps_offset"])
+        self._file.truncate()
+        self.append(world)
+
+    def append(self, world: PhysWorld) -> None:
+        """Record the world's current state, `dt` after the previous record."""
+        bodies = world.bodies
+        if len(bodies) != self.body_count:
+            raise ValueError(f"Trajectory has {self.body_count} bodies, the world now has {len(bodies)}")
+        record = np.empty(1, dtype=self.step_dtype)
+        record["time"] = self.steps * self.dt
+        for name in STEP_FIELDS:
+            record[name] = getattr(bodies, name)
+        self._file.write(record.tobytes())
+        self.steps += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> TrajectoryWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def record_trajectory(
+    world: PhysWorld,
+    path: str | Path,
+    duration: float,
+    dt: float = 1 / 240,
+    every: int = 1,
+    dtype: np.dtype | type = np.float64,
+) -> TrajectoryFile:
+    """Bake `duration` seconds of world at the fixed step dt, storing every `every`-th step."""
+    steps = int(round(duration / dt))
+    with TrajectoryWriter(path, world, dt * every, dtype) as writer:
+        for step in range(1, steps + 1):
+            world.step(dt, dt)
+            if step % every == 0:
+                writer.append(world)
+    return TrajectoryFile(path)
+
+
+class TrajectoryFile:
+    """Read-only view of a trajectory file. Step columns are memory-mapped, never loaded whole."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            if f.read(8) != MAGIC:
+                raise ValueError(f"{self.path} is not a simple_phys trajectory")
+            (header_nbytes,) = struct.unpack("<Q", f.read(8))
+            self.header = json.loads(f.read(header_nbytes))
+
+        self.dt: float = self.header["dt"]
+        self.body_count: int = self.header["body_count"]
+        self.sample_dtype = np.dtype(self.header["sample_dtype"])
+        size = self.path.stat().st_size
+        offset, nbytes = self.header["steps_offset"], self.header["step_nbytes"]
+        # A writer that is still running may have left a partial record at the end
+        count = max(size - offset, 0) // nbytes
+        dtype = step_dtype(self.body_count, self.sample_dtype)
+        # np.memmap can't map zero bytes
+        self.steps = np.memmap(self.path, dtype, mode="r", offset=offset, shape=(count,)) if count else np.empty(0, dtype)
+
+        for name, table in _TABLES.items():
+            spec = self.header["tables"][name]
+            record = np.fromfile(self.path, dtype=_dtype_from_spec(spec["columns"]), count=spec["count"], offset=spec["offset"])
+            setattr(self, name, table.from_columns({column: record[column] for column in record.dtype.names}))
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __reduce__(self):
+        # Worker processes reopen (and re-map) the file instead of receiving its contents
+        return type(self), (self.path,)
+
+    @property
+    def duration(self) -> float:
+        return float(self.steps["time"][-1]) if len(self) else 0.0
+
+    def column(self, name: str) -> np.ndarray:
+        """One step column over all steps, e.g. column("position") has shape (steps, N, 2). A mapped view."""
+        return self.steps[name]
+
+    def sample(self, time: float) -> tuple[np.ndarray, np.ndarray]:
+        """(positions (N, 2), angles (N,)) at any time, linear between the two nearest recorded steps.
+
+        Times outside the recording clamp to its first or last step. Angles are
+        never wrapped by PhysWorld, so they interpolate linearly too.
+        """
+        if not len(self):
+            raise ValueError("Trajectory has no steps")
+        u = min(max(time / self.dt, 0.0), len(self) - 1.0)
+        i = min(int(u), len(self) - 2) if len(self) > 1 else 0
+        alpha = u - i
+        a = self.steps[i]
+        if alpha == 0.0:
+            return a["position"].astype(np.float64), a["angle"].astype(np.float64)
+        b = self.steps[i + 1]
+        position = (1 - alpha) * a["position"].astype(np.float64) + alpha * b["position"]
+        angle = (1 - alpha) * a["angle"].astype(np.float64) + alpha * b["angle"]
+        return position, angle
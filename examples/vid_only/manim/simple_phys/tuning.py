@@ -0,0 +1,307 @@
+"""Pick the cheapest dt and solver settings that keep a scene within an error budget.
+
+PhysWorld's constraint_iterations = 10 at dt = 1/240 is one guess for every
+scene: a pile that settles in a second pays for it the whole bake, and a tall
+stack can still jitter. The tuner rolls the scene out headless under
+candidate StepSettings (dt, iterations, warm starting, soft or Baumgarte
+contacts) and measures, after `settle_time`:
+
+    penetration   deepest contact penetration on any step, in m
+    joint drift   largest distance between a revolute joint's two anchors, in m
+    energy drift  largest rise of kinetic + gravitational energy above its
+                  lowest value so far, in J per kg of dynamic mass (contacts,
+                  friction and restitution only ever take energy out, so a
+                  rise is the solver pushing bodies apart or jittering)
+
+Cost is CPU seconds per simulated second, measured in the worker. For every
+(dt, mode, warm starting) line the fewest iterations that meet the budget are
+searched for from the cheap end, all lines at once on worker processes. A line
+is dropped once what is left on it must cost more than the cheapest pass so
+far, going by full-length rollouts: more iterations never cost less per step,
+and a finer dt takes more steps. Rollouts stop at the first step that breaks
+the budget. The scene travels to the workers as a snapshot, so any world a
+scene can build can be tuned, and results are cached by (snapshot, duration,
+settings) like GainSearch's scores.
+
+The winner is saved as a per-scene profile (JSON) that bakes reuse:
+
+    settings = tuned_settings(world, cache_dir / "pile.profile.json", DURATION, budget)
+    settings.apply(world)
+    record_trajectory(world, path, DURATION, settings.dt)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import math
+import os
+import time
+from dataclasses import asdict, astuple, dataclass, replace
+from pathlib import Path
+
+import numpy as np
+
+from .bodies import rotate
+from .rollout_pool import RolloutPool
+from .snapshot import restore, snapshot
+from .world import PhysWorld
+
+DTS = (1 / 60, 1 / 120, 1 / 240, 1 / 480)
+ITERATIONS = (1, 2, 3, 4, 6, 8, 10, 15, 20, 30)
+MODES = ("soft", "baumgarte")
+
+
+@dataclass(frozen=True)
+class StepSettings:
+    dt: float = 1 / 240
+    iterations: int = 10
+    warm_starting: bool = True
+    mode: str = "soft"  # 'baumgarte' | 'soft'
+
+    def apply(self, world: PhysWorld) -> None:
+        """Set the solver side on world; the caller steps it at self.dt."""
+        world.constraint_iterations = self.iterations
+        world.constraint_settings = replace(world.constraint_settings, mode=self.mode, warm_starting=self.warm_starting)
+
+    def __str__(self) -> str:
+        warm = "warm" if self.warm_starting else "cold"
+        return f"1/{1 / self.dt:g} s, {self.iterations} iterations, {self.mode}, {warm}"
+
+
+@dataclass(frozen=True)
+class AccuracyBudget:
+    max_penetration: float = 0.02
+    max_joint_drift: float = 0.01
+    max_energy_drift: float = 1.0
+    settle_time: float = 0.0  # seconds left out, e.g. while bodies spawned overlapping are pushed apart
+
+
+@dataclass(frozen=True)
+class Accuracy:
+    penetration: float
+    joint_drift: float
+    energy_drift: float
+    cost: float  # CPU seconds per simulated second
+    simulated: float  # seconds actually rolled out
+    failed: str = ""  # "" | "penetration" | "joint_drift" | "energy_drift", the first one over budget
+
+    def meets(self, budget: AccuracyBudget) -> bool:
+        return (
+            self.penetration <= budget.max_penetration
+            and self.joint_drift <= budget.max_joint_drift
+            and self.energy_drift <= budget.max_energy_drift
+        )
+
+
+def joint_drift(world: PhysWorld) -> float:
+    """Largest distance between the two world-space anchors of any joint."""
+    joints, bodies = world.joints, world.bodies
+    if not len(joints):
+        return 0.0
+    a, b = joints.body_a, joints.body_b
+    anchor_a = bodies.position[a] + rotate(joints.local_a, bodies.angle[a])
+    anchor_b = bodies.position[b] + rotate(joints.local_b, bodies.angle[b])
+    return float(np.linalg.norm(anchor_a - anchor_b, axis=-1).max())
+
+
+def specific_energy(world: PhysWorld) -> float:
+    """Kinetic plus gravitational energy of the dynamic bodies, per kg."""
+    bodies = world.bodies
+    dynamic = bodies.inv_mass > 0
+    mass = 1 / bodies.inv_mass[dynamic]
+    kinetic = 0.5 * mass * (bodies.velocity[dynamic] ** 2).sum(axis=-1)
+    spin = 0.5 * bodies.angular_velocity[dynamic] ** 2 / np.where(bodies.inv_inertia[dynamic] > 0, bodies.inv_inertia[dynamic], np.inf)
+    potential = -mass * (bodies.position[dynamic] @ world.gravity)
+    return float((kinetic + spin + potential).sum() / max(mass.sum(), 1e-12))
+
+
+def measure(blob: bytes, settings: StepSettings, duration: float, budget: AccuracyBudget) -> Accuracy:
+    """Roll the snapshotted world out under settings, stopping at the first step over budget."""
+    world = restore(blob)
+    settings.apply(world)
+    dt = settings.dt
+    steps = int(round(duration / dt))
+    if steps < 1:
+        raise ValueError(f"A {duration} s rollout is shorter than one {dt} s step")
+    settle = int(round(budget.settle_time / dt))
+    penetration = drift = energy_drift = 0.0
+    lowest = math.inf
+    failed = ""
+    cpu = 0.0
+    for step in range(1, steps + 1):
+        start = time.process_time()
+        world.step(dt, dt)
+        cpu += time.process_time() - start
+        if step <= settle:
+            continue
+        if len(world.contacts):
+            penetration = max(penetration, float(world.contacts.penetration.max()))
+        drift = max(drift, joint_drift(world))
+        energy = specific_energy(world)
+        lowest = min(lowest, energy)
+        energy_drift = max(energy_drift, energy - lowest)
+        if not math.isfinite(energy):
+            penetration = drift = energy_drift = math.inf  # blew up
+        for name, value, limit in (
+            ("penetration", penetration, budget.max_penetration),
+            ("joint_drift", drift, budget.max_joint_drift),
+            ("energy_drift", energy_drift, budget.max_energy_drift),
+        ):
+            if value > limit:
+                failed = name
+                break
+        if failed:
+            break
+    simulated = step * dt
+    return Accuracy(penetration, drift, energy_drift, cpu / simulated, simulated, failed)
+
+
+@dataclass(frozen=True)
+class Tuning:
+    best: StepSettings | None  # None when nothing met the budget
+    accuracy: Accuracy | None
+    tried: dict[StepSettings, Accuracy]
+    rollouts: int  # simulated this time, cache hits excluded
+
+
+class SettingsTuner(RolloutPool):
+    """Searches StepSettings for a world on `workers` processes, caching every rollout.
+
+        with SettingsTuner(workers=8, cache_path="tuning.json") as tuner:
+            tuning = tuner.search(world, duration=6.0, budget=AccuracyBudget(max_penetration=0.05))
+    """
+
+    result_type = Accuracy
+
+    def __init__(
+        self,
+        dts: tuple[float, ...] = DTS,
+        iterations: tuple[int, ...] = ITERATIONS,
+        modes: tuple[str, ...] = MODES,
+        warm_starting: tuple[bool, ...] = (True, False),
+        workers: int | None = None,
+        cache_path: str | Path | None = None,
+    ) -> None:
+        self.dts = dts
+        self.iterations = tuple(sorted(iterations))
+        self.modes = modes
+        self.warm_starting = warm_starting
+        super().__init__(workers, cache_path)
+
+    def evaluate(
+        self, world: PhysWorld, duration: float, candidates: list[StepSettings], budget: AccuracyBudget
+    ) -> list[Accuracy]:
+        """Accuracy of each candidate in the order given. Uncached ones are rolled out in parallel."""
+        blob = snapshot(world)
+        scenario = hashlib.sha256(blob).hexdigest()
+        keys = [json.dumps([scenario, duration, budget.settle_time, astuple(settings)]) for settings in candidates]
+        self._roll_out(
+            measure,
+            {
+                key: (blob, settings, duration, budget)
+                for key, settings in zip(keys, candidates)
+                if not self._cached(key, budget)
+            },
+        )
+        return [self.cache[key] for key in keys]
+
+    def _cached(self, key: str, budget: AccuracyBudget) -> bool:
+        # A rollout that stopped early only says it fails budgets at least as tight as what it broke
+        accuracy = self.cache.get(key)
+        if accuracy is None:
+            return False
+        return not accuracy.failed or not accuracy.meets(budget)
+
+    def search(self, world: PhysWorld, duration: float, budget: AccuracyBudget = AccuracyBudget()) -> Tuning:
+        """The cheapest candidate that meets budget over `duration` seconds of world.
+
+        Every (dt, mode, warm starting) line is searched for its fewest passing
+        iterations at once, cheapest first: 1, 2, 4, 8... of the iteration
+        grid's entries until one passes, then bisection below it. That assumes
+        more iterations are never less accurate.
+        """
+        # line -> [lo, hi]: iterations[:lo] are known to fail, iterations[hi] is the fewest known to pass
+        lines = {line: [0, len(self.iterations)] for line in itertools.product(self.dts, self.modes, self.warm_starting)}
+        tried: dict[StepSettings, Accuracy] = {}
+        rollouts = self.rollouts
+        best: tuple[StepSettings, Accuracy] | None = None
+        while True:
+            cheapest = best[1].cost if best else math.inf
+            open_lines = [
+                line for line, (lo, hi) in lines.items() if lo < hi and self._cost_floor(line, lo, tried) < cheapest
+            ]
+            if not open_lines:
+                break
+            probes = []
+            for line in open_lines:
+                lo, hi = lines[line]
+                probes.append(min(2 * lo, hi - 1) if hi == len(self.iterations) else (lo + hi) // 2)
+            candidates = [
+                StepSettings(dt, self.iterations[probe], warm, mode) for (dt, mode, warm), probe in zip(open_lines, probes)
+            ]
+            results = self.evaluate(world, duration, candidates, budget)
+            for line, probe, settings, accuracy in zip(open_lines, probes, candidates, results):
+                tried[settings] = accuracy
+                if accuracy.meets(budget):
+                    lines[line][1] = probe
+                    if best is None or accuracy.cost < best[1].cost:
+                        best = settings, accuracy
+                else:
+                    lines[line][0] = probe + 1
+        return Tuning(best[0] if best else None, best[1] if best else None, tried, self.rollouts - rollouts)
+
+    def _cost_floor(self, line: tuple[float, str, bool], lo: int, tried: dict[StepSettings, Accuracy]) -> float:
+        # What anything left on the line will at least cost: no less per step than a rollout with as
+        # many or fewer iterations at the same or a coarser dt, taken that many times more often.
+        # Rollouts that stopped early are too short to time
+        dt, mode, warm = line
+        return max(
+            (
+                accuracy.cost * settings.dt / dt
+                for settings, accuracy in tried.items()
+                if not accuracy.failed and settings.mode == mode and settings.warm_starting == warm
+                and settings.dt >= dt and settings.iterations <= self.iterations[lo]
+            ),
+            default=0.0,
+        )
+
+
+def save_profile(path: str | Path, world: PhysWorld, duration: float, budget: AccuracyBudget, tuning: Tuning) -> None:
+    """Write tuning's winner as the profile for world's scene, atomically."""
+    path = Path(path)
+    profile = {
+        "scenario": hashlib.sha256(snapshot(world)).hexdigest(),
+        "duration": duration,
+        "budget": asdict(budget),
+        "settings": asdict(tuning.best),
+        "accuracy": asdict(tuning.accuracy),
+    }
+    partial = path.with_name(path.name + ".partial")
+    partial.write_text(json.dumps(profile, indent=2))
+    os.replace(partial, path)
+
+
+def load_profile(path: str | Path) -> tuple[StepSettings, Accuracy]:
+    profile = json.loads(Path(path).read_text())
+    return StepSettings(**profile["settings"]), Accuracy(**profile["accuracy"])
+
+
+def tuned_settings(
+    world: PhysWorld, path: str | Path, duration: float, budget: AccuracyBudget = AccuracyBudget(), **tuner_options
+) -> StepSettings:
+    """The scene's saved profile, or a fresh search saved to path if the world, duration or budget changed."""
+    path = Path(path)
+    if path.exists():
+        profile = json.loads(path.read_text())
+        scenario = hashlib.sha256(snapshot(world)).hexdigest()
+        if (profile["scenario"], profile["duration"], profile["budget"]) == (scenario, duration, asdict(budget)):
+            return StepSettings(**profile["settings"])
+    with SettingsTuner(**tuner_options) as tuner:
+        tuning = tuner.search(world, duration, budget)
+    if tuning.best is None:
+        raise ValueError(f"No settings keep this scene within {budget}, loosen the budget or add finer dts")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    save_profile(path, world, duration, budget, tuning)
+    return tuning.best
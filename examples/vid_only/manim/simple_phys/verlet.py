@@ -0,0 +1,279 @@
+"""Position-based Verlet particles with distance constraints, over NumPy arrays.
+
+Port of the particle worlds in integration_basic_verlet_phys.js,
+verlet_demo.html (the cloth) and mixed_slime.js (the slime's particle ring).
+Those step one VerletObject and one DistanceConstraint object at a time. Here
+particles and constraints are ArrayTable rows, integration is one array
+expression, and constraint relaxation runs in graph-coloured batches (see
+coloured.py): constraints of one colour share no movable particle, so a whole
+colour reads its endpoints, computes its corrections and writes them back in a
+handful of NumPy calls.
+
+The per-constraint correction is the JS one, including scaling stiffness by
+1 / constraint_iterations and moving each free endpoint by half the correction
+even when the other end is pinned. Only the order differs (Gauss-Seidel between
+colours, Jacobi within one), so a cloth settles to the same shape as the
+sequential JS loop but not bit-identically; solve_sequential keeps that loop for
+comparison.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from .coloured import colour_batches, colour_constraints
+from .table import ArrayTable
+
+
+class Particles(ArrayTable):
+    """VerletObject rows. Velocity is implicit: position - previous."""
+
+    COLUMNS = {
+        "position": ((2,), np.float64, 0.0),
+        "previous": ((2,), np.float64, 0.0),  # VerletObject.prevPosition
+        "is_static": ((), np.bool_, False),
+    }
+
+
+class DistanceConstraints(ArrayTable):
+    """VerletDistanceConstraint rows."""
+
+    COLUMNS = {
+        "a": ((), np.int64, 0),
+        "b": ((), np.int64, 0),
+        "rest_length": ((), np.float64, 0.0),
+        "stiffness": ((), np.float64, 1.0),  # 0..1, 1 = full correction
+    }
+
+
+class _Batch:
+    # One colour's constraint columns, gathered once so iterations only index particles
+    def __init__(self, constraints: DistanceConstraints, rows: np.ndarray, is_static: np.ndarray) -> None:
+        self.a, self.b = constraints.a[rows], constraints.b[rows]
+        self.rest_length = constraints.rest_length[rows]
+        self.half_stiffness = 0.5 * constraints.stiffness[rows]
+        # 0.0 for pinned ends, which take no correction
+        self.free_a = (~is_static[self.a]).astype(np.float64)
+        self.free_b = (~is_static[self.b]).astype(np.float64)
+
+
+class VerletWorld:
+    def __init__(self) -> None:
+        self.particles = Particles()
+        self.constraints = DistanceConstraints()
+        self.gravity = np.array([0.0, -9.81])
+        self.constraint_iterations = 8
+        # Axis-aligned box particles are kept in (applyScreenBoundaryConstraints), None for no walls
+        self.bounds: tuple[tuple[float, float], tuple[float, float]] | None = None
+        self.bounds_friction = 0.5  # share of tangential motion removed from a particle touching a wall
+        self._batches: list[_Batch] | None = None
+        self._accumulator = 0.0
+
+    def add_particles(self, positions: np.ndarray, is_static: np.ndarray | bool = False) -> np.ndarray:
+        """Particles at rest at `positions` (N, 2). Returns their rows."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        self._batches = None
+        return self.particles.extend(len(positions), position=positions, previous=positions, is_static=is_static)
+
+    def add_particle(self, x: float, y: float, is_static: bool = False) -> int:
+        return int(self.add_particles([(x, y)], is_static)[0])
+
+    def add_distance_constraints(
+        self, a: np.ndarray, b: np.ndarray, rest_length: np.ndarray | None = None, stiffness: np.ndarray | float = 1.0
+    ) -> np.ndarray:
+        """Constraints between particle rows a[i] and b[i]; rest_length defaults to the current distance."""
+        a, b = np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64)
+        if rest_length is None:
+            position = self.particles.position
+            rest_length = np.hypot(*(position[a] - position[b]).T)
+        self._batches = None
+        return self.constraints.extend(len(a), a=a, b=b, rest_length=rest_length, stiffness=stiffness)
+
+    def add_distance_constraint(
+        self, a: int, b: int, rest_length: float | None = None, stiffness: float = 1.0
+    ) -> int:
+        rest = None if rest_length is None else [rest_length]
+        return int(self.add_distance_constraints([a], [b], rest, stiffness)[0])
+
+    @property
+    def colour_count(self) -> int:
+        return len(self.batches())
+
+    def batches(self) -> list[_Batch]:
+        """Constraint batches by colour, rebuilt after constraints, stiffness or pinning change (call invalidate())."""
+        if self._batches is None:
+            constraints, is_static = self.constraints, self.particles.is_static
+            colours = colour_constraints(constraints.a, constraints.b, is_static)
+            order, slices = colour_batches(colours)
+            self._batches = [_Batch(constraints, order[s], is_static) for s in slices if s.stop > s.start]
+        return self._batches
+
+    def invalidate(self) -> None:
+        self._batches = None
+
+    def step(self, time_elapsed_since_last_called: float = 0.0, dt: float = 1 / 240, max_steps: int = 10) -> int:
+        """Advance by whole substeps of dt, PhysWorld.step's accumulator. Returns how many substeps ran."""
+        self._accumulator = min(self._accumulator + time_elapsed_since_last_called, max_steps * dt)
+        substeps = 0
+        while self._accumulator >= dt:
+            self.substep(dt)
+            self._accumulator -= dt
+            substeps += 1
+        return substeps
+
+    def substep(self, dt: float) -> None:
+        particles = self.particles
+        position, previous = particles.position, particles.previous
+        free = ~particles.is_static
+        # VerletObject.step: x' = x + (x - x_prev) + a dt^2
+        moved = position[free] + (position[free] - previous[free]) + self.gravity * dt * dt
+        previous[free] = position[free]
+        position[free] = moved
+
+        self.apply_bounds()
+        inv_iterations = 1 / self.constraint_iterations
+        batches = self.batches()
+        points = as_complex(particles.position)
+        for _ in range(self.constraint_iterations):
+            for batch in batches:
+                relax(points, batch, inv_iterations)
+
+    def apply_bounds(self) -> None:
+        if self.bounds is None:
+            return
+        position, previous = self.particles.position, self.particles.previous
+        low, high = np.asarray(self.bounds, dtype=np.float64)
+        clamped = np.clip(position, low, high)
+        hit = clamped != position
+        if hit.any():
+            # A particle pushed back along one axis loses part of its motion along the other
+            touching = hit[:, ::-1]
+            previous[touching] += (position[touching] - previous[touching]) * self.bounds_friction
+            position[:] = clamped
+
+    def velocity(self, dt: float) -> np.ndarray:
+        """Implied velocities, (position - previous) / dt."""
+        return (self.particles.position - self.particles.previous) / dt
+
+
+def as_complex(position: np.ndarray) -> np.ndarray:
+    """A contiguous (N, 2) float64 array viewed as N complex numbers x + iy, sharing memory.
+
+    Gathering and scattering single complex values is several times faster than
+    whole (x, y) rows of a 2D array, and the correction is the same arithmetic.
+    """
+    return position.view(np.complex128).reshape(-1)
+
+
+def relax(points: np.ndarray, batch: _Batch, inv_iterations: float) -> None:
+    """One colour of VerletDistanceConstraint.solve, all at once, on as_complex positions."""
+    pa, pb = points.take(batch.a), points.take(batch.b)
+    delta = pb - pa
+    dist = np.sqrt(delta.real * delta.real + delta.imag * delta.imag)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Coincident endpoints (dist 0) are skipped, as in the JS
+        diff = np.where(dist > 0, (dist - batch.rest_length) / dist, 0.0) * batch.half_stiffness * inv_iterations
+    correction = delta * diff
+    # Within a colour every free particle appears once, so plain writes can't lose an update
+    points.put(batch.a, pa + correction * batch.free_a)
+    points.put(batch.b, pb - correction * batch.free_b)
+
+
+def solve_sequential(world: VerletWorld, inv_iterations: float | None = None) -> None:
+    """The JS constraint loop, one constraint at a time in row order, for comparison with the batches."""
+    inv = 1 / world.constraint_iterations if inv_iterations is None else inv_iterations
+    position = world.particles.position.tolist()
+    static = world.particles.is_static.tolist()
+    constraints = world.constraints
+    rows = list(zip(constraints.a.tolist(), constraints.b.tolist(), constraints.rest_length.tolist(), constraints.stiffness.tolist()))
+    for _ in range(world.constraint_iterations):
+        for a, b, rest, stiffness in rows:
+            (ax, ay), (bx, by) = position[a], position[b]
+            dx, dy = bx - ax, by - ay
+            dist = math.sqrt(dx * dx + dy * dy)
+            if dist == 0:
+                continue
+            diff = (dist - rest) / dist * stiffness * inv
+            cx, cy = dx * 0.5 * diff, dy * 0.5 * diff
+            if not static[a]:
+                position[a] = [ax + cx, ay + cy]
+            if not static[b]:
+                position[b] = [bx - cx, by - cy]
+    world.particles.position = np.array(position).reshape(-1, 2)
+
+
+def add_cloth(
+    world: VerletWorld,
+    x: float,
+    y: float,
+    columns: int = 37,
+    rows: int = 18,
+    spacing: float = 0.2,
+    stiffness: float = 0.075,
+    pin_every: int = 6,
+) -> np.ndarray:
+    """verlet_demo.html's createCloth: a grid hanging from every pin_every-th top node, (x, y) its top-left.
+
+    Returns the particle rows as a (rows, columns) grid.
+    """
+    gx, gy = np.meshgrid(np.arange(columns), np.arange(rows))
+    positions = np.column_stack([x + gx.ravel() * spacing, y - gy.ravel() * spacing])
+    pinned = (gy.ravel() == 0) & (gx.ravel() % pin_every == 0)
+    grid = world.add_particles(positions, pinned).reshape(rows, columns)
+    # Row-major like the JS loop: every node links to its left and upper neighbour
+    world.add_distance_constraints(grid[:, 1:].ravel(), grid[:, :-1].ravel(), np.full(rows * (columns - 1), spacing), stiffness)
+    world.add_distance_constraints(grid[1:, :].ravel(), grid[:-1, :].ravel(), np.full((rows - 1) * columns, spacing), stiffness)
+    return grid
+
+
+def add_slime(
+    world: VerletWorld, x: float, y: float, radius: float = 0.8, sides: int = 7, stiffness: float = 0.03
+) -> np.ndarray:
+    """mixed_slime.js's addSlime particle ring: a centre, `sides` nodes and spokes plus 1-, 2- and 3-apart chords.
+
+    Returns the rows, centre first.
+    """
+    angles = np.arange(sides) / sides * math.tau
+    positions = np.vstack([[x, y], np.column_stack([x + np.cos(angles) * radius, y + np.sin(angles) * radius])])
+    rows = world.add_particles(positions)
+    center, nodes = rows[0], rows[1:]
+    world.add_distance_constraints(np.full(sides, center), nodes, stiffness=stiffness)
+    for step, scale in [(1, 1.0), (2, 0.5), (3, 0.3)]:
+        world.add_distance_constraints(nodes, np.roll(nodes, -step), stiffness=stiffness * scale)
+    return rows
+
+
+def add_blob(world: VerletWorld, x: float, y: float, radius: float, spacing: float, stiffness: float = 1.0) -> np.ndarray:
+    """A slime body filled with particles: a triangular lattice inside a circle.
+
+    Like the chords of add_slime, each particle links to its six nearest
+    neighbours at full stiffness and to the six next-nearest (sqrt(3) spacings
+    away, across each pair of triangles) at half, which keeps the triangles
+    from folding over under load. Returns the particle rows.
+    """
+    half = int(radius / spacing) + 1
+    j, i = np.mgrid[-2 * half: 2 * half + 1, -half: half + 1]
+    # Odd lattice rows are shifted by half a spacing
+    local = np.stack([(i + 0.5 * (j % 2)) * spacing, j * spacing * math.sqrt(3) / 2], axis=-1)
+    inside = np.hypot(local[..., 0], local[..., 1]) <= radius
+    index = np.full(inside.shape, -1)
+    index[inside] = world.add_particles(local[inside] + (x, y))
+
+    rows, columns = index.shape
+    for reach, scale in [(1.0, 1.0), (math.sqrt(3), 0.5)]:
+        a, b = [], []
+        # Every lattice offset that can be `reach` spacings away, each unordered pair once
+        for dj in range(0, 3):
+            for di in range(-2, 3):
+                if dj == 0 and di <= 0:
+                    continue
+                first = index[: rows - dj, max(-di, 0): columns - max(di, 0)]
+                second = index[dj:, max(di, 0): columns - max(-di, 0)]
+                offset = local[dj:, max(di, 0): columns - max(-di, 0)] - local[: rows - dj, max(-di, 0): columns - max(di, 0)]
+                near = np.isclose(np.hypot(offset[..., 0], offset[..., 1]), reach * spacing) & (first >= 0) & (second >= 0)
+                a.append(first[near])
+                b.append(second[near])
+        world.add_distance_constraints(np.concatenate(a), np.concatenate(b), stiffness=stiffness * scale)
+    return index[inside]
@@ -0,0 +1,238 @@
+"""PhysWorld from simple_phys.js over structure-of-arrays tables.
+
+Bodies are referred to by row index (the JS object id is index + 1). `step`
+keeps the JS fixed-step accumulator, and each substep runs in the same order:
+gravity, detect_collisions, solve_constraints, integrate. Bodies marked
+is_bullet integrate only up to their time of impact (ccd.py). Everything is plain
+float64 NumPy/Python arithmetic with a fixed iteration order, so the same
+script always bakes the same trajectories.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+import numpy as np
+
+from .bodies import CIRCLE, POLYGON, Bodies, CircleShape, ConvexPolygonShape, Shapes, Vertices, rotate
+from .broadphase import SweepAndPrune
+from .ccd import CCDSettings, time_of_impact
+from .collision import ContactArrays
+from .islands import SleepSettings, find_islands, update_sleep, wake_islands
+from .narrowphase import find_contacts_batched
+from .contact_cache import ContactCache
+from .constraints import ConstraintSettings, Contacts, Joints, solve_sequential
+
+
+def capsule_moment_of_inertia(length: float, a: float, b: float) -> float:
+    """Analytic moment of inertia of a unit density capsule about its center of mass."""
+    numer = 3 * length ** 2 * (a ** 4 + 4 * a ** 3 * b + 10 * a ** 2 * b ** 2 + 4 * a * b ** 3 + b ** 4) + 24 * (
+        a ** 6 + 2 * a ** 5 * b + 3 * a ** 4 * b ** 2 + 4 * a ** 3 * b ** 3 + 3 * a ** 2 * b ** 4 + 2 * a * b ** 5 + b ** 6
+    )
+    return math.pi * length * numer / (240 * (a ** 2 + a * b + b ** 2))
+
+
+class PhysWorld:
+    def __init__(self) -> None:
+        self.bodies = Bodies()
+        self.shapes = Shapes()
+        self.vertices = Vertices()
+        self.joints = Joints()
+        self.contacts = Contacts()
+        self.gravity = np.array([0.0, -9.81])
+        self.constraint_iterations = 10
+        self.constraint_settings = ConstraintSettings()
+        # Swappable stages: candidate pairs, contact generation (collision.find_contacts is the
+        # one-pair-at-a-time reference) and the constraint solver
+        self.broadphase: Callable[[Bodies, Shapes, Vertices], tuple[np.ndarray, np.ndarray]] = SweepAndPrune()
+        self.narrowphase: Callable[..., ContactArrays] = find_contacts_batched
+        self.solver: Callable[..., None] = solve_sequential
+        self.contact_cache = ContactCache()
+        self.sleep = SleepSettings()
+        self.ccd = CCDSettings()
+        self.island_labels = np.empty(0, dtype=np.int64)
+        self._accumulator = 0.0  # accumulated real time for fixed-step simulation
+
+    def add_body(
+        self,
+        x: float,
+        y: float,
+        shapes: list[CircleShape | ConvexPolygonShape],
+        is_static: bool = False,
+        mass: float = 1.0,
+        moment_of_inertia: float = 1.0,
+    ) -> int:
+        """PhysObject constructor. Returns the body's row."""
+        body = self.bodies.append(
+            position=(x, y),
+            inv_mass=0.0 if is_static else 1 / mass,
+            inv_inertia=0.0 if is_static else 1 / moment_of_inertia,
+            is_static=is_static,
+            shape_start=len(self.shapes),
+            shape_count=len(shapes),
+        )
+        for local_id, shape in enumerate(shapes):
+            if isinstance(shape, CircleShape):
+                self.shapes.append(body=body, kind=CIRCLE, local_id=local_id, radius=shape.radius, offset=shape.offset)
+            else:
+                start = len(self.vertices)
+                self.vertices.extend(len(shape.vertices), local=np.asarray(shape.vertices, dtype=np.float64))
+                self.shapes.append(
+                    body=body, kind=POLYGON, local_id=local_id, vertex_start=start, vertex_count=len(shape.vertices)
+                )
+        return body
+
+    def add_box(self, x: float, y: float, w: float, h: float, density: float = 1.0, is_static: bool = False) -> int:
+        mass = density * w * h
+        hw, hh = w / 2, h / 2
+        box = ConvexPolygonShape([(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)])
+        return self.add_body(x, y, [box], is_static, mass, mass * (w * w + h * h) / 12)
+
+    def add_circle(self, x: float, y: float, radius: float, density: float = 1.0, is_static: bool = False) -> int:
+        mass = density * math.pi * radius * radius
+        return self.add_body(x, y, [CircleShape(radius)], is_static, mass, mass * radius * radius / 2)
+
+    def add_capsule(
+        self, x: float, y: float, length: float, r1: float, r2: float, density: float = 1.0, is_static: bool = False
+    ) -> int:
+        half_len = length / 2
+        dr = r2 - r1
+        com = length * (r2 * r2 - r1 * r1) / (4 * (r1 * r1 + r1 * r2 + r2 * r2))
+        mass = density * (length * (r1 + r2) + 0.5 * math.pi * (r1 * r1 + r2 * r2))
+
+        # Box connecting the two circles
+        factor = math.sqrt(1 - (dr * dr) / (length * length))
+        x1, y1 = -half_len - (dr * r1) / length - com, r1 * factor
+        x2, y2 = half_len - (dr * r2) / length - com, r2 * factor
+        shapes = [
+            ConvexPolygonShape([(x1, -y1), (x2, -y2), (x2, y2), (x1, y1)]),
+            CircleShape(r1, (-half_len - com, 0.0)),
+            CircleShape(r2, (half_len - com, 0.0)),
+        ]
+        return self.add_body(x, y, shapes, is_static, mass, density * capsule_moment_of_inertia(length, r1, r2))
+
+    def add_revolute_constraint(
+        self,
+        body_a: int,
+        body_b: int,
+        world_point: tuple[float, float],
+        lower_angle_limit: float | None = None,
+        upper_angle_limit: float | None = None,
+        stiffness: float = 1.0,
+    ) -> int:
+        """RevoluteConstraint anchored at world_point. Returns the joint's row."""
+        point = np.asarray(world_point, dtype=np.float64)
+        local = rotate(point - self.bodies.position[[body_a, body_b]], -self.bodies.angle[[body_a, body_b]])
+        return self.joints.append(
+            body_a=body_a,
+            body_b=body_b,
+            local_a=local[0],
+            local_b=local[1],
+            lower_limit=np.nan if lower_angle_limit is None else lower_angle_limit,
+            upper_limit=np.nan if upper_angle_limit is None else upper_angle_limit,
+            stiffness=stiffness,
+        )
+
+    def step(self, time_elapsed_since_last_called: float = 0.0, dt: float = 1 / 240, max_steps: int = 10) -> int:
+        """Advance by whole substeps of dt. Returns how many substeps ran."""
+        self._accumulator += time_elapsed_since_last_called
+
+        # Prevent spiral of death when resuming after long pauses
+        self._accumulator = min(self._accumulator, max_steps * dt)
+
+        substeps = 0
+        while self._accumulator >= dt:
+            self.substep(dt)
+            self._accumulator -= dt
+            substeps += 1
+        return substeps
+
+    def substep(self, dt: float) -> None:
+        bodies = self.bodies
+        moving = ~bodies.is_static & bodies.awake
+        bodies.velocity[moving] += self.gravity * dt
+
+        self.detect_collisions()
+        if self.sleep.enabled:
+            self.island_labels = find_islands(
+                len(bodies),
+                bodies.is_static,
+                np.concatenate([self.contacts.body_a, self.joints.body_a]),
+                np.concatenate([self.contacts.body_b, self.joints.body_b]),
+            )
+            wake_islands(bodies, self.island_labels)
+            moving = ~bodies.is_static & bodies.awake
+        self.solve_constraints(dt, self.constraint_iterations)
+
+        step = dt
+        if self.ccd.enabled and bodies.is_bullet.any():
+            step = dt * time_of_impact(bodies, self.shapes, self.vertices, moving, dt, self.ccd)[moving]
+        bodies.angle[moving] += bodies.angular_velocity[moving] * step
+        bodies.position[moving] += bodies.velocity[moving] * np.reshape(step, (-1, 1))
+        if self.sleep.enabled:
+            update_sleep(bodies, self.island_labels, self.sleep, dt)
+
+    def wake_body(self, body: int) -> None:
+        """Wake a body (and, on the next substep, its island), e.g. after setting its velocity."""
+        self.bodies.awake[body] = True
+        self.bodies.sleep_time[body] = 0.0
+
+    def solve_constraints(self, dt: float, num_iterations: int) -> None:
+        bodies = self.bodies
+        if bodies.awake[~bodies.is_static].all():
+            self.solver(bodies, self.joints, self.contacts, self.constraint_settings, dt, num_iterations)
+            return
+
+        # Leave sleeping islands out, their constraints keep their impulses for when they wake
+        active = bodies.awake & ~bodies.is_static
+        joint_rows = active[self.joints.body_a] | active[self.joints.body_b]
+        contact_rows = active[self.contacts.body_a] | active[self.contacts.body_b]
+        joints, contacts = self.joints.subset(joint_rows), self.contacts.subset(contact_rows)
+        self.solver(bodies, joints, contacts, self.constraint_settings, dt, num_iterations)
+        self.joints.update_rows(joint_rows, joints)
+        self.contacts.update_rows(contact_rows, contacts)
+
+    def detect_collisions(self) -> None:
+        """Rebuild the contact table, carrying accumulated impulses over for matching (A, B, featureId)."""
+        old = self.contact_cache.contacts
+        bodies = self.bodies
+        pairs = self.broadphase(bodies, self.shapes, self.vertices)
+        active = bodies.awake & ~bodies.is_static
+        if not active[~bodies.is_static].all():
+            # Sleeping bodies don't move, so pairs without an awake body keep last step's contacts
+            keep = active[pairs[0]] | active[pairs[1]]
+            pairs = (pairs[0][keep], pairs[1][keep])
+        found = self.narrowphase(bodies, self.shapes, self.vertices, pairs)
+        frozen = ~active[old.body_a] & ~active[old.body_b]
+        reused_from = self.contact_cache.match(found.body_a, found.body_b, found.feature_id, int(frozen.sum()))
+
+        contacts = Contacts(max(len(found), 16))
+        if len(found):
+            a, b, normal = found.body_a, found.body_b, found.normal
+            reused = reused_from >= 0
+            source = np.where(reused, reused_from, 0)
+
+            def carried(column: np.ndarray, fresh: np.ndarray) -> np.ndarray:
+                return np.where(reused, column[source], fresh) if len(column) else fresh
+
+            contacts.extend(
+                len(found),
+                body_a=a,
+                body_b=b,
+                feature_id=found.feature_id,
+                normal=normal,
+                tangent=np.stack([normal[:, 1], -normal[:, 0]], axis=-1),
+                penetration=found.penetration,
+                local_a=rotate(found.point - bodies.position[a], -bodies.angle[a]),
+                local_b=rotate(found.point - bodies.position[b], -bodies.angle[b]),
+                friction=carried(old.friction, np.sqrt(bodies.friction[a] * bodies.friction[b])),
+                restitution=carried(old.restitution, np.sqrt(bodies.restitution[a] * bodies.restitution[b])),
+                acc_normal=carried(old.acc_normal, 0.0),
+                acc_friction=carried(old.acc_friction, 0.0),
+                is_reused=reused,
+            )
+        if frozen.any():
+            contacts.extend(int(frozen.sum()), **old.subset(frozen).columns())
+        self.contacts = contacts
+        self.contact_cache.store(contacts)
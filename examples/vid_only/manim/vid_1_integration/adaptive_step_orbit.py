@@ -0,0 +1,103 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from simple_phys.adaptive import integrate_adaptive
+from simple_phys.integrators import central_gravity, integrate
+
+GM = 4 * np.pi**2  # 1 AU, 1 year orbits
+ECCENTRICITY = 0.9
+PERIODS = 2.0
+FIXED_DT = 1 / 240
+RUNS = {
+    # label: (method, rtol, colour)
+    "RK45, rtol 1e-4": ("rk45", 1e-4, BLUE_C),
+    "semi-implicit Euler, step doubling, rtol 1e-3": ("semi_implicit_euler", 1e-3, GREEN_C),
+}
+
+
+def eccentric_orbit():
+    """Start at periapsis of an a = 1 orbit, moving anticlockwise."""
+    periapsis = 1 - ECCENTRICITY
+    x0 = np.array([[periapsis, 0.0]])
+    v0 = np.array([[0.0, np.sqrt(GM * (1 + ECCENTRICITY) / periapsis)]])
+    return x0, v0
+
+
+def energy_error(x: np.ndarray, v: np.ndarray) -> np.ndarray:
+    energy = 0.5 * (v * v).sum(axis=-1) - GM / np.linalg.norm(x, axis=-1)
+    return np.abs(energy / energy[0] - 1)
+
+
+class AdaptiveStepOrbit(Scene):
+    def construct(self):
+        x0, v0 = eccentric_orbit()
+        accel = central_gravity(GM)
+        fixed = integrate("semi_implicit_euler", accel, x0, v0, FIXED_DT, total_time=PERIODS)
+
+        title = Text("Adaptive time steps on an e = 0.9 orbit", font_size=38).to_edge(UP)
+        self.play(FadeIn(title))
+
+        # The orbit, with a dot at each accepted step: they bunch up at periapsis
+        orbit_axes = Axes(
+            x_range=[-2.1, 0.3, 1], y_range=[-0.6, 0.6, 1], x_length=5.6, y_length=2.8,
+            axis_config={"stroke_opacity": 0.3, "include_ticks": False},
+        ).to_edge(LEFT, buff=0.4).shift(UP * 0.6)
+        sun = Dot(orbit_axes.coords_to_point(0, 0), color=YELLOW, radius=0.08)
+        self.play(FadeIn(orbit_axes), FadeIn(sun))
+
+        # dt over time above, energy error below
+        dt_axes = Axes(
+            x_range=[0, PERIODS, 0.5], y_range=[-6, 0, 2], x_length=5.6, y_length=2.3,
+            axis_config={"tip_length": 0.12, "font_size": 20}, y_axis_config={"include_numbers": True},
+            x_axis_config={"include_numbers": True},
+        ).to_edge(RIGHT, buff=0.5).shift(UP * 1.4)
+        error_axes = Axes(
+            x_range=[0, PERIODS, 0.5], y_range=[-10, 2, 4], x_length=5.6, y_length=2.3,
+            axis_config={"tip_length": 0.12, "font_size": 20}, y_axis_config={"include_numbers": True},
+            x_axis_config={"include_numbers": True},
+        ).to_edge(RIGHT, buff=0.5).shift(DOWN * 1.9)
+        dt_label = MathTex(r"\log_{10} \Delta t", font_size=28).next_to(dt_axes, UP, buff=0.1)
+        error_label = MathTex(r"\log_{10} |E / E_0 - 1|", font_size=28).next_to(error_axes, UP, buff=0.1)
+        self.play(Create(dt_axes), Create(error_axes), FadeIn(dt_label), FadeIn(error_label))
+
+        # PhysWorld's fixed step as the baseline: flat dt, energy error off the chart
+        fixed_error = np.log10(np.maximum(energy_error(fixed.x[:, 0], fixed.v[:, 0]), 1e-12))
+        baseline = VGroup(
+            DashedLine(dt_axes.coords_to_point(0, np.log10(FIXED_DT)), dt_axes.coords_to_point(PERIODS, np.log10(FIXED_DT)), color=GRAY),
+            VMobject(color=GRAY, stroke_width=2).set_points_as_corners(
+                [error_axes.coords_to_point(t, min(e, 2)) for t, e in zip(fixed.t[::4, 0], fixed_error[::4])]
+            ),
+        )
+        legend = VGroup(Text(f"fixed 1/240: {len(fixed.t) - 1} steps", font_size=20, color=GRAY))
+        self.play(Create(baseline), FadeIn(legend))
+
+        for label, (method, rtol, colour) in RUNS.items():
+            result = integrate_adaptive(method, accel, x0, v0, PERIODS, rtol=rtol, atol=rtol * 1e-3)
+            kept = ~np.isnan(result.dt[:, 0])
+            t, dt = result.t[1:][kept, 0], result.dt[kept, 0]
+            x, v = result.x[1:][kept, 0], result.v[1:][kept, 0]
+            error = np.log10(np.maximum(energy_error(np.vstack([x0, x]), np.vstack([v0, v]))[1:], 1e-12))
+
+            dt_curve = VMobject(color=colour, stroke_width=2).set_points_as_corners(
+                [dt_axes.coords_to_point(a, b) for a, b in zip(t, np.log10(dt))]
+            )
+            error_curve = VMobject(color=colour, stroke_width=2).set_points_as_corners(
+                [error_axes.coords_to_point(a, b) for a, b in zip(t, error)]
+            )
+            step = max(1, len(x) // 400)
+            dots = VGroup(*[Dot(orbit_axes.coords_to_point(*p), radius=0.025, color=colour) for p in x[::step]])
+            saved = result.saved_against(FIXED_DT)[0]
+            legend.add(Text(
+                f"{label}: {result.accepted[0]} steps, {result.rejected[0]} retried, {-saved:+.0%} work vs 1/240",
+                font_size=20,
+                color=colour,
+            ))
+            legend.arrange(DOWN, aligned_edge=LEFT, buff=0.12).to_corner(DL, buff=0.4)
+            self.play(
+                FadeIn(dots, lag_ratio=0.01), Create(dt_curve), Create(error_curve), FadeIn(legend[-1]), run_time=4.0
+            )
+        self.wait(3)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
 from manim import *
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from simple_phys.integrators import constant_acceleration, integrate
 
-@dataclass
+
+@dataclass(frozen=True)
 class FallParams:
         g: float = -9.81
         y0: float = 30.0
@@ -15,8 +20,11 @@ class FallParams:
 
 
 class EulerVsAnalyticFall(Scene):
+        # Overridden per variant by scene_utils.sweep
+        params: FallParams = FallParams()
+
         def construct(self) -> None:
-                params = FallParams()
+                params = self.params
 
                 axes = Axes(
                         x_range=[0, params.total_time + 0.5, 0.5],
@@ -68,21 +76,16 @@ class EulerVsAnalyticFall(Scene):
                 self.wait(2)
 
         def _build_euler_staircase(self, axes: Axes, params: FallParams) -> tuple[VMobject, VGroup]:
-                samples: list[tuple[float, float]] = [(0.0, params.y0)]
-                current_t = 0.0
-                current_y = params.y0
-                current_v = params.v0
-
-                while current_t < params.total_time - 1e-9:
-                        dt = min(params.dt, params.total_time - current_t)
-                        current_v = current_v + params.g * dt
-                        next_t = current_t + dt
-                        next_y = current_y + current_v * dt
-
-                        samples.append((next_t, next_y))
-
-                        current_t = next_t
-                        current_y = next_y
+                # Velocity first, then position with the new velocity (semi-implicit, like simple_phys.js)
+                trajectory = integrate(
+                        "semi_implicit_euler",
+                        constant_acceleration(params.g),
+                        params.y0,
+                        params.v0,
+                        params.dt,
+                        total_time=params.total_time,
+                )
+                samples = list(zip(trajectory.t[:, 0], trajectory.x[:, 0, 0]))
 
                 staircase_points = [axes.coords_to_point(*samples[0])]
                 for (t_prev, y_prev), (t_curr, y_curr) in zip(samples[:-1], samples[1:]):
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from simple_phys.verlet import VerletWorld, add_blob, add_cloth
+
+DT = 1 / 240
+ORIGIN_Y = -3.4
+SCALE = 0.8
+BLOB_SPACING = 0.05
+
+
+def cloth_and_blob():
+    """verlet_demo.html's curtain on the left, a particle-filled slime dropped on the right."""
+    world = VerletWorld()
+    world.bounds = ((-9.0, 0.0), (9.0, 20.0))
+    grid = add_cloth(world, -7.5, 5.0)
+    blob = add_blob(world, 4.0, 3.5, 1.2, BLOB_SPACING)
+    return world, grid, blob
+
+
+def to_scene(points: np.ndarray) -> np.ndarray:
+    scene = np.zeros((len(points), 3))
+    scene[:, 0] = SCALE * points[:, 0]
+    scene[:, 1] = ORIGIN_Y + SCALE * points[:, 1]
+    return scene
+
+
+class VerletClothSlime(Scene):
+    def construct(self):
+        world, grid, blob = cloth_and_blob()
+        particles = world.particles
+
+        title = Text("Verlet particles, relaxed one colour at a time", font_size=34).to_edge(UP)
+        info = Text(
+            f"{len(particles):,} particles, {len(world.constraints):,} distance constraints in {world.colour_count} colours",
+            font_size=22,
+            color=GRAY,
+        ).next_to(title, DOWN, buff=0.2)
+        floor = Line(to_scene(np.array([[-9.0, 0.0]]))[0], to_scene(np.array([[9.0, 0.0]]))[0], color=GRAY_D)
+        self.play(FadeIn(title), FadeIn(info), Create(floor))
+
+        # The cloth as one polyline per row and per column of the grid
+        threads = VGroup(*[VMobject(stroke_width=1.5, color=RED_C) for _ in range(sum(grid.shape))])
+
+        # The blob's outline: particles with fewer than 6 nearest neighbours, in order around the centre
+        c = world.constraints
+        nearest = np.isclose(c.rest_length, BLOB_SPACING)
+        degree = np.bincount(np.concatenate([c.a[nearest], c.b[nearest]]), minlength=len(particles))[blob]
+        edge = blob[degree < 6]
+        offset = particles.position[edge] - particles.position[blob].mean(axis=0)
+        edge = edge[np.argsort(np.arctan2(offset[:, 1], offset[:, 0]))]
+        slime = VMobject(color=GREEN_C, fill_color=GREEN_C, fill_opacity=0.6, stroke_width=2)
+
+        def pose(_mob=None):
+            position = particles.position
+            for thread, rows in zip(threads, [*grid, *grid.T]):
+                thread.set_points_as_corners(to_scene(position[rows]))
+            slime.set_points_as_corners(to_scene(position[np.append(edge, edge[0])]))
+
+        def advance(_mob, dt):
+            world.step(dt, DT, max_steps=20)
+            pose()
+
+        pose()
+        self.play(Create(threads), FadeIn(slime))
+        slime.add_updater(advance)
+        self.wait(6.0)
+        slime.remove_updater(advance)
+        self.wait(1.0)
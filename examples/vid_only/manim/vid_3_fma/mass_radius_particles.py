@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from scene_utils.point_cloud import ParticleCloud, color_by_inertia, rotate_about_com, sample_disc
+
+
+class MassRadiusParticleSum(Scene):
+    def construct(self):
+        disc_radius = 2.4
+        total_mass = 1.0
+        analytic_inertia = 0.5 * total_mass * disc_radius**2
+
+        # Title
+        title = MathTex(r"I = \sum m r^2", font_size=60).to_edge(UP)
+        self.play(Write(title))
+
+        # Readouts on the right
+        count_label = Text("particles:", font_size=30)
+        count_value = Integer(0, font_size=36, group_with_commas=True)
+        sum_label = MathTex(r"\sum m r^2 =", font_size=40)
+        sum_value = DecimalNumber(0, num_decimal_places=4, font_size=40)
+        target_label = MathTex(r"\tfrac{1}{2} M R^2 =", font_size=40)
+        target_value = DecimalNumber(analytic_inertia, num_decimal_places=4, font_size=40, color=GREEN)
+        error_label = Text("error:", font_size=30)
+        error_value = DecimalNumber(0, num_decimal_places=2, unit=r"\%", font_size=36)
+
+        rows = VGroup(
+            VGroup(count_label, count_value).arrange(RIGHT, buff=0.2),
+            VGroup(sum_label, sum_value).arrange(RIGHT, buff=0.2),
+            VGroup(target_label, target_value).arrange(RIGHT, buff=0.2),
+            VGroup(error_label, error_value).arrange(RIGHT, buff=0.2),
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.4)
+        rows.move_to(RIGHT * 3.3)
+
+        outline = Circle(radius=disc_radius, color=GRAY, stroke_width=2).move_to(LEFT * 3)
+        self.play(Create(outline), FadeIn(rows))
+
+        cloud = None
+        for count in [100, 1_000, 10_000, 100_000]:
+            positions, masses = sample_disc(count, disc_radius, total_mass, seed=count)
+            new_cloud = ParticleCloud(
+                positions,
+                masses=masses,
+                radii=max(0.012, 0.6 * disc_radius / np.sqrt(count)),
+                canvas_width=2 * disc_radius + 0.3,
+                canvas_height=2 * disc_radius + 0.3,
+            ).move_to(outline)
+            color_by_inertia()(new_cloud)
+            new_cloud.add_updater(rotate_about_com(0.6))
+
+            inertia = new_cloud.moment_of_inertia()
+            error_pct = 100 * abs(inertia - analytic_inertia) / analytic_inertia
+
+            animations = [
+                FadeIn(new_cloud),
+                count_value.animate.set_value(count),
+                sum_value.animate.set_value(inertia),
+                error_value.animate.set_value(error_pct),
+            ]
+            if cloud is not None:
+                animations.append(FadeOut(cloud))
+            self.play(*animations, run_time=1.2)
+            cloud = new_cloud
+            self.wait(1.5)
+
+        note = Text("More particles: the sum converges to the rigid-body inertia", font_size=28)
+        note.to_edge(DOWN)
+        self.play(FadeIn(note), Indicate(target_value))
+        self.wait(3.0)
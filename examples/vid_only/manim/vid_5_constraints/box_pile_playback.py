@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+MANIM_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(MANIM_DIR))
+from scene_utils.playback import TrajectoryPlayback
+from simple_phys.trajectory import TrajectoryFile, record_trajectory
+from simple_phys.tuning import AccuracyBudget, StepSettings, tuned_settings
+from simple_phys.world import PhysWorld
+
+DURATION = 6.0
+BOXES = 60
+# Boxes spawn overlapping and land from up to 27 m, so the first half second is left out
+BUDGET = AccuracyBudget(max_penetration=0.15, settle_time=0.5)
+
+
+def pile() -> PhysWorld:
+    rng = np.random.default_rng(3)
+    world = PhysWorld()
+    world.add_box(0, -0.5, 14, 1, is_static=True)
+    for i in range(BOXES):
+        x, y = rng.uniform(-3, 3), 1 + i * 0.45
+        if i % 3 == 2:
+            world.add_capsule(x, y, rng.uniform(0.5, 1.0), 0.2, 0.2)
+        else:
+            world.add_box(x, y, *rng.uniform(0.4, 0.9, 2))
+    world.bodies.angle = rng.uniform(0, TAU, len(world.bodies))
+    world.bodies.angle[0] = 0.0
+    return world
+
+
+def baked_pile(cache_dir: Path) -> tuple[TrajectoryFile, StepSettings]:
+    """Boxes and capsules dropped onto the ground, baked once to a float32 trajectory file.
+
+    The step settings come from the scene's tuned profile (see tuning.py),
+    searched for on the first render and reused after that.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    world = pile()
+    name = f"box_pile_{BOXES}_{DURATION:g}s"
+    settings = tuned_settings(
+        world, cache_dir / f"{name}.profile.json", DURATION, BUDGET, cache_path=cache_dir / f"{name}.rollouts.json"
+    )
+    warm = "warm" if settings.warm_starting else "cold"
+    path = cache_dir / f"{name}_{1 / settings.dt:g}hz_{settings.iterations}_{settings.mode}_{warm}.traj"
+    if path.exists():
+        return TrajectoryFile(path), settings
+
+    settings.apply(world)
+    # Write to a temporary name so a half-baked file is never picked up as the cache
+    partial = path.with_suffix(".partial")
+    record_trajectory(world, partial, DURATION, settings.dt, dtype=np.float32)
+    partial.rename(path)
+    return TrajectoryFile(path), settings
+
+
+class BoxPilePlayback(Scene):
+    def construct(self):
+        trajectory, settings = baked_pile(MANIM_DIR / "media" / "cache")
+
+        title = Text("A baked pile, played back from a memory-mapped file", font_size=34).to_edge(UP)
+        info = Text(
+            f"{trajectory.body_count} bodies × {len(trajectory)} steps at {1 / settings.dt:g} Hz"
+            f" ({settings.iterations} {settings.mode} iterations, tuned), rendered at {config.frame_rate:g} fps",
+            font_size=22,
+            color=GRAY,
+        ).next_to(title, DOWN, buff=0.2)
+        self.play(FadeIn(title), FadeIn(info))
+
+        pile = TrajectoryPlayback(trajectory, origin=DOWN * 3.2, scale=0.5)
+        self.play(FadeIn(pile))
+        pile.play()
+        self.wait(pile.duration)
+        pile.pause()
+
+        # Same file again in slow motion: frames now land between simulation steps
+        slow = Text("¼ speed", font_size=28, color=YELLOW).to_corner(UR, buff=0.6).shift(DOWN * 0.8)
+        pile.seek(0.0)
+        pile.speed = 0.25
+        self.play(FadeIn(slow))
+        pile.play()
+        self.wait(2.0 / pile.speed)
+        pile.pause()
+        self.wait(1.0)
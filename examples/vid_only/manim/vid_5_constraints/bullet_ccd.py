@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from scene_utils.playback import TrajectoryPlayback
+from simple_phys.stream import SimulationStream
+from simple_phys.world import PhysWorld
+
+SECONDS = 1.5
+SPEED = 0.25  # simulation seconds per scene second, slow enough to see the hits
+WALL_X, THICKNESS = 4.0, 0.05
+PANELS = [
+    # label, dt, bullets, colour
+    ("1/240, no CCD", 1 / 240, False, GRAY),
+    ("1/60, no CCD", 1 / 60, False, RED),
+    ("1/60, CCD", 1 / 60, True, GREEN),
+]
+
+
+def firing_range(bullets: bool, seed: int = 3) -> PhysWorld:
+    """A thin wall over a thin floor, and a volley of balls and boxes at 25-60 m/s that ignore each other."""
+    rng = np.random.default_rng(seed)
+    world = PhysWorld()
+    world.add_box(WALL_X, 0.5, THICKNESS, 3.0, is_static=True)
+    world.add_box(WALL_X - 6.0, -1.0, 12.0, THICKNESS, is_static=True)
+    for k in range(10):
+        y, size = rng.uniform(-0.5, 1.5), rng.uniform(0.06, 0.12)
+        body = world.add_circle(0.0, y, size) if k % 2 else world.add_box(0.0, y, 2 * size, size)
+        speed, aim = rng.uniform(25.0, 60.0), rng.uniform(-0.3, 0.05)
+        world.bodies.velocity[body] = speed * np.cos(aim), speed * np.sin(aim)
+        world.bodies.angular_velocity[body] = rng.uniform(-8.0, 8.0)
+        world.bodies.collision_mask[body] = 0b10
+        world.bodies.collision_mask_ignore[body] = 0b10
+        world.bodies.is_bullet[body] = bullets
+    return world
+
+
+def tunnelled(bullets: bool, dt: float) -> int:
+    world = firing_range(bullets)
+    for _ in range(round(SECONDS / dt)):
+        world.step(dt, dt)
+    dynamic = ~world.bodies.is_static
+    position = world.bodies.position[dynamic]
+    return int(((position[:, 0] > WALL_X) | (position[:, 1] < -1.0)).sum())
+
+
+class BulletCCD(Scene):
+    def construct(self):
+        title = Text("Fast bodies against a 5 cm wall", font_size=36).to_edge(UP)
+        self.play(FadeIn(title))
+
+        playbacks, labels = [], VGroup()
+        for row, (label, dt, bullets, colour) in enumerate(PANELS):
+            origin = UP * (1.5 - 2.3 * row) + LEFT * 2.5
+            stream = SimulationStream(firing_range(bullets), dt, duration=SECONDS)
+            playback = TrajectoryPlayback(stream, origin=origin, scale=0.6, speed=SPEED, colors=(colour,))
+            playbacks.append(playback)
+            labels.add(
+                Text(f"{label}: {tunnelled(bullets, dt)} of 10 through", font_size=22, color=colour)
+                .next_to(origin + RIGHT * 2.6 + UP * 0.3, RIGHT, buff=0.3)
+            )
+        self.play(*[FadeIn(p) for p in playbacks], FadeIn(labels))
+
+        for playback in playbacks:
+            playback.play()
+        self.wait(SECONDS / SPEED)
+        for playback in playbacks:
+            playback.pause()
+        self.wait(2)
@@ -1,5 +1,12 @@
+import sys
+from pathlib import Path
+
+import numpy as np
 from manim import *
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from simple_phys.effective_mass import axis_effective_mass, point_mass_matrix
+
 
 class CdotNormalDerivation(Scene):
     def construct(self):
@@ -280,3 +287,30 @@ class CdotNormalDerivation(Scene):
         self.play(Create(box))
         self.wait(2.0)
 
+        # Live numbers for a sample contact point while the normal sweeps around
+        rA, rB = np.array([[0.6, -0.4]]), np.array([[-0.5, 0.3]])
+        masses = (np.array([0.5]), np.array([1 / 3]), np.array([1.2]), np.array([0.8]))  # mA, mB, iA, iB
+        K = point_mass_matrix(rA, rB, *masses)[0]
+        normal_angle = ValueTracker(0.0)
+
+        def sample_normal():
+            theta = normal_angle.get_value()
+            return np.array([[np.cos(theta), np.sin(theta)]])
+
+        k_label = MathTex(r"n^{T} K n =", font_size=34)
+        k_value = DecimalNumber(0, num_decimal_places=4, font_size=34)
+        k_value.add_updater(lambda d: d.set_value(float(sample_normal()[0] @ K @ sample_normal()[0])))
+        formula_label = MathTex(r"mA + mB + iA (rA \times n)^{2} + iB (rB \times n)^{2} =", font_size=34)
+        formula_value = DecimalNumber(0, num_decimal_places=4, font_size=34, color=GREEN)
+        formula_value.add_updater(lambda d: d.set_value(float(axis_effective_mass(rA, rB, sample_normal(), *masses)[0])))
+
+        readout = VGroup(
+            VGroup(k_label, k_value).arrange(RIGHT, buff=0.2),
+            VGroup(formula_label, formula_value).arrange(RIGHT, buff=0.2),
+        ).arrange(DOWN, aligned_edge=RIGHT, buff=0.25)
+        readout.move_to(DOWN * 2.4)
+
+        self.play(FadeIn(readout))
+        self.play(normal_angle.animate.set_value(TAU), run_time=4.0, rate_func=linear)
+        self.wait(2.0)
+
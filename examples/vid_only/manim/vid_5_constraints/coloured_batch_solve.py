@@ -0,0 +1,124 @@
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from simple_phys.bodies import rotate
+from simple_phys.coloured import colour_constraints, solve_coloured
+from simple_phys.constraints import solve_sequential
+from simple_phys.world import PhysWorld
+
+DT = 1 / 240
+ITERATIONS = list(range(1, 21))
+PALETTE = [BLUE_C, GREEN_C, YELLOW_C, RED_C, PURPLE_C, TEAL_C, ORANGE, PINK, GOLD_C, MAROON_C, LIGHT_BROWN, GRAY_B, BLUE_E, GREEN_E, RED_E, PURPLE_E]
+
+
+def brick_wall(columns=4, rows=3):
+    """A wall of unit boxes already touching on every side, stopped right before its first solve."""
+    world = PhysWorld()
+    world.add_box(0, -0.5, columns + 4, 1, is_static=True)
+    for row in range(rows):
+        for col in range(columns):
+            world.add_box((col - (columns - 1) / 2) * 0.999, 0.499 + row * 0.999, 1, 1)
+    world.bodies.velocity[~world.bodies.is_static] += world.gravity * DT
+    world.detect_collisions()
+    return world
+
+
+def velocity_errors(world):
+    """Max velocity error per iteration count against a 200-iteration sequential solve, per solver."""
+    def solved(solver, iterations):
+        w = copy.deepcopy(world)
+        w.solver = solver
+        w.solve_constraints(DT, iterations)
+        return np.column_stack([w.bodies.velocity, w.bodies.angular_velocity])
+
+    reference = solved(solve_sequential, 200)
+    return {
+        solver: np.array([np.abs(solved(solver, n) - reference).max() for n in ITERATIONS])
+        for solver in (solve_sequential, solve_coloured)
+    }
+
+
+class ColouredBatchSolve(Scene):
+    def construct(self):
+        world = brick_wall()
+        bodies, contacts = world.bodies, world.contacts
+        colours = colour_constraints(contacts.body_a, contacts.body_b, bodies.is_static)
+        errors = velocity_errors(world)
+
+        # Title
+        title = Text("One constraint at a time vs one colour at a time", font_size=38).to_edge(UP)
+        self.play(FadeIn(title))
+
+        # The wall, one world unit per scene unit
+        origin = DOWN * 2.6 + LEFT * 3.2
+        boxes = VGroup(*[
+            Square(side_length=0.999, stroke_color=GRAY_B, stroke_width=2, fill_color=GRAY_E, fill_opacity=0.6)
+            .move_to(origin + RIGHT * x + UP * y)
+            for x, y in bodies.position[~bodies.is_static]
+        ])
+        ground = Line(origin + LEFT * 2.8, origin + RIGHT * 2.8, color=GRAY_B, stroke_width=4)
+        points = bodies.position[contacts.body_a] + rotate(contacts.local_a, bodies.angle[contacts.body_a])
+        dots = VGroup(*[Dot(origin + RIGHT * x + UP * y, radius=0.06, color=GRAY) for x, y in points])
+        self.play(Create(ground), FadeIn(boxes), FadeIn(dots))
+
+        # Gauss-Seidel: every contact reads the velocities the previous one just wrote
+        caption = Text("Sequential: one contact after another", font_size=26).to_edge(RIGHT, buff=0.6).shift(UP * 1.2)
+        count = Text(f"{len(contacts)} steps per iteration", font_size=26, color=YELLOW).next_to(caption, DOWN, buff=0.3)
+        self.play(FadeIn(caption))
+        self.play(
+            LaggedStart(*[Flash(dot, color=WHITE, line_length=0.12, flash_radius=0.15) for dot in dots], lag_ratio=1.0),
+            run_time=5.0,
+        )
+        self.play(FadeIn(count))
+        self.wait(1.0)
+
+        # Coloured: no two contacts of a colour share a box, so each colour is one batch
+        coloured_caption = Text("Coloured: contacts sharing a box get different colours", font_size=26)
+        coloured_caption.move_to(caption, aligned_edge=LEFT)
+        batches = int(colours.max()) + 1
+        coloured_count = Text(f"{batches} batches per iteration", font_size=26, color=YELLOW).next_to(
+            coloured_caption, DOWN, buff=0.3
+        ).align_to(coloured_caption, LEFT)
+        self.play(FadeOut(caption), FadeOut(count), FadeIn(coloured_caption))
+        for colour in range(batches):
+            batch = [dot for dot, c in zip(dots, colours) if c == colour]
+            self.play(*[dot.animate.set_color(PALETTE[colour % len(PALETTE)]).scale(1.4) for dot in batch], run_time=0.5)
+        self.play(FadeIn(coloured_count))
+        self.wait(1.5)
+
+        # Both orders converge to the same impulses
+        self.play(FadeOut(VGroup(ground, boxes, dots, coloured_caption, coloured_count)))
+        low = np.floor(np.log10(min(e.min() for e in errors.values())))
+        high = np.ceil(np.log10(max(e.max() for e in errors.values())))
+        axes = Axes(
+            x_range=[0, ITERATIONS[-1], 5],
+            y_range=[low, high, 1],
+            x_length=9,
+            y_length=4.6,
+            tips=False,
+            x_axis_config={"numbers_to_include": list(range(0, ITERATIONS[-1] + 1, 5))},
+            y_axis_config={"numbers_to_include": np.arange(low, high + 1)},
+        ).shift(DOWN * 0.5)
+        x_label = Text("iterations", font_size=24).next_to(axes.x_axis, DOWN, buff=0.45)
+        y_label = MathTex(r"\log_{10} |v - v_{200}|_\infty", font_size=30).rotate(PI / 2).next_to(axes.y_axis, LEFT, buff=0.4)
+        self.play(Create(axes), FadeIn(x_label), FadeIn(y_label))
+
+        legend = VGroup()
+        for solver, color, label in [(solve_sequential, BLUE_C, "sequential"), (solve_coloured, ORANGE, "coloured batches")]:
+            curve = axes.plot_line_graph(
+                ITERATIONS, np.log10(errors[solver]), line_color=color, add_vertex_dots=False, stroke_width=4
+            )
+            self.play(Create(curve), run_time=2.0)
+            key = VGroup(Line(ORIGIN, 0.9 * RIGHT, color=color), Text(label, font_size=24)).arrange(RIGHT, buff=0.3)
+            legend.add(key)
+        legend.arrange(DOWN, aligned_edge=LEFT, buff=0.2).to_corner(UR, buff=0.5).shift(DOWN * 0.8)
+        self.play(FadeIn(legend))
+
+        note = Text("Same physics and settings, only the update order differs", font_size=24).to_edge(DOWN)
+        self.play(FadeIn(note))
+        self.wait(3.0)
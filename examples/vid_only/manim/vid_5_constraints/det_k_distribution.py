@@ -0,0 +1,109 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from simple_phys.bodies import rotate
+from simple_phys.effective_mass import point_mass_matrix
+from simple_phys.mat2x2 import mat2x2_det
+from simple_phys.world import PhysWorld
+
+
+def recorded_joint_matrices(pendulums=200, welded=4, seconds=6.0, dt=1 / 240, seed=1):
+    """K matrices of every revolute joint at every step of a PhysWorld run, shape (steps * joints, 2, 2).
+
+    The world is a row of double pendulums of random lengths and densities,
+    released from random angles: the top joint pins a link to a static body
+    (like a ragdoll's shoulder pinned to the world), the second joins two
+    dynamic links. `welded` joints hold static props to the static level;
+    with both inverse masses zero their K is all zeros, which is the
+    det(K) = 0 case mat2x2Solve guards.
+    """
+    rng = np.random.default_rng(seed)
+    world = PhysWorld()
+    for k in range(pendulums):
+        pivot = np.array([3.0 * k, 0.0])
+        first, second = rng.uniform(0.4, 1.6, 2)
+        swing = rng.uniform(-2.5, 2.5)
+        direction = np.array([np.cos(swing), np.sin(swing)])
+        pin = world.add_box(*pivot, 0.1, 0.1, is_static=True)
+        upper = world.add_box(*(pivot + 0.5 * first * direction), first, 0.1, density=rng.uniform(0.5, 3.0))
+        world.bodies.angle[upper] = swing
+        world.add_revolute_constraint(pin, upper, tuple(pivot))
+        elbow = pivot + first * direction
+        lower = world.add_box(elbow[0] + 0.5 * second, elbow[1], second, 0.1, density=rng.uniform(0.5, 3.0))
+        world.add_revolute_constraint(upper, lower, tuple(elbow))
+    for k in range(welded):
+        level = world.add_box(-3.0 * (k + 1), -2.0, 2.0, 0.2, is_static=True)
+        prop = world.add_box(-3.0 * (k + 1), -1.4, 0.4, 1.0, is_static=True)
+        world.add_revolute_constraint(level, prop, (-3.0 * (k + 1), -1.9))
+    # The links overlap at the joints, so nothing collides
+    world.bodies.collision_mask[:] = 0b10
+    world.bodies.collision_mask_ignore[:] = 0b10
+
+    joints, bodies = world.joints, world.bodies
+    a, b = joints.body_a, joints.body_b
+    matrices = []
+    for _ in range(round(seconds / dt)):
+        world.step(dt, dt)
+        rA = rotate(joints.local_a, bodies.angle[a])
+        rB = rotate(joints.local_b, bodies.angle[b])
+        matrices.append(point_mass_matrix(
+            rA, rB, bodies.inv_mass[a], bodies.inv_mass[b], bodies.inv_inertia[a], bodies.inv_inertia[b]
+        ))
+    return np.concatenate(matrices)
+
+
+class DetKDistribution(Scene):
+    def construct(self):
+        K = recorded_joint_matrices()
+        det = mat2x2_det(K)
+        guarded = int(np.count_nonzero(det == 0))
+        log_det = np.log10(det[det > 0])
+
+        counts, edges = np.histogram(log_det, bins=40)
+        density = counts / counts.sum()
+
+        # Title
+        title = Text("det(K) over a recorded PhysWorld run", font_size=44).to_edge(UP)
+        subtitle = Text(f"{len(K):,} joint matrices from double pendulums, one vectorised call", font_size=26, color=GRAY)
+        subtitle.next_to(title, DOWN, buff=0.2)
+        self.play(FadeIn(title), FadeIn(subtitle))
+
+        axes = Axes(
+            x_range=[np.floor(edges[0]), np.ceil(edges[-1]), 1],
+            y_range=[0, density.max() * 1.15, round(density.max() / 4, 3) or 0.01],
+            x_length=10,
+            y_length=4.5,
+            axis_config={"tip_length": 0.18},
+            x_axis_config={"numbers_to_include": np.arange(np.floor(edges[0]), np.ceil(edges[-1]) + 1)},
+        ).shift(DOWN * 0.6)
+        x_label = MathTex(r"\log_{10} \det(K)", font_size=34).next_to(axes.x_axis, DOWN, buff=0.45)
+        self.play(Create(axes), FadeIn(x_label))
+
+        bars = VGroup()
+        for left, right, height in zip(edges[:-1], edges[1:], density):
+            if height == 0:
+                continue
+            bars.add(Polygon(
+                axes.coords_to_point(left, 0),
+                axes.coords_to_point(right, 0),
+                axes.coords_to_point(right, height),
+                axes.coords_to_point(left, height),
+                stroke_width=1,
+                stroke_color=BLUE_E,
+                fill_color=BLUE_C,
+                fill_opacity=0.85,
+            ))
+        self.play(LaggedStart(*[GrowFromEdge(bar, DOWN) for bar in bars], lag_ratio=0.04), run_time=3.0)
+
+        # Cramer's rule only breaks down at det(K) = 0, which mat2x2Solve guards: here only the welded props
+        note = MathTex(
+            rf"\det(K) = 0 \text{{ (static to static, guarded, impulse}} = 0\text{{): }} {guarded:,}",
+            font_size=34,
+            color=YELLOW,
+        ).next_to(axes, UP, buff=0.1).align_to(axes, RIGHT)
+        self.play(Write(note))
+        self.wait(3)
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from simple_phys.fabrik import solve_fabrik
+
+SEGMENTS = range(2, 9)
+PER_LENGTH = 1_000
+LIMIT = np.radians(60)
+MAX_ITERATIONS = 15
+
+
+def random_chains(seed=0):
+    """PER_LENGTH random chains of each length in SEGMENTS, padded to one batch with zero-length segments.
+
+    Targets fall anywhere within 1.05 × the chain's reach, so a few are out of
+    reach and come back with 0 iterations, stretched straight.
+    """
+    rng = np.random.default_rng(seed)
+    segments = np.repeat(list(SEGMENTS), PER_LENGTH)
+    count, longest = len(segments), max(SEGMENTS)
+    lengths = rng.uniform(0.5, 1.5, (count, longest)) * (np.arange(longest) < segments[:, None])
+    angles = np.cumsum(rng.uniform(-0.6, 0.6, (count, longest)), axis=1)
+    steps = lengths[..., None] * np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    points = np.concatenate([np.zeros((count, 1, 2)), np.cumsum(steps, axis=1)], axis=1)
+    reach = lengths.sum(axis=1) * np.sqrt(rng.uniform(0, 1.05, count))
+    heading = rng.uniform(-np.pi, np.pi, count)
+    targets = reach[:, None] * np.column_stack([np.cos(heading), np.sin(heading)])
+    return segments, points, targets
+
+
+class FabrikConvergence(Scene):
+    def construct(self):
+        segments, points, targets = random_chains()
+        free = solve_fabrik(points, targets, max_iterations=MAX_ITERATIONS)
+        limited = solve_fabrik(points, targets, -LIMIT, LIMIT, max_iterations=MAX_ITERATIONS, mirror=True)
+
+        title = Text("FABRIK, thousands of chains per call", font_size=40).to_edge(UP)
+        subtitle = Text(
+            f"{len(points):,} random chains of {SEGMENTS[0]}–{SEGMENTS[-1]} segments, tolerance 0.01",
+            font_size=24,
+            color=GRAY,
+        ).next_to(title, DOWN, buff=0.2)
+        self.play(FadeIn(title), FadeIn(subtitle))
+
+        # A handful of the solved 5-segment chains, free on the left of the origin, limited on the right
+        sample = np.flatnonzero((segments == 5) & free.reachable)[:12]
+        scale = 0.32
+
+        def chains(result, colour, shift):
+            group = VGroup()
+            for k in sample:
+                corners = np.column_stack([scale * result.points[k, :6], np.zeros(6)]) + shift
+                group.add(VMobject(stroke_width=2, color=colour).set_points_as_corners(corners))
+                group.add(Dot(corners[0], radius=0.03, color=GRAY))
+                group.add(Dot(np.append(scale * targets[k], 0) + shift, radius=0.035, color=YELLOW))
+            return group
+
+        left = LEFT * 4.2 + DOWN * 0.6
+        free_chains = chains(free, BLUE_C, left + LEFT * 1.3)
+        limited_chains = chains(limited, ORANGE, left + RIGHT * 1.3)
+        labels = VGroup(
+            Text("free", font_size=22, color=BLUE_C).move_to(left + LEFT * 1.3 + UP * 2.2),
+            Text("±60° limits", font_size=22, color=ORANGE).move_to(left + RIGHT * 1.3 + UP * 2.2),
+        )
+        self.play(Create(free_chains), Create(limited_chains), FadeIn(labels), run_time=2.5)
+
+        # Mean iteration count against chain length
+        axes = Axes(
+            x_range=[SEGMENTS[0] - 0.5, SEGMENTS[-1] + 0.5, 1],
+            y_range=[0, MAX_ITERATIONS, 5],
+            x_length=5.5,
+            y_length=3.8,
+            axis_config={"tip_length": 0.15, "include_numbers": True, "font_size": 22},
+        ).shift(RIGHT * 3.4 + DOWN * 0.9)
+        x_label = Text("segments", font_size=22).next_to(axes.x_axis, DOWN, buff=0.4)
+        y_label = Text("mean iterations", font_size=22).rotate(PI / 2).next_to(axes.y_axis, LEFT, buff=0.4)
+        self.play(Create(axes), FadeIn(x_label), FadeIn(y_label))
+
+        graphs = VGroup()
+        for result, colour in [(free, BLUE_C), (limited, ORANGE)]:
+            mean = [result.iterations[segments == n].mean() for n in SEGMENTS]
+            corners = [axes.coords_to_point(n, m) for n, m in zip(SEGMENTS, mean)]
+            graphs.add(VMobject(color=colour, stroke_width=3).set_points_as_corners(corners))
+            graphs.add(*[Dot(c, radius=0.05, color=colour) for c in corners])
+        self.play(Create(graphs), run_time=2.0)
+
+        rates = VGroup(*[
+            Text(f"{name}: {result.converged.mean():.1%} converged", font_size=22, color=colour)
+            for name, result, colour in [("free", free, BLUE_C), ("limited", limited, ORANGE)]
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.15).next_to(axes, UP, buff=0.2)
+        self.play(FadeIn(rates))
+        self.wait(3)
@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from scene_utils.playback import TrajectoryPlayback
+from simple_phys.stream import SimulationStream
+from simple_phys.world import PhysWorld
+
+DT = 1 / 240
+SECONDS = 90.0
+BOXES = 80
+
+
+def tumbling_pile(seed=5):
+    """Boxes rained into a walled bowl of static ramps, left to settle with sleeping on."""
+    rng = np.random.default_rng(seed)
+    world = PhysWorld()
+    world.add_box(0, -0.5, 18, 1, is_static=True)
+    for x in (-8.5, 8.5):
+        world.add_box(x, 2.5, 1, 5, is_static=True)
+    for x, angle in [(-6.5, -0.5), (6.5, 0.5)]:
+        ramp = world.add_box(x, 1.2, 5, 0.4, is_static=True)
+        world.bodies.angle[ramp] = angle
+    for i in range(BOXES):
+        world.add_box(rng.uniform(-5, 5), 2 + i * 0.5, *rng.uniform(0.4, 1.0, 2))
+    world.sleep.enabled = True
+    return world
+
+
+class SettlingPileStream(Scene):
+    def construct(self):
+        stream = SimulationStream(tumbling_pile(), DT, duration=SECONDS)
+
+        title = Text("A pile settling for 90 s, simulated as it renders", font_size=34).to_edge(UP)
+        self.play(FadeIn(title))
+
+        pile = TrajectoryPlayback(stream, origin=DOWN * 3.3, scale=0.42)
+        clock = VGroup(Text("t =", font_size=26), DecimalNumber(0, num_decimal_places=1, font_size=30), Text("s", font_size=26))
+        clock.arrange(RIGHT, buff=0.15).to_corner(UR, buff=0.6).shift(DOWN * 0.7)
+        asleep = Text("", font_size=22, color=GRAY)
+
+        def update_clock(group):
+            group[1].set_value(pile.time)
+
+        def update_asleep(label):
+            bodies = stream.world.bodies
+            dynamic = ~bodies.is_static
+            fraction = float((~bodies.awake[dynamic]).mean())
+            label.become(Text(f"{fraction:.0%} asleep", font_size=22, color=GRAY).next_to(clock, DOWN, buff=0.2))
+
+        clock.add_updater(update_clock)
+        asleep.add_updater(update_asleep)
+        self.play(FadeIn(pile), FadeIn(clock))
+        self.add(asleep)
+
+        # Only the look-ahead window and a few checkpoints are ever held, however long this runs
+        pile.play()
+        self.wait(pile.duration)
+        pile.pause()
+        self.wait(1.0)
@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from manim import *
+
+MANIM_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(MANIM_DIR))
+from simple_phys.soft import StabilityGrid, load_or_compute_stability_map
+
+# PhysWorld.constraintSettings defaults
+CONTACT_SOFT = (30.0, 10.0)
+JOINT_SOFT = (60.0, 0.0)
+
+HEAT_COLORS = [BLUE_E, TEAL, YELLOW, ORANGE, RED]
+
+
+def heat_image(values, low, high, log=False):
+    """(hertz, damping) array -> RGB pixels with damping going up and hertz to the right."""
+    values = np.asarray(values, dtype=np.float64)
+    values = np.where(np.isfinite(values), values, high)
+    if log:
+        values, low, high = np.log10(np.maximum(values, low)), np.log10(low), np.log10(high)
+    t = np.clip((values - low) / (high - low), 0, 1)
+    stops = np.linspace(0, 1, len(HEAT_COLORS))
+    rgbs = np.array([color_to_rgb(c) for c in HEAT_COLORS]) * 255
+    pixels = np.stack([np.interp(t, stops, rgbs[:, ch]) for ch in range(3)], axis=-1)
+    image = ImageMobject(pixels.transpose(1, 0, 2)[::-1].astype(np.uint8))
+    image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+    return image
+
+
+class SoftStabilityMap(Scene):
+    def construct(self):
+        grid = StabilityGrid(
+            hertz=list(np.geomspace(1, 240, 120)),
+            damping_ratio=list(np.linspace(0, 12, 80)),
+            dt=[1 / 60, 1 / 120, 1 / 240],
+        )
+        cache_dir = MANIM_DIR / "media" / "cache"
+        joint = load_or_compute_stability_map(grid, "joint", cache_dir)
+        contact = load_or_compute_stability_map(grid, "contact", cache_dir)
+
+        # Title
+        title = Text("Soft constraints: hertz × damping ratio", font_size=40).to_edge(UP)
+        self.play(FadeIn(title))
+
+        panels = []
+        for label, center, default in [
+            ("Joint: step spectral radius", LEFT * 3.4, JOINT_SOFT),
+            ("Contact: pop-out overshoot", RIGHT * 3.4, CONTACT_SOFT),
+        ]:
+            axes = Axes(
+                x_range=[0, np.log10(240), 1],
+                y_range=[0, 12, 2],
+                x_length=5.4,
+                y_length=4.2,
+                tips=False,
+                y_axis_config={"numbers_to_include": [0, 4, 8, 12]},
+            ).move_to(center + DOWN * 0.4)
+            x_ticks = VGroup(*[
+                MathTex(str(hz), font_size=24).next_to(axes.coords_to_point(np.log10(hz), 0), DOWN, buff=0.15)
+                for hz in [1, 10, 100]
+            ])
+            x_label = Text("hertz", font_size=22).next_to(axes.x_axis, DOWN, buff=0.45)
+            y_label = Text("damping ratio", font_size=22).rotate(PI / 2).next_to(axes.y_axis, LEFT, buff=0.45)
+            heading = Text(label, font_size=26).next_to(axes, UP, buff=0.25)
+            marker = Dot(axes.coords_to_point(np.log10(default[0]), default[1]), color=WHITE, radius=0.07)
+            marker_label = Text("default", font_size=18).next_to(marker, UR, buff=0.05)
+            panels.append((axes, VGroup(x_ticks, x_label, y_label, heading), VGroup(marker, marker_label)))
+
+        dt_label = None
+        images = None
+        for i, dt in enumerate(grid.dt):
+            new_images = Group(
+                heat_image(joint["spectral_radius"][i], 0.3, 1.0),
+                heat_image(contact["overshoot"][i], 0.01, 10.0, log=True),
+            )
+            for image, (axes, _, _) in zip(new_images, panels):
+                image.stretch_to_fit_width(axes.x_length).stretch_to_fit_height(axes.y_length)
+                image.move_to(axes.coords_to_point(np.log10(240) / 2, 6))
+            new_dt_label = MathTex(rf"dt = 1/{round(1 / dt)}", font_size=36).to_edge(DOWN)
+
+            if images is None:
+                dt_label = new_dt_label
+                self.play(
+                    FadeIn(new_images),
+                    *[FadeIn(VGroup(axes, decor)) for axes, decor, _ in panels],
+                    FadeIn(dt_label),
+                )
+                self.play(*[FadeIn(markers) for _, _, markers in panels])
+            else:
+                self.play(FadeOut(images), FadeIn(new_images), Transform(dt_label, new_dt_label), run_time=1.0)
+                # Keep the default markers on top of the new heatmaps
+                self.bring_to_front(*[markers for _, _, markers in panels])
+            images = new_images
+            self.wait(2.0)
+
+        note = Text("Blue: settles quickly.  Red: rings or pops out of contact.", font_size=24)
+        note.next_to(dt_label, UP, buff=0.2)
+        self.play(FadeIn(note))
+        self.wait(3.0)